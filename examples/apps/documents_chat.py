@@ -30,15 +30,7 @@ class QueryWithContext(BaseModel):
     context: list[str]
 
 
-class ChatAnswer(BaseModel):
-    """
-    Output format for the ChatAnswer.
-    """
-
-    answer: str
-
-
-class RAGPrompt(Prompt[QueryWithContext, ChatAnswer]):
+class RAGPrompt(Prompt[QueryWithContext, str]):
     """
     A simple prompt for RAG system.
     """
@@ -93,7 +85,7 @@ class RAGSystemWithUI:
         self._chatbot_height_vh = chatbot_height_vh
         self._documents_ingested = False
         self._prepare_document_search(self._database_path, self._index_name)
-        self._llm = LiteLLM(model_name, use_structured_output=True)
+        self._llm = LiteLLM(model_name)
 
     def _prepare_document_search(self, database_path: str, index_name: str) -> None:
         embedder = LiteLLMEmbeddings()
@@ -126,8 +118,10 @@ class RAGSystemWithUI:
             yield self.NO_DOCUMENTS_INGESTED_MESSAGE
         results = await self.document_search.search(message[-1])
         prompt = RAGPrompt(QueryWithContext(query=message, context=[i.get_key() for i in results]))
-        response = await self._llm.generate(prompt)
-        yield response.answer
+        response = ""
+        async for chunk in self._llm.generate_streaming(prompt):
+            response += chunk
+            yield response
 
     def prepare_layout(self) -> gr.Blocks:
         """
@@ -0,0 +1,60 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#     "ragbits-core",
+# ]
+# ///
+import asyncio
+import time
+
+import numpy as np
+
+from ragbits.core.vector_stores import InMemoryVectorStore, InMemoryVectorStoreOptions
+from ragbits.core.vector_stores.base import VectorStoreEntry
+
+SIZE = 100_000
+DIM = 128
+QUERIES = 100
+K = 10
+
+
+async def main() -> None:
+    """
+    Compares the recall and the latency of the "ivf" index of the in-memory vector store against the exact search.
+    """
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(1000, DIM))
+    vectors = centers[rng.integers(0, len(centers), SIZE)] + rng.normal(scale=0.3, size=(SIZE, DIM))
+    queries = (centers[rng.integers(0, len(centers), QUERIES)] + rng.normal(scale=0.3, size=(QUERIES, DIM))).tolist()
+    entries = [VectorStoreEntry(key=str(i), vector=vector.tolist(), metadata={}) for i, vector in enumerate(vectors)]
+
+    exact = InMemoryVectorStore()
+    await exact.store(entries)
+    start = time.perf_counter()
+    expected = [await exact.retrieve(query, InMemoryVectorStoreOptions(k=K)) for query in queries]
+    exact_latency = (time.perf_counter() - start) / QUERIES
+    print(f"exact: recall@{K} 1.000, {exact_latency * 1000:.2f} ms/query")
+
+    ivf = InMemoryVectorStore(index="ivf")
+    await ivf.store(entries)
+    start = time.perf_counter()
+    await ivf.retrieve(queries[0])
+    print(f"ivf: trained in {time.perf_counter() - start:.2f} s")
+
+    for n_probe in (1, 4, 8, 16, 32):
+        options = InMemoryVectorStoreOptions(k=K, n_probe=n_probe)
+        start = time.perf_counter()
+        results = [await ivf.retrieve(query, options) for query in queries]
+        latency = (time.perf_counter() - start) / QUERIES
+        found = sum(
+            len({entry.key for entry in result} & {entry.key for entry in exact_result})
+            for result, exact_result in zip(results, expected, strict=True)
+        )
+        print(
+            f"ivf n_probe={n_probe}: recall@{K} {found / (K * QUERIES):.3f}, {latency * 1000:.2f} ms/query "
+            f"({exact_latency / latency:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
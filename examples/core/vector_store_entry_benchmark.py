@@ -0,0 +1,44 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#     "ragbits-core[chroma]",
+# ]
+# ///
+import timeit
+
+import numpy as np
+
+from ragbits.core.vector_stores.base import VectorStoreEntry
+
+ENTRIES = 1000
+DIM = 1536
+
+
+def main() -> None:
+    """
+    Compares the per-entry overhead of creating the vector store entries from the embeddings returned
+    by a vector database, with the validation of every element of the vector and without it.
+    """
+    rng = np.random.default_rng(0)
+    embeddings = list(rng.random((ENTRIES, DIM), dtype=np.float32))
+    metadata = {"content": "Lorem ipsum", "document_meta": {"document_type": "txt"}}
+
+    def validated() -> list[VectorStoreEntry]:
+        return [
+            VectorStoreEntry(key=str(i), vector=list(embedding), metadata=metadata)
+            for i, embedding in enumerate(embeddings)
+        ]
+
+    def constructed() -> list[VectorStoreEntry]:
+        return [
+            VectorStoreEntry.model_construct(key=str(i), vector=embedding.tolist(), metadata=metadata)
+            for i, embedding in enumerate(embeddings)
+        ]
+
+    for name, function in (("validated (before)", validated), ("constructed (after)", constructed)):
+        seconds = min(timeit.repeat(function, number=1, repeat=5))
+        print(f"{name}: {seconds / ENTRIES * 1e6:.1f} us/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,7 +39,9 @@ async def main() -> None:
         vector_store=vector_store,
     )
 
-    await document_search.ingest(documents)
+    result = await document_search.ingest(documents)
+    for document, error in result.failed:
+        print(f"Failed to ingest {document}: {error}")
 
     all_documents = await vector_store.list()
 
@@ -46,9 +46,11 @@ async def ingest(config: DictConfig) -> None:
         desc="Download",
     )
 
-    await document_search.ingest(documents)
+    result = await document_search.ingest(documents)
+    for document, error in result.failed:
+        log.error("Failed to ingest %s: %s", document, error)
 
-    log.info("Ingestion finished.")
+    log.info("Ingestion finished: %d ingested, %d failed.", len(result.successful), len(result.failed))
 
 
 @hydra.main(config_path="config", config_name="ingestion", version_base="3.2")
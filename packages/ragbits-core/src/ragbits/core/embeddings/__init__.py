@@ -3,9 +3,10 @@ import sys
 from ragbits.core.utils.config_handling import get_cls_from_config
 
 from .base import Embeddings
+from .cached import CachedEmbeddings
 from .noop import NoopEmbeddings
 
-__all__ = ["Embeddings", "NoopEmbeddings"]
+__all__ = ["CachedEmbeddings", "Embeddings", "NoopEmbeddings"]
 
 module = sys.modules[__name__]
 
@@ -13,6 +14,8 @@ module = sys.modules[__name__]
 def get_embeddings(embedder_config: dict) -> Embeddings:
     """
     Initializes and returns an Embeddings object based on the provided embedder configuration.
+    If the configuration contains a "cache" key, the embeddings are wrapped in CachedEmbeddings
+    initialized with its value.
 
     Args:
         embedder_config : A dictionary containing configuration details for the embedder.
@@ -24,5 +27,9 @@ def get_embeddings(embedder_config: dict) -> Embeddings:
     embeddings_type = embedder_config["type"]
     config = embedder_config.get("config", {})
 
-    embbedings = get_cls_from_config(embeddings_type, module)
-    return embbedings(**config)
+    embbedings = get_cls_from_config(embeddings_type, module)(**config)
+
+    cache_config = embedder_config.get("cache")
+    if cache_config is not None:
+        return CachedEmbeddings(embbedings, **cache_config)
+    return embbedings
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import sqlite3
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from hashlib import sha256
+from pathlib import Path
+
+from ragbits.core.embeddings.base import Embeddings
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Wrapper caching the embeddings created by another Embeddings implementation.
+
+    The embeddings are keyed by the model configuration and the SHA-256 of the text. They are kept in an in-memory
+    LRU cache and, optionally, in an SQLite database on disk, so that only the texts missing from both tiers are
+    sent to the underlying model. The SQLite queries run in a dedicated worker thread, so they don't block
+    the event loop.
+
+    The texts being embedded are deduplicated across the concurrent calls, so that each of them is sent
+    to the underlying model once and the other calls wait for its embedding.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_size: int = 10_000,
+        path: str | Path | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        """
+        Constructs a new CachedEmbeddings instance.
+
+        Args:
+            embeddings: The embeddings whose results should be cached.
+            max_size: The maximum number of embeddings kept in memory.
+            path: The path to the SQLite database used as the persistent cache. If not specified, the embeddings
+                are cached only in memory.
+            namespace: The identifier of the model configuration, used to separate embeddings of different models
+                in the cache. If not specified, it's built from the class, model name and options of the embeddings.
+        """
+        super().__init__()
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.path = Path(path) if path is not None else None
+        self.namespace = namespace or self._default_namespace(embeddings)
+
+        self._namespace_hash = sha256(self.namespace.encode("utf-8")).hexdigest()
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future[dict[str, list[float]]]] = {}
+        self._connection: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        if self.path is not None:
+            # The connection is used only by the single worker thread, one query at a time
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ragbits-embeddings-cache")
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+
+    async def embed_text(self, data: list[str]) -> list[list[float]]:
+        """
+        Creates embeddings for the given strings, using the cached ones when available.
+
+        Args:
+            data: List of strings to get embeddings for.
+
+        Returns:
+            List of embeddings for the given strings.
+        """
+        keys = [self._key(text) for text in data]
+        found = {key: vector for key in dict.fromkeys(keys) if (vector := self._get_from_memory(key)) is not None}
+
+        # The texts already being embedded by the concurrent calls are awaited instead of being embedded again
+        in_flight = {
+            key: self._in_flight[key] for key in dict.fromkeys(keys) if key not in found and key in self._in_flight
+        }
+        missing = {key: text for key, text in zip(keys, data, strict=True) if key not in found and key not in in_flight}
+        if missing:
+            lookup = asyncio.ensure_future(self._load_or_embed(missing))
+            for key in missing:
+                self._in_flight[key] = lookup
+            lookup.add_done_callback(partial(self._remove_in_flight, list(missing)))
+            in_flight.update(dict.fromkeys(missing, lookup))
+
+        for pending in set(in_flight.values()):
+            # The lookup is shielded, so that cancelling this call doesn't cancel the calls waiting for it
+            vectors = await asyncio.shield(pending)
+            found.update({key: vectors[key] for key, key_lookup in in_flight.items() if key_lookup is pending})
+
+        for key, vector in found.items():
+            self._store_in_memory(key, vector)
+
+        return [found[key] for key in keys]
+
+    async def _load_or_embed(self, texts: dict[str, str]) -> dict[str, list[float]]:
+        """
+        Loads the embeddings from the disk cache, embedding and storing the ones missing from it.
+
+        Args:
+            texts: The texts to embed, by their keys.
+
+        Returns:
+            The embeddings, by the keys of the texts.
+        """
+        loop = asyncio.get_running_loop()
+        found = await loop.run_in_executor(self._executor, self._get_from_disk, list(texts)) if self._executor else {}
+
+        missing = {key: text for key, text in texts.items() if key not in found}
+        if missing:
+            vectors = await self.embeddings.embed_text(list(missing.values()))
+            computed = dict(zip(missing, vectors, strict=True))
+            if self._executor is not None:
+                await loop.run_in_executor(self._executor, self._store_on_disk, computed)
+            found.update(computed)
+        return found
+
+    def _remove_in_flight(self, keys: list[str], lookup: asyncio.Future) -> None:
+        for key in keys:
+            if self._in_flight.get(key) is lookup:
+                del self._in_flight[key]
+
+    def _key(self, text: str) -> str:
+        return f"{self._namespace_hash}:{sha256(text.encode('utf-8')).hexdigest()}"
+
+    def _get_from_memory(self, key: str) -> list[float] | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+        return vector
+
+    def _store_in_memory(self, key: str, vector: list[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def _get_from_disk(self, keys: list[str]) -> dict[str, list[float]]:
+        if self._connection is None:
+            return {}
+        vectors = {}
+        # Older SQLite versions allow at most 999 parameters per query
+        for start in range(0, len(keys), 999):
+            batch = keys[start : start + 999]
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._connection.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                batch,
+            ).fetchall()
+            vectors.update({key: array("d", vector).tolist() for key, vector in rows})
+        return vectors
+
+    def _store_on_disk(self, vectors: dict[str, list[float]]) -> None:
+        if self._connection is None:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("d", vector).tobytes()) for key, vector in vectors.items()],
+            )
+
+    @staticmethod
+    def _default_namespace(embeddings: Embeddings) -> str:
+        # Some implementations keep the loaded model object under `model`, only a name identifies the checkpoint
+        model = getattr(embeddings, "model_name", None)
+        if not isinstance(model, str):
+            model = getattr(embeddings, "model", None)
+        return json.dumps(
+            {
+                "type": type(embeddings).__qualname__,
+                "model": model if isinstance(model, str) else None,
+                "options": getattr(embeddings, "options", None),
+            },
+            sort_keys=True,
+            default=str,
+        )
@@ -1,3 +1,8 @@
+import asyncio
+import random
+import weakref
+from collections.abc import Iterator
+
 try:
     import litellm
 
@@ -16,6 +21,8 @@ from ragbits.core.embeddings.exceptions import (
 class LiteLLMEmbeddings(Embeddings):
     """
     Client for creating text embeddings using LiteLLM API.
+
+    The concurrency limit is shared by all the calls of the client made from the same event loop.
     """
 
     def __init__(
@@ -25,6 +32,11 @@ class LiteLLMEmbeddings(Embeddings):
         api_base: str | None = None,
         api_key: str | None = None,
         api_version: str | None = None,
+        *,
+        batch_size: int = 1000,
+        max_batch_tokens: int | None = None,
+        max_concurrency: int = 10,
+        max_retries: int = 3,
     ) -> None:
         """
         Constructs the LiteLLMEmbeddingClient.
@@ -38,6 +50,12 @@ class LiteLLMEmbeddings(Embeddings):
                 for more information, follow the instructions for your specific vendor in the\
                 [LiteLLM documentation](https://docs.litellm.ai/docs/embedding/supported_embedding).
             api_version: The API version for the call.
+            batch_size: The maximum number of strings sent in a single request.
+            max_batch_tokens: The maximum number of tokens sent in a single request. If not specified, the requests
+                are limited only by the number of strings.
+            max_concurrency: The maximum number of requests sent at the same time by all the calls of the client.
+            max_retries: The maximum number of retries of a request rejected because of rate limiting (429)
+                or a server error (5xx).
 
         Raises:
             ImportError: If the 'litellm' extra requirements are not installed.
@@ -51,10 +69,18 @@ class LiteLLMEmbeddings(Embeddings):
         self.api_base = api_base
         self.api_key = api_key
         self.api_version = api_version
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        # The semaphores are bound to an event loop, so each running loop has its own
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
 
     async def embed_text(self, data: list[str]) -> list[list[float]]:
         """
-        Creates embeddings for the given strings.
+        Creates embeddings for the given strings. The strings are split into batches sent concurrently.
 
         Args:
             data: List of strings to get embeddings for.
@@ -67,20 +93,67 @@ class LiteLLMEmbeddings(Embeddings):
             EmbeddingStatusError: If the embedding API returns an error status code.
             EmbeddingResponseError: If the embedding API response is invalid.
         """
-        try:
-            response = await litellm.aembedding(
-                input=data,
-                model=self.model,
-                api_base=self.api_base,
-                api_key=self.api_key,
-                api_version=self.api_version,
-                **self.options,
-            )
-        except litellm.openai.APIConnectionError as exc:
-            raise EmbeddingConnectionError() from exc
-        except litellm.openai.APIStatusError as exc:
-            raise EmbeddingStatusError(exc.message, exc.status_code) from exc
-        except litellm.openai.APIResponseValidationError as exc:
-            raise EmbeddingResponseError() from exc
-
-        return [embedding["embedding"] for embedding in response.data]
+        semaphore = self._get_semaphore()
+
+        async def _embed_with_limit(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embed_batch(batch)
+
+        # Counting the tokens runs the tokenizer of the model, so it's done in a thread
+        batches = await asyncio.to_thread(list, self._batch(data)) if self.max_batch_tokens else self._batch(data)
+        results = await asyncio.gather(*(_embed_with_limit(batch) for batch in batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Returns the semaphore limiting the concurrent requests of the client for the running event loop.
+
+        Returns:
+            The semaphore.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    def _batch(self, data: list[str]) -> Iterator[list[str]]:
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in data:
+            tokens = litellm.token_counter(model=self.model, text=text) if self.max_batch_tokens else 0
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    async def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
+            try:
+                response = await litellm.aembedding(
+                    input=batch,
+                    model=self.model,
+                    api_base=self.api_base,
+                    api_key=self.api_key,
+                    api_version=self.api_version,
+                    **self.options,
+                )
+            except litellm.openai.APIConnectionError as exc:
+                raise EmbeddingConnectionError() from exc
+            except litellm.openai.APIStatusError as exc:
+                if attempt < self.max_retries and (exc.status_code == 429 or exc.status_code >= 500):  # noqa: PLR2004
+                    # Exponential backoff with jitter, so that the throttled requests don't retry all at once
+                    await asyncio.sleep(2**attempt + random.uniform(0, 1))  # noqa: S311
+                    attempt += 1
+                    continue
+                raise EmbeddingStatusError(exc.message, exc.status_code) from exc
+            except litellm.openai.APIResponseValidationError as exc:
+                raise EmbeddingResponseError() from exc
+
+            return [embedding["embedding"] for embedding in response.data]
@@ -1,4 +1,6 @@
-from collections.abc import Iterator
+import asyncio
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import torch
@@ -15,18 +17,28 @@ from ragbits.core.embeddings import Embeddings
 class LocalEmbeddings(Embeddings):
     """
     Class for interaction with any encoder available in HuggingFace.
+
+    The inference runs in a dedicated worker thread, so it doesn't block the event loop. The texts are
+    batched by their tokenized length to minimize the padding.
     """
 
     def __init__(
         self,
         model_name: str,
         api_key: str | None = None,
+        *,
+        batch_size: int = 32,
+        num_threads: int | None = None,
     ) -> None:
         """Constructs a new local LLM instance.
 
         Args:
             model_name: Name of the model to use.
             api_key: The API key for Hugging Face authentication.
+            batch_size: The maximum number of texts embedded in a single forward pass.
+            num_threads: The number of threads used by torch for the inference on CPU, set in the worker thread.
+                Depending on the torch parallel backend, the setting may apply to the whole process. If not
+                specified, the torch default is used.
 
         Raises:
             ImportError: If the 'local' extra requirements are not installed.
@@ -38,44 +50,79 @@ class LocalEmbeddings(Embeddings):
 
         self.hf_api_key = api_key
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.num_threads = num_threads
 
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model = AutoModel.from_pretrained(self.model_name, token=self.hf_api_key).to(self.device)
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, token=self.hf_api_key)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="ragbits-local-embeddings",
+            initializer=self._init_worker,
+        )
 
-    async def embed_text(self, data: list[str], batch_size: int = 1) -> list[list[float]]:
+    async def embed_text(self, data: list[str], batch_size: int | None = None) -> list[list[float]]:
         """Calls the appropriate encoder endpoint with the given data and options.
 
         Args:
             data: List of strings to get embeddings for.
-            batch_size: Batch size.
+            batch_size: Batch size, overrides the batch size the embeddings were constructed with.
 
         Returns:
             List of embeddings for the given strings.
         """
-        embeddings = []
-        for batch in self._batch(data, batch_size):
-            batch_dict = self.tokenizer(
-                batch,
-                max_length=self.tokenizer.model_max_length,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-            ).to(self.device)
-            with torch.no_grad():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._embed, data, batch_size or self.batch_size)
+
+    def _init_worker(self) -> None:
+        if self.num_threads is not None:
+            torch.set_num_threads(self.num_threads)
+
+    def _embed(self, data: list[str], batch_size: int) -> list[list[float]]:
+        if not data:
+            return []
+
+        # The texts are tokenized once, without padding, and the batches are padded from the tokenized texts
+        encodings = self.tokenizer(data, max_length=self.tokenizer.model_max_length, truncation=True)
+        # Texts of similar length are batched together, so that every batch is padded as little as possible
+        order = sorted(range(len(data)), key=lambda i: len(encodings["input_ids"][i]))
+
+        embeddings: list[list[float]] = [[] for _ in data]
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                indices = order[start : start + batch_size]
+                batch_dict = self._pad(encodings, indices)
                 outputs = self.model(**batch_dict)
                 batch_embeddings = self._average_pool(outputs.last_hidden_state, batch_dict["attention_mask"])
                 batch_embeddings = F.normalize(batch_embeddings, p=2, dim=1)
-            embeddings.extend(batch_embeddings.to("cpu").tolist())
+                for i, embedding in zip(indices, batch_embeddings.to("cpu").tolist(), strict=True):
+                    embeddings[i] = embedding
 
-        torch.cuda.empty_cache()
         return embeddings
 
-    @staticmethod
-    def _batch(data: list[str], batch_size: int) -> Iterator[list[str]]:
-        length = len(data)
-        for ndx in range(0, length, batch_size):
-            yield data[ndx : min(ndx + batch_size, length)]
+    async def aclose(self) -> None:
+        """
+        Shuts down the worker thread, cancelling the pending calls. The embeddings can't be used after they're closed.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pad(self, encodings: Mapping[str, list[list[int]]], indices: list[int]) -> dict[str, torch.Tensor]:
+        """
+        Pads the tokenized texts into a batch, on the padding side of the tokenizer.
+
+        Args:
+            encodings: The tokenized texts.
+            indices: The indices of the texts in the batch.
+
+        Returns:
+            The batch tensors on the device of the model.
+        """
+        batch = self.tokenizer.pad(
+            {key: [values[i] for i in indices] for key, values in encodings.items()},
+            return_tensors="pt",
+        )
+        return {key: tensor.to(self.device) for key, tensor in batch.items()}
 
     @staticmethod
     def _average_pool(last_hidden_states: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
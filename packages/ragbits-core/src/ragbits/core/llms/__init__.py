@@ -3,8 +3,9 @@ import sys
 from ragbits.core.utils.config_handling import get_cls_from_config
 
 from .base import LLM
+from .cache import InMemoryLLMCache, LLMCache, SQLiteLLMCache
 
-__all__ = ["LLM"]
+__all__ = ["LLM", "InMemoryLLMCache", "LLMCache", "SQLiteLLMCache"]
 
 module = sys.modules[__name__]
 
@@ -12,6 +13,8 @@ module = sys.modules[__name__]
 def get_llm(config: dict) -> LLM:
     """
     Initializes and returns an LLM object based on the provided configuration.
+    If the configuration contains a "cache" key, the LLM responses are cached in the cache
+    specified by its "type" and "config".
 
     Args:
         config : A dictionary containing configuration details for the LLM.
@@ -27,6 +30,7 @@ def get_llm(config: dict) -> LLM:
     llm_type = config["type"]
     llm_config = config.get("config", {})
     default_options = llm_config.pop("default_options", None)
+    cache_config = config.get("cache")
     llm_cls = get_cls_from_config(llm_type, module)
 
     if not issubclass(llm_cls, LLM):
@@ -36,4 +40,7 @@ def get_llm(config: dict) -> LLM:
     # pylint: disable=protected-access
     options = llm_cls._options_cls(**default_options) if default_options else None  # type: ignore
 
+    if cache_config is not None:
+        llm_config["cache"] = get_cls_from_config(cache_config["type"], module)(**cache_config.get("config", {}))
+
     return llm_cls(**llm_config, default_options=options)
@@ -1,11 +1,18 @@
+import asyncio
 import enum
+import json
 import warnings as wrngs
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Callable
 from functools import cached_property
+from hashlib import sha256
 from typing import Generic, cast, overload
 
+from pydantic import BaseModel
+
 from ragbits.core.prompt.base import BasePrompt, BasePromptWithParser, ChatFormat, OutputT
 
+from .cache import LLMCache
 from .clients.base import LLMClient, LLMClientOptions, LLMOptions
 
 
@@ -26,19 +33,27 @@ class LLM(Generic[LLMClientOptions], ABC):
 
     _options_cls: type[LLMClientOptions]
 
-    def __init__(self, model_name: str, default_options: LLMOptions | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        default_options: LLMOptions | None = None,
+        *,
+        cache: LLMCache | None = None,
+    ) -> None:
         """
         Constructs a new LLM instance.
 
         Args:
             model_name: Name of the model to be used.
             default_options: Default options to be used.
+            cache: The cache of the responses. If not specified, the responses are not cached.
 
         Raises:
             TypeError: If the subclass is missing the '_options_cls' attribute.
         """
         self.model_name = model_name
         self.default_options = default_options or self._options_cls()
+        self.cache = cache
 
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "_options_cls"):
@@ -63,6 +78,18 @@ class LLM(Generic[LLMClientOptions], ABC):
         """
         return sum(len(message["content"]) for message in prompt.chat)
 
+    def count_tokens_many(self, prompts: list[BasePrompt]) -> list[int]:
+        """
+        Counts tokens in each of the prompts.
+
+        Args:
+            prompts: Formatted prompt templates with conversation and response parsing configuration.
+
+        Returns:
+            Numbers of tokens in the prompts, in the order of the prompts.
+        """
+        return [self.count_tokens(prompt) for prompt in prompts]
+
     async def generate_raw(
         self,
         prompt: BasePrompt,
@@ -80,15 +107,48 @@ class LLM(Generic[LLMClientOptions], ABC):
             Raw text response from LLM.
         """
         options = (self.default_options | options) if options else self.default_options
+        conversation = self._format_chat_for_llm(prompt)
+        output_schema = prompt.output_schema()
+
+        async def _call() -> str:
+            return await self.client.call(
+                conversation=conversation,
+                options=options,
+                json_mode=prompt.json_mode,
+                output_schema=output_schema,
+            )
+
+        if self.cache is None:
+            return await _call()
+
+        key = self._cache_key(prompt, conversation, options, output_schema)
+        return await self.cache.get_or_generate(key, _call)
 
-        response = await self.client.call(
+    async def generate_streaming(
+        self,
+        prompt: BasePrompt,
+        *,
+        options: LLMOptions | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Prepares and sends a prompt to the LLM and yields the raw response (without parsing)
+        as it's being generated. The streamed responses are not cached.
+
+        Args:
+            prompt: Formatted prompt template with conversation.
+            options: Options to use for the LLM client.
+
+        Yields:
+            Consecutive chunks of the raw text response from LLM.
+        """
+        options = (self.default_options | options) if options else self.default_options
+        async for chunk in self.client.call_streaming(
             conversation=self._format_chat_for_llm(prompt),
             options=options,
             json_mode=prompt.json_mode,
             output_schema=prompt.output_schema(),
-        )
-
-        return response
+        ):
+            yield chunk
 
     @overload
     async def generate(
@@ -130,6 +190,81 @@ class LLM(Generic[LLMClientOptions], ABC):
 
         return cast(OutputT, response)
 
+    async def generate_batch(
+        self,
+        prompts: list[BasePrompt],
+        *,
+        options: LLMOptions | None = None,
+        max_concurrency: int = 10,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[OutputT | Exception]:
+        """
+        Prepares and sends multiple prompts to the LLM concurrently and returns the responses parsed to the
+        output types of the prompts (if available). A failure of one prompt doesn't stop the others.
+
+        The concurrent calls are sent as concurrent requests to the APIs and are batched together
+        by the clients of the local models.
+
+        Args:
+            prompts: Formatted prompt templates with conversation and optional response parsing configuration.
+            options: Options to use for the LLM client.
+            max_concurrency: The maximum number of prompts processed at the same time.
+            progress_callback: The function called with the number of processed prompts and the number of all
+                prompts every time a prompt is processed.
+
+        Returns:
+            The responses in the order of the prompts, with the raised exceptions in place of the failed ones.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        processed = 0
+
+        async def _generate(prompt: BasePrompt) -> OutputT | Exception:
+            nonlocal processed
+            result: OutputT | Exception
+            async with semaphore:
+                try:
+                    result = await self.generate(prompt, options=options)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    result = exc
+            processed += 1
+            if progress_callback is not None:
+                progress_callback(processed, len(prompts))
+            return result
+
+        return await asyncio.gather(*(_generate(prompt) for prompt in prompts))
+
+    def _cache_key(
+        self,
+        prompt: BasePrompt,
+        conversation: ChatFormat,
+        options: LLMOptions,
+        output_schema: type[BaseModel] | dict | None,
+    ) -> str:
+        """
+        Builds the key identifying the request in the cache.
+
+        Args:
+            prompt: Formatted prompt template with conversation.
+            conversation: The conversation sent to the LLM.
+            options: The merged options of the request.
+            output_schema: The output schema of the request.
+
+        Returns:
+            The SHA-256 of the request.
+        """
+        if isinstance(output_schema, type) and issubclass(output_schema, BaseModel):
+            output_schema = output_schema.model_json_schema()
+        request = {
+            "type": type(self).__qualname__,
+            "model": self.model_name,
+            "options": options.dict(),
+            "json_mode": prompt.json_mode,
+            "output_schema": output_schema,
+            "conversation": conversation,
+            "images": [sha256(image).hexdigest() for image in prompt.list_images()],
+        }
+        return sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
     def _format_chat_for_llm(self, prompt: BasePrompt) -> ChatFormat:
         if prompt.list_images():
             wrngs.warn(message=f"Image input not implemented for {self.__class__.__name__}")
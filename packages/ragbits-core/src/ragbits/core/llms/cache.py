@@ -0,0 +1,203 @@
+import asyncio
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+class LLMCache(ABC):
+    """
+    Abstract cache of the LLM responses.
+
+    Identical requests made while the response is being generated are deduplicated, so that only one
+    of them reaches the LLM and the others wait for its response.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs a new LLMCache instance.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._in_flight: dict[str, asyncio.Future[str]] = {}
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """
+        Returns the cached response.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The cached response or None if the response is not cached or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, response: str) -> None:
+        """
+        Caches the response.
+
+        Args:
+            key: The key of the request.
+            response: The response of the LLM.
+        """
+
+    async def get_or_generate(self, key: str, generate: Callable[[], Awaitable[str]]) -> str:
+        """
+        Returns the cached response or generates and caches it if it's missing.
+
+        Args:
+            key: The key of the request.
+            generate: The function generating the response.
+
+        Returns:
+            The response of the LLM.
+        """
+        response = await self.get(key)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            self.misses += 1
+            in_flight = asyncio.ensure_future(self._generate_and_set(key, generate))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.hits += 1
+        return await asyncio.shield(in_flight)
+
+    async def _generate_and_set(self, key: str, generate: Callable[[], Awaitable[str]]) -> str:
+        response = await generate()
+        await self.set(key, response)
+        return response
+
+
+class InMemoryLLMCache(LLMCache):
+    """
+    Cache keeping the LLM responses in memory, evicting the least recently used ones.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float | None = None) -> None:
+        """
+        Constructs a new InMemoryLLMCache instance.
+
+        Args:
+            max_size: The maximum number of cached responses.
+            ttl: The time in seconds after which the responses expire. If not specified, they never expire.
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._responses: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        """
+        Returns the cached response.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The cached response or None if the response is not cached or expired.
+        """
+        cached = self._responses.get(key)
+        if cached is None:
+            return None
+
+        created_at, response = cached
+        if self.ttl is not None and time.monotonic() - created_at > self.ttl:
+            del self._responses[key]
+            return None
+
+        self._responses.move_to_end(key)
+        return response
+
+    async def set(self, key: str, response: str) -> None:
+        """
+        Caches the response.
+
+        Args:
+            key: The key of the request.
+            response: The response of the LLM.
+        """
+        self._responses[key] = (time.monotonic(), response)
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+
+class SQLiteLLMCache(LLMCache):
+    """
+    Cache keeping the LLM responses in an SQLite database on disk, so they are shared between runs.
+
+    The queries run in a dedicated worker thread, so they don't block the event loop.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None) -> None:
+        """
+        Constructs a new SQLiteLLMCache instance.
+
+        Args:
+            path: The path to the SQLite database.
+            ttl: The time in seconds after which the responses expire. If not specified, they never expire.
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.ttl = ttl
+        # The connection is used only by the single worker thread, one query at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ragbits-llm-cache")
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT, created_at REAL)"
+            )
+
+    async def get(self, key: str) -> str | None:
+        """
+        Returns the cached response.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The cached response or None if the response is not cached or expired.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._get, key)
+
+    async def set(self, key: str, response: str) -> None:
+        """
+        Caches the response.
+
+        Args:
+            key: The key of the request.
+            response: The response of the LLM.
+        """
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._set, key, response)
+
+    def _get(self, key: str) -> str | None:
+        with self._connection:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                self._connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            return response
+
+    def _set(self, key: str, response: str) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
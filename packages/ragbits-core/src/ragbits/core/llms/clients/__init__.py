@@ -1,5 +1,5 @@
 from .base import LLMClient, LLMOptions
-from .litellm import LiteLLMClient, LiteLLMOptions
+from .litellm import LiteLLMClient, LiteLLMOptions, ModelCapabilities
 from .local import LocalLLMClient, LocalLLMOptions
 
 __all__ = [
@@ -9,4 +9,5 @@ __all__ = [
     "LiteLLMOptions",
     "LocalLLMClient",
     "LocalLLMOptions",
+    "ModelCapabilities",
 ]
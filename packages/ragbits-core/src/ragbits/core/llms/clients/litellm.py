@@ -1,9 +1,18 @@
-from dataclasses import dataclass
+import asyncio
+import random
+import warnings
+import weakref
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
 try:
     import litellm
+    import tiktoken
 
     HAS_LITELLM = True
 except ImportError:
@@ -11,6 +20,7 @@ except ImportError:
 
 
 from ragbits.core.prompt import ChatFormat
+from ragbits.core.utils.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter
 
 from ..types import NOT_GIVEN, NotGiven
 from .base import LLMClient, LLMOptions
@@ -35,6 +45,118 @@ class LiteLLMOptions(LLMOptions):
     mock_response: str | None | NotGiven = NOT_GIVEN
 
 
+class ModelTokenizer:
+    """
+    Tokenizer of a model, loaded on the first use.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        """
+        Constructs a new ModelTokenizer instance.
+
+        Args:
+            model_name: Name of the model.
+        """
+        self.model_name = model_name
+
+    @cached_property
+    def _count_batch(self) -> Callable[[list[str]], list[int]]:
+        # LiteLLM maps the models to their tokenizers, the OpenAI models use the tiktoken encoding of the model
+        tokenizer = litellm.utils._select_tokenizer(self.model_name)  # pylint: disable=protected-access
+        if tokenizer["type"] == "huggingface_tokenizer":
+            return lambda texts: [len(encoding.ids) for encoding in tokenizer["tokenizer"].encode_batch(texts)]
+        try:
+            encoding = tiktoken.encoding_for_model(self.model_name)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda texts: [len(tokens) for tokens in encoding.encode_batch(texts, disallowed_special=())]
+
+    def count_many(self, texts: list[str]) -> list[int]:
+        """
+        Counts tokens in each of the texts, tokenizing all of them in one batch.
+
+        Args:
+            texts: The texts to count tokens for.
+
+        Returns:
+            Numbers of tokens in the texts, in the order of the texts.
+        """
+        return self._count_batch(texts) if texts else []
+
+
+@dataclass(frozen=True)
+class ModelCapabilities:
+    """
+    Capabilities of a model, as described in the LiteLLM model table, and its tokenizer.
+    """
+
+    supported_params: frozenset[str]
+    supports_vision: bool
+    tokenizer: ModelTokenizer = field(compare=False, repr=False)
+
+    @property
+    def supports_response_format(self) -> bool:
+        """
+        Whether the model accepts the `response_format` parameter.
+        """
+        return "response_format" in self.supported_params
+
+
+@cache
+def get_model_capabilities(model_name: str) -> ModelCapabilities:
+    """
+    Resolves the capabilities of the model. The capabilities are static, so they are resolved once per model.
+
+    Args:
+        model_name: Name of the model.
+
+    Returns:
+        The capabilities of the model.
+    """
+    return ModelCapabilities(
+        supported_params=frozenset(litellm.get_supported_openai_params(model=model_name) or ()),
+        supports_vision=litellm.supports_vision(model_name),
+        tokenizer=ModelTokenizer(model_name),
+    )
+
+
+_LimitsKey = tuple[str, str | None]
+_LimiterT = TypeVar("_LimiterT", RateLimiter, AdaptiveConcurrencyLimiter)
+
+# The limits are shared by all the clients calling the same model on the same API, the first client sets them
+_limits: dict[_LimitsKey, tuple[int | None, int | None, int | None]] = {}
+
+# The limiters use asyncio primitives bound to an event loop, so each running loop has its own limiters
+_rate_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_LimitsKey, RateLimiter]] = (
+    weakref.WeakKeyDictionary()
+)
+_concurrency_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[_LimitsKey, AdaptiveConcurrencyLimiter]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_limiter(
+    registry: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_LimitsKey, _LimiterT]],
+    key: _LimitsKey,
+    factory: Callable[[], _LimiterT],
+) -> _LimiterT:
+    """
+    Returns the limiter of the model and base URL for the running event loop, creating it if needed.
+
+    Args:
+        registry: The limiters of each event loop.
+        key: The model name and the base URL.
+        factory: The function creating the limiter.
+
+    Returns:
+        The limiter.
+    """
+    limiters = registry.setdefault(asyncio.get_running_loop(), {})
+    if key not in limiters:
+        limiters[key] = factory()
+    return limiters[key]
+
+
 class LiteLLMClient(LLMClient[LiteLLMOptions]):
     """
     Client for the LiteLLM that supports calls to 100+ LLMs APIs, including OpenAI, Anthropic, VertexAI,
@@ -51,16 +173,31 @@ class LiteLLMClient(LLMClient[LiteLLMOptions]):
         api_key: str | None = None,
         api_version: str | None = None,
         use_structured_output: bool = False,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int = 3,
     ) -> None:
         """
         Constructs a new LiteLLMClient instance.
 
+        The rate and concurrency limits are shared by all the clients of the same model and base URL,
+        the first client created with limits for them determines the limits. A warning is issued
+        if a later client passes different limits.
+
         Args:
             model_name: Name of the model to use.
             base_url: Base URL of the LLM API.
             api_key: API key used to authenticate with the LLM API.
             api_version: API version of the LLM API.
             use_structured_output: Whether to request a structured output from the model. Default is False.
+            requests_per_minute: The maximum number of requests per minute, if None the requests are not limited.
+            tokens_per_minute: The maximum number of tokens per minute, if None the tokens are not limited.
+                The tokens of a request are estimated as the tokens of the conversation and the `max_tokens` option.
+            max_concurrency: The maximum number of concurrent requests. The limit is halved when the requests
+                are throttled (429) and grows back while they succeed. If None the concurrency is not limited.
+            max_retries: The maximum number of retries of a request rejected because of rate limiting (429)
+                or a server error (5xx).
 
         Raises:
             ImportError: If the 'litellm' extra requirements are not installed.
@@ -73,6 +210,55 @@ class LiteLLMClient(LLMClient[LiteLLMOptions]):
         self.api_key = api_key
         self.api_version = api_version
         self.use_structured_output = use_structured_output
+        self.max_retries = max_retries
+
+        self._limits_key = (model_name, base_url)
+        self._limits = (requests_per_minute, tokens_per_minute, max_concurrency)
+        if any(self._limits):
+            limits = _limits.setdefault(self._limits_key, self._limits)
+            if limits != self._limits:
+                warnings.warn(
+                    message=f"The limits of {model_name} at {base_url} are already set by another client "
+                    f"to requests_per_minute, tokens_per_minute, max_concurrency = {limits}, "
+                    f"the limits {self._limits} are ignored",
+                    category=UserWarning,
+                )
+                self._limits = limits
+
+    def _get_rate_limiter(self) -> RateLimiter | None:
+        """
+        Returns the rate limiter shared by the clients of the model for the running event loop.
+
+        Returns:
+            The rate limiter, or None if the rate is not limited.
+        """
+        requests_per_minute, tokens_per_minute, _ = self._limits
+        if not (requests_per_minute or tokens_per_minute):
+            return None
+        return _get_limiter(
+            _rate_limiters, self._limits_key, lambda: RateLimiter(requests_per_minute, tokens_per_minute)
+        )
+
+    def _get_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        """
+        Returns the concurrency limiter shared by the clients of the model for the running event loop.
+
+        Returns:
+            The concurrency limiter, or None if the concurrency is not limited.
+        """
+        max_concurrency = self._limits[2]
+        if not max_concurrency:
+            return None
+        return _get_limiter(
+            _concurrency_limiters, self._limits_key, lambda: AdaptiveConcurrencyLimiter(max_concurrency)
+        )
+
+    @cached_property
+    def capabilities(self) -> ModelCapabilities:
+        """
+        Capabilities of the model used by the client.
+        """
+        return get_model_capabilities(self.model_name)
 
     async def call(
         self,
@@ -99,30 +285,178 @@ class LiteLLMClient(LLMClient[LiteLLMOptions]):
             LLMStatusError: If the LLM API returns an error status code.
             LLMResponseError: If the LLM API response is invalid.
         """
-        supported_params = litellm.get_supported_openai_params(model=self.model_name)
+        response = await self._completion(
+            conversation, options, self._get_response_format(json_mode, output_schema), stream=False
+        )
+        return response.choices[0].message.content
+
+    async def call_streaming(
+        self,
+        conversation: ChatFormat,
+        options: LiteLLMOptions,
+        json_mode: bool = False,
+        output_schema: type[BaseModel] | dict | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Calls the appropriate LLM endpoint with the given prompt and options and yields the response
+        as it's being generated.
+
+        Args:
+            conversation: List of dicts with "role" and "content" keys, representing the chat history so far.
+            options: Additional settings used by the LLM.
+            json_mode: Force the response to be in JSON format.
+            output_schema: Output schema for requesting a specific response format.
+            Only used if the client has been initialized with `use_structured_output=True`.
+
+        Yields:
+            Consecutive chunks of the response string from LLM.
+
+        Raises:
+            LLMConnectionError: If there is a connection error with the LLM API.
+            LLMStatusError: If the LLM API returns an error status code.
+            LLMResponseError: If the LLM API response is invalid.
+        """
+        response = await self._completion(
+            conversation, options, self._get_response_format(json_mode, output_schema), stream=True
+        )
+        with _map_errors():
+            async for chunk in response:
+                if content := chunk.choices[0].delta.content:
+                    yield content
+
+    async def _completion(
+        self,
+        conversation: ChatFormat,
+        options: LiteLLMOptions,
+        response_format: type[BaseModel] | dict | None,
+        stream: bool,
+    ) -> Any:  # noqa: ANN401
+        """
+        Sends the completion request within the rate and concurrency limits, retrying it with exponential
+        backoff if it's throttled or fails because of a server error.
+
+        Args:
+            conversation: List of dicts with "role" and "content" keys, representing the chat history so far.
+            options: Additional settings used by the LLM.
+            response_format: The response format to request from the model.
+            stream: Whether to stream the response.
+
+        Returns:
+            The LiteLLM response.
+
+        Raises:
+            LLMConnectionError: If there is a connection error with the LLM API.
+            LLMStatusError: If the LLM API returns an error status code.
+            LLMResponseError: If the LLM API response is invalid.
+        """
+        rate_limiter = self._get_rate_limiter()
+        concurrency_limiter = self._get_concurrency_limiter()
+        tokens = self._estimate_tokens(conversation, options) if rate_limiter else 0
+        attempt = 0
+        while True:
+            concurrency_limit: AbstractAsyncContextManager = concurrency_limiter or nullcontext()
+            async with concurrency_limit:
+                if rate_limiter:
+                    await rate_limiter.acquire(tokens)
+                try:
+                    with _map_errors():
+                        response = await litellm.acompletion(
+                            messages=conversation,
+                            model=self.model_name,
+                            base_url=self.base_url,
+                            api_key=self.api_key,
+                            api_version=self.api_version,
+                            response_format=response_format,
+                            stream=stream,
+                            **options.dict(),
+                        )
+                except LLMStatusError as exc:
+                    if exc.status_code == 429 and concurrency_limiter:  # noqa: PLR2004
+                        concurrency_limiter.decrease()
+                    if attempt >= self.max_retries or (exc.status_code != 429 and exc.status_code < 500):  # noqa: PLR2004
+                        raise
+                    delay = _retry_after(exc.__cause__) or 2**attempt
+                else:
+                    if concurrency_limiter:
+                        concurrency_limiter.increase()
+                    return response
+
+            # Jitter, so that the throttled requests don't retry all at once
+            await asyncio.sleep(delay + random.uniform(0, 1))  # noqa: S311
+            attempt += 1
+
+    def _estimate_tokens(self, conversation: ChatFormat, options: LiteLLMOptions) -> int:
+        """
+        Estimates the number of tokens used by the request.
+
+        Args:
+            conversation: The conversation sent to the LLM.
+            options: Additional settings used by the LLM.
+
+        Returns:
+            The number of tokens of the conversation and the maximum number of generated tokens.
+        """
+        max_tokens = options.max_tokens if isinstance(options.max_tokens, int) else 0
+        return litellm.token_counter(model=self.model_name, messages=conversation) + max_tokens
 
+    def _get_response_format(
+        self, json_mode: bool, output_schema: type[BaseModel] | dict | None
+    ) -> type[BaseModel] | dict | None:
+        """
+        Returns the response format supported by the model.
+
+        Args:
+            json_mode: Force the response to be in JSON format.
+            output_schema: Output schema for requesting a specific response format.
+
+        Returns:
+            The response format to request from the model or None if it's not supported or not needed.
+        """
         response_format = None
-        if supported_params is not None and "response_format" in supported_params:
+        if self.capabilities.supports_response_format:
             if output_schema is not None and self.use_structured_output:
                 response_format = output_schema
             elif json_mode:
                 response_format = {"type": "json_object"}
+        return response_format
 
-        try:
-            response = await litellm.acompletion(
-                messages=conversation,
-                model=self.model_name,
-                base_url=self.base_url,
-                api_key=self.api_key,
-                api_version=self.api_version,
-                response_format=response_format,
-                **options.dict(),
-            )
-        except litellm.openai.APIConnectionError as exc:
-            raise LLMConnectionError() from exc
-        except litellm.openai.APIStatusError as exc:
-            raise LLMStatusError(exc.message, exc.status_code) from exc
-        except litellm.openai.APIResponseValidationError as exc:
-            raise LLMResponseError() from exc
 
-        return response.choices[0].message.content
+def _retry_after(exc: BaseException | None) -> float | None:
+    """
+    Returns the delay requested by the Retry-After header of the error response.
+
+    Args:
+        exc: The LiteLLM error.
+
+    Returns:
+        The delay in seconds or None if the header is missing or isn't a number of seconds.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        return None
+
+
+@contextmanager
+def _map_errors() -> Iterator[None]:
+    """
+    Translates the LiteLLM errors raised in the context into the LLM client errors.
+
+    Raises:
+        LLMConnectionError: If there is a connection error with the LLM API.
+        LLMStatusError: If the LLM API returns an error status code.
+        LLMResponseError: If the LLM API response is invalid.
+    """
+    try:
+        yield
+    except litellm.openai.APIConnectionError as exc:
+        raise LLMConnectionError() from exc
+    except litellm.openai.APIStatusError as exc:
+        raise LLMStatusError(exc.message, exc.status_code) from exc
+    except litellm.openai.APIResponseValidationError as exc:
+        raise LLMResponseError() from exc
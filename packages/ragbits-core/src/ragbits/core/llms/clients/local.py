@@ -1,10 +1,16 @@
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 
 from pydantic import BaseModel
 
 try:
     import torch
-    from transformers import AutoModelForCausalLM, AutoTokenizer
+    from transformers import AutoModelForCausalLM, AutoTokenizer, TextIteratorStreamer
 
     HAS_LOCAL_LLM = True
 except ImportError:
@@ -35,9 +41,20 @@ class LocalLLMOptions(LLMOptions):
     temperature: float | None | NotGiven = NOT_GIVEN
 
 
+@dataclass
+class _GenerationRequest:
+    input_ids: list[int]
+    options: dict[str, Any]
+    future: asyncio.Future[str]
+
+
 class LocalLLMClient(LLMClient[LocalLLMOptions]):
     """
     Client for the local LLM that supports Hugging Face models.
+
+    The generation runs in a dedicated worker thread, so it doesn't block the event loop. Concurrent calls
+    with the same options are collected into micro-batches and generated together in a single left-padded batch.
+    The batching worker exits once there are no pending calls. The worker thread is released with `aclose`.
     """
 
     _options_cls = LocalLLMOptions
@@ -47,6 +64,8 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
         model_name: str,
         *,
         hf_api_key: str | None = None,
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.01,
     ) -> None:
         """
         Constructs a new local LLMClient instance.
@@ -54,6 +73,8 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
         Args:
             model_name: Name of the model to use.
             hf_api_key: The Hugging Face API key for authentication.
+            max_batch_size: The maximum number of calls generated together in a single batch.
+            max_wait_time: The maximum time in seconds a call waits for other calls to be batched with.
 
         Raises:
             ImportError: If the 'local' extra requirements are not installed.
@@ -67,6 +88,11 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
             model_name, device_map="auto", torch_dtype=torch.bfloat16, token=hf_api_key
         )
         self.tokenizer = AutoTokenizer.from_pretrained(model_name, token=hf_api_key)
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ragbits-local-llm")
+        self._queue: asyncio.Queue[_GenerationRequest] | None = None
+        self._worker: asyncio.Task | None = None
 
     async def call(
         self,
@@ -87,15 +113,171 @@ class LocalLLMClient(LLMClient[LocalLLMOptions]):
         Returns:
             Response string from LLM.
         """
-        input_ids = self.tokenizer.apply_chat_template(
-            conversation, add_generation_prompt=True, return_tensors="pt"
-        ).to(self.model.device)
+        input_ids = self.tokenizer.apply_chat_template(conversation, add_generation_prompt=True)
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._get_queue().put_nowait(_GenerationRequest(input_ids, options.dict(), future))
+        return await future
 
-        outputs = self.model.generate(
-            input_ids,
-            eos_token_id=self.tokenizer.eos_token_id,
-            **options.dict(),
-        )
-        response = outputs[0][input_ids.shape[-1] :]
-        decoded_response = self.tokenizer.decode(response, skip_special_tokens=True)
-        return decoded_response
+    async def call_streaming(
+        self,
+        conversation: ChatFormat,
+        options: LocalLLMOptions,
+        json_mode: bool = False,
+        output_schema: type[BaseModel] | dict | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Makes a call to the local LLM with the provided prompt and options and yields the response
+        as it's being generated. The streamed calls are not batched.
+
+        Args:
+            conversation: List of dicts with "role" and "content" keys, representing the chat history so far.
+            options: Additional settings used by the LLM.
+            json_mode: Force the response to be in JSON format (not used).
+            output_schema: Output schema for requesting a specific response format (not used).
+
+        Yields:
+            Consecutive chunks of the response string from LLM.
+        """
+        loop = asyncio.get_running_loop()
+        input_ids = self.tokenizer.apply_chat_template(conversation, add_generation_prompt=True)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        generation = loop.run_in_executor(self._executor, self._generate_streaming, input_ids, options.dict(), streamer)
+
+        while (text := await loop.run_in_executor(None, next, streamer, None)) is not None:
+            if text:
+                yield text
+        await generation
+
+    async def aclose(self) -> None:
+        """
+        Stops the batching worker, cancelling the pending calls, and shuts down the worker thread.
+        The client can't be used after it's closed.
+        """
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            if self._worker.get_loop() is asyncio.get_running_loop():
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._worker
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait().future.cancel()
+        self._queue = None
+        self._worker = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _generate_streaming(
+        self, input_ids: list[int], options: dict[str, Any], streamer: "TextIteratorStreamer"
+    ) -> None:
+        """
+        Generates the response for a tokenized conversation, passing the generated text to the streamer.
+
+        Args:
+            input_ids: The token ids of the conversation.
+            options: The generation options.
+            streamer: The streamer receiving the generated text.
+        """
+        try:
+            self._generate([input_ids], {**options, "streamer": streamer})
+        except Exception:
+            # The streamer has to be closed, otherwise the consumer would wait for the text forever
+            streamer.end()
+            raise
+
+    def _get_queue(self) -> asyncio.Queue[_GenerationRequest]:
+        """
+        Returns the queue of the generation requests, starting the worker for the running event loop if needed.
+
+        Returns:
+            The queue consumed by the worker.
+        """
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._process_requests(self._queue))
+        return self._queue
+
+    async def _process_requests(self, queue: asyncio.Queue[_GenerationRequest]) -> None:
+        """
+        Collects the queued requests into batches and generates the responses in the worker thread,
+        until the queue is empty.
+
+        Args:
+            queue: The queue of the generation requests.
+        """
+        loop = asyncio.get_running_loop()
+        # The worker is started for the first request, and started again by `_get_queue` after it exits
+        while not queue.empty():
+            requests = await self._collect_requests(queue)
+
+            # Only the requests with the same generation options can be generated together
+            batches: dict[str, list[_GenerationRequest]] = {}
+            for request in requests:
+                if not request.future.cancelled():
+                    key = json.dumps(request.options, sort_keys=True, default=str)
+                    batches.setdefault(key, []).append(request)
+
+            for batch in batches.values():
+                try:
+                    responses = await loop.run_in_executor(
+                        self._executor, self._generate, [request.input_ids for request in batch], batch[0].options
+                    )
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    for request in batch:
+                        if not request.future.done():
+                            request.future.set_exception(exc)
+                else:
+                    for request, response in zip(batch, responses, strict=True):
+                        if not request.future.done():
+                            request.future.set_result(response)
+
+    async def _collect_requests(self, queue: asyncio.Queue[_GenerationRequest]) -> list[_GenerationRequest]:
+        """
+        Waits for a request and collects the ones arriving shortly after it, up to the maximum batch size.
+
+        Args:
+            queue: The queue of the generation requests.
+
+        Returns:
+            The collected requests.
+        """
+        requests = [await queue.get()]
+        while len(requests) < self.max_batch_size and not queue.empty():
+            requests.append(queue.get_nowait())
+        if len(requests) < self.max_batch_size:
+            await asyncio.sleep(self.max_wait_time)
+            while len(requests) < self.max_batch_size and not queue.empty():
+                requests.append(queue.get_nowait())
+        return requests
+
+    def _generate(self, input_ids: list[list[int]], options: dict[str, Any]) -> list[str]:
+        """
+        Generates the responses for a batch of tokenized conversations.
+
+        Args:
+            input_ids: The token ids of the conversations.
+            options: The generation options.
+
+        Returns:
+            The decoded responses, in the order of the conversations.
+        """
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            pad_token_id = self.tokenizer.eos_token_id
+
+        # Decoder-only models continue the last token, so the conversations are padded on the left
+        length = max(len(ids) for ids in input_ids)
+        inputs = torch.full((len(input_ids), length), pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(input_ids), length), dtype=torch.long)
+        for row, ids in enumerate(input_ids):
+            inputs[row, length - len(ids) :] = torch.tensor(ids, dtype=torch.long)
+            attention_mask[row, length - len(ids) :] = 1
+
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                inputs.to(self.model.device),
+                attention_mask=attention_mask.to(self.model.device),
+                eos_token_id=self.tokenizer.eos_token_id,
+                pad_token_id=pad_token_id,
+                **options,
+            )
+        return [self.tokenizer.decode(output[length:], skip_special_tokens=True) for output in outputs]
@@ -3,7 +3,7 @@ import warnings
 from functools import cached_property
 
 try:
-    import litellm
+    import litellm  # noqa: F401
 
     HAS_LITELLM = True
 except ImportError:
@@ -12,7 +12,9 @@ except ImportError:
 from ragbits.core.prompt.base import BasePrompt, ChatFormat
 
 from .base import LLM
-from .clients.litellm import LiteLLMClient, LiteLLMOptions
+from .cache import LLMCache
+from .clients.litellm import LiteLLMClient, LiteLLMOptions, get_model_capabilities
+from .token_counter import TokenCounter
 
 
 class LiteLLM(LLM[LiteLLMOptions]):
@@ -31,6 +33,11 @@ class LiteLLM(LLM[LiteLLMOptions]):
         api_key: str | None = None,
         api_version: str | None = None,
         use_structured_output: bool = False,
+        cache: LLMCache | None = None,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int = 3,
     ) -> None:
         """
         Constructs a new LiteLLM instance.
@@ -47,6 +54,15 @@ class LiteLLM(LLM[LiteLLMOptions]):
             use_structured_output: Whether to request a
                 [structured output](https://docs.litellm.ai/docs/completion/json_mode#pass-in-json_schema)
                 from the model. Default is False. Can only be combined with models that support structured output.
+            cache: The cache of the responses. If not specified, the responses are not cached.
+            requests_per_minute: The maximum number of requests per minute sent to the model,
+                if None the requests are not limited.
+            tokens_per_minute: The maximum number of tokens per minute sent to the model,
+                if None the tokens are not limited.
+            max_concurrency: The maximum number of concurrent requests, adapted when the requests are throttled.
+                If None the concurrency is not limited.
+            max_retries: The maximum number of retries of a request rejected because of rate limiting (429)
+                or a server error (5xx).
 
         Raises:
             ImportError: If the 'litellm' extra requirements are not installed.
@@ -54,11 +70,16 @@ class LiteLLM(LLM[LiteLLMOptions]):
         if not HAS_LITELLM:
             raise ImportError("You need to install the 'litellm' extra requirements to use LiteLLM models")
 
-        super().__init__(model_name, default_options)
+        super().__init__(model_name, default_options, cache=cache)
         self.base_url = base_url
         self.api_key = api_key
         self.api_version = api_version
         self.use_structured_output = use_structured_output
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.token_counter = TokenCounter(self._count_texts_tokens)
 
     @cached_property
     def client(self) -> LiteLLMClient:
@@ -71,6 +92,10 @@ class LiteLLM(LLM[LiteLLMOptions]):
             api_key=self.api_key,
             api_version=self.api_version,
             use_structured_output=self.use_structured_output,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+            max_concurrency=self.max_concurrency,
+            max_retries=self.max_retries,
         )
 
     def count_tokens(self, prompt: BasePrompt) -> int:
@@ -83,13 +108,34 @@ class LiteLLM(LLM[LiteLLMOptions]):
         Returns:
             Number of tokens in the prompt.
         """
-        return sum(litellm.token_counter(model=self.model_name, text=message["content"]) for message in prompt.chat)
+        return self.token_counter.count_conversation(prompt.chat)
+
+    def count_tokens_many(self, prompts: list[BasePrompt]) -> list[int]:
+        """
+        Counts tokens in each of the prompts, tokenizing each distinct message once.
+
+        Args:
+            prompts: Formatted prompt templates with conversation and response parsing configuration.
+
+        Returns:
+            Numbers of tokens in the prompts, in the order of the prompts.
+        """
+        chats = [prompt.chat for prompt in prompts]
+        counts = self.token_counter.count_many([message["content"] for chat in chats for message in chat])
+        totals, start = [], 0
+        for chat in chats:
+            totals.append(sum(counts[start : start + len(chat)]))
+            start += len(chat)
+        return totals
+
+    def _count_texts_tokens(self, texts: list[str]) -> list[int]:
+        return get_model_capabilities(self.model_name).tokenizer.count_many(texts)
 
     def _format_chat_for_llm(self, prompt: BasePrompt) -> ChatFormat:
         images = prompt.list_images()
         chat = prompt.chat
         if images:
-            if not litellm.supports_vision(self.model_name):
+            if not self.client.capabilities.supports_vision:
                 warnings.warn(
                     message=f"Model {self.model_name} does not support vision. Image input would be ignored",
                     category=UserWarning,
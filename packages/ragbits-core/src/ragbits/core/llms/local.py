@@ -10,6 +10,7 @@ except ImportError:
 from ragbits.core.prompt.base import BasePrompt
 
 from .base import LLM
+from .cache import LLMCache
 from .clients.local import LocalLLMClient, LocalLLMOptions
 
 
@@ -26,6 +27,9 @@ class LocalLLM(LLM[LocalLLMOptions]):
         default_options: LocalLLMOptions | None = None,
         *,
         api_key: str | None = None,
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.01,
+        cache: LLMCache | None = None,
     ) -> None:
         """
         Constructs a new local LLM instance.
@@ -34,6 +38,9 @@ class LocalLLM(LLM[LocalLLMOptions]):
             model_name: Name of the model to use. This should be a model from the CausalLM class.
             default_options: Default options for the LLM.
             api_key: The API key for Hugging Face authentication.
+            max_batch_size: The maximum number of concurrent calls generated together in a single batch.
+            max_wait_time: The maximum time in seconds a call waits for other calls to be batched with.
+            cache: The cache of the responses. If not specified, the responses are not cached.
 
         Raises:
             ImportError: If the 'local' extra requirements are not installed.
@@ -41,9 +48,11 @@ class LocalLLM(LLM[LocalLLMOptions]):
         if not HAS_LOCAL_LLM:
             raise ImportError("You need to install the 'local' extra requirements to use local LLM models")
 
-        super().__init__(model_name, default_options)
+        super().__init__(model_name, default_options, cache=cache)
         self.tokenizer = AutoTokenizer.from_pretrained(model_name, token=api_key)
         self.api_key = api_key
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
 
     @cached_property
     def client(self) -> LocalLLMClient:
@@ -53,7 +62,12 @@ class LocalLLM(LLM[LocalLLMOptions]):
         Returns:
             The client used to interact with the LLM.
         """
-        return LocalLLMClient(model_name=self.model_name, hf_api_key=self.api_key)
+        return LocalLLMClient(
+            model_name=self.model_name,
+            hf_api_key=self.api_key,
+            max_batch_size=self.max_batch_size,
+            max_wait_time=self.max_wait_time,
+        )
 
     def count_tokens(self, prompt: BasePrompt) -> int:
         """
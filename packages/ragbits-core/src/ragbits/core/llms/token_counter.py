@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from collections.abc import Callable
+
+from ragbits.core.prompt.base import ChatFormat
+
+
+class TokenCounter:
+    """
+    Counts tokens of texts and conversations, caching the counts of the recently counted texts,
+    so that the repeated messages (system prompts, few-shot examples) are tokenized only once.
+    """
+
+    def __init__(self, count_many: Callable[[list[str]], list[int]], max_size: int = 10_000) -> None:
+        """
+        Constructs a new TokenCounter instance.
+
+        Args:
+            count_many: The function counting tokens of each of the texts, typically using the tokenizer of the model.
+            max_size: The maximum number of cached counts.
+        """
+        self._count_many = count_many
+        self.max_size = max_size
+        self._counts: OrderedDict[str, int] = OrderedDict()
+
+    def count(self, text: str) -> int:
+        """
+        Counts tokens in the text.
+
+        Args:
+            text: The text to count tokens for.
+
+        Returns:
+            Number of tokens in the text.
+        """
+        return self.count_many([text])[0]
+
+    def count_many(self, texts: list[str]) -> list[int]:
+        """
+        Counts tokens in each of the texts. The distinct texts missing in the cache are tokenized in one call.
+
+        Args:
+            texts: The texts to count tokens for.
+
+        Returns:
+            Numbers of tokens in the texts, in the order of the texts.
+        """
+        counts: dict[str, int] = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            tokens = self._counts.get(text)
+            if tokens is None:
+                missing.append(text)
+            else:
+                self._counts.move_to_end(text)
+                counts[text] = tokens
+        if missing:
+            for text, tokens in zip(missing, self._count_many(missing), strict=True):
+                counts[text] = self._counts[text] = tokens
+            while len(self._counts) > self.max_size:
+                self._counts.popitem(last=False)
+        return [counts[text] for text in texts]
+
+    def count_conversation(self, conversation: ChatFormat) -> int:
+        """
+        Counts tokens in the contents of the messages of the conversation.
+
+        Args:
+            conversation: List of dicts with "role" and "content" keys.
+
+        Returns:
+            Number of tokens in the conversation.
+        """
+        return sum(self.count_many([message["content"] for message in conversation]))
@@ -4,8 +4,9 @@ from ragbits.core.utils.config_handling import get_cls_from_config
 
 from .base import MetadataStore
 from .in_memory import InMemoryMetadataStore
+from .sqlite import SQLiteMetadataStore
 
-__all__ = ["InMemoryMetadataStore", "MetadataStore"]
+__all__ = ["InMemoryMetadataStore", "MetadataStore", "SQLiteMetadataStore"]
 
 module = sys.modules[__name__]
 
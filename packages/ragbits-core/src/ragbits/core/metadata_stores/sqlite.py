@@ -0,0 +1,110 @@
+import asyncio
+import json
+import queue
+import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from ragbits.core.metadata_stores.base import MetadataStore
+from ragbits.core.metadata_stores.exceptions import MetadataNotFoundError
+
+# Older SQLite versions limit the number of the query parameters to 999
+_MAX_QUERY_PARAMETERS = 999
+
+
+class SQLiteMetadataStore(MetadataStore):
+    """
+    Metadata Store keeping the metadata in an SQLite database on disk, so it survives restarts
+    and can be shared by multiple processes.
+
+    The database runs in the WAL mode, so the readers don't block the writer. The queries run in a thread pool,
+    each thread using a connection from a pool, so they don't block the event loop.
+    """
+
+    def __init__(self, path: str | Path, *, pool_size: int = 4, timeout: float = 30.0) -> None:
+        """
+        Constructs a new SQLiteMetadataStore instance.
+
+        Args:
+            path: The path to the SQLite database.
+            pool_size: The number of connections to the database, and the number of queries running at the same time.
+            timeout: The time in seconds a query waits for a lock of the database held by another connection.
+        """
+        self.path = Path(path)
+        self.pool_size = pool_size
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="ragbits-sqlite")
+        self._connections: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        for _ in range(pool_size):
+            connection = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connections.put(connection)
+
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS metadata (id TEXT PRIMARY KEY, metadata TEXT NOT NULL)")
+
+    async def store(self, ids: list[str], metadatas: list[dict]) -> None:
+        """
+        Store metadatas under ids in metadata store.
+
+        Args:
+            ids: list of unique ids of the entries
+            metadatas: list of dicts with metadata.
+        """
+        rows = [(_id, json.dumps(metadata, default=str)) for _id, metadata in zip(ids, metadatas, strict=False)]
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._store, rows)
+
+    async def get(self, ids: list[str]) -> list[dict]:
+        """
+        Returns metadatas associated with a given ids.
+
+        Args:
+            ids: list of ids to use.
+
+        Returns:
+            List of metadata dicts associated with a given ids.
+
+        Raises:
+            MetadataNotFoundError: If the metadata is not found.
+        """
+        rows = await asyncio.get_running_loop().run_in_executor(self._executor, self._get, ids)
+        try:
+            return [json.loads(rows[_id]) for _id in ids]
+        except KeyError as exc:
+            raise MetadataNotFoundError(*exc.args) from exc
+
+    def _store(self, rows: list[tuple[str, str]]) -> None:
+        with self._connection() as connection:
+            connection.executemany("INSERT OR REPLACE INTO metadata (id, metadata) VALUES (?, ?)", rows)
+
+    def _get(self, ids: list[str]) -> dict[str, str]:
+        unique_ids = list(dict.fromkeys(ids))
+        rows: dict[str, str] = {}
+        with self._connection() as connection:
+            for start in range(0, len(unique_ids), _MAX_QUERY_PARAMETERS):
+                batch = unique_ids[start : start + _MAX_QUERY_PARAMETERS]
+                placeholders = ", ".join("?" * len(batch))
+                rows.update(
+                    connection.execute(
+                        f"SELECT id, metadata FROM metadata WHERE id IN ({placeholders})",  # noqa: S608
+                        batch,
+                    ).fetchall()
+                )
+        return rows
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a connection from the pool, committing the changes made with it.
+
+        Yields:
+            The connection.
+        """
+        connection = self._connections.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._connections.put(connection)
@@ -1,5 +1,8 @@
-from collections.abc import Callable
-from typing import Any, TypeVar
+import contextlib
+import json
+import re
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
@@ -123,6 +126,270 @@ def build_pydantic_parser(model: type[PydanticModelT]) -> Callable[[str], Pydant
     return parser
 
 
+# The characters ending a run of ordinary characters inside a JSON string
+_STRING_SPECIAL_CHARACTERS = re.compile(r'["\\]')
+
+# Marker of a value that couldn't be validated yet
+_MISSING = object()
+
+
+class _JSONStreamParser:
+    """
+    Incremental parser of a streamed JSON object. It keeps its state between the chunks, so every character
+    is scanned once. The parsed value contains only the complete parts of the response: strings, numbers
+    and literals are added once they end, while objects and arrays are added as soon as they start
+    and filled in place as their items are parsed.
+    """
+
+    def __init__(self) -> None:
+        self.value: dict[str, Any] | None = None
+        self.changed_fields: set[str] = set()
+        self._stack: list[dict[str, Any] | list[Any]] = []
+        # The key waiting for its value in each of the open objects, None for the arrays
+        self._keys: list[str | None] = []
+        # The top-level field the parsed values belong to
+        self._field: str | None = None
+        self._token: list[str] | None = None
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+
+    def feed(self, chunk: str) -> None:
+        """
+        Parses the next chunk of the response.
+
+        Args:
+            chunk: The chunk of the response.
+        """
+        i = 0
+        while i < len(chunk) and not self._done:
+            if self._in_string:
+                i = self._feed_string(chunk, i)
+                continue
+
+            char = chunk[i]
+            i += 1
+            if self.value is None and char != "{":
+                # Anything preceding the object, e.g. a code block fence, is skipped
+                continue
+            if self._token is not None and (char in ",:}]" or char.isspace()):
+                self._end_literal()
+
+            if char == '"':
+                self._in_string = True
+                self._token = []
+            elif char in "{[":
+                container: dict[str, Any] | list[Any] = {} if char == "{" else []
+                self._add(container)
+                self._stack.append(container)
+                self._keys.append(None)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                    self._keys.pop()
+                self._done = not self._stack
+            elif char not in ",:" and not char.isspace():
+                if self._token is None:
+                    self._token = []
+                self._token.append(char)
+
+    def _feed_string(self, chunk: str, start: int) -> int:
+        """
+        Parses the characters of the string starting at the given position of the chunk.
+
+        Args:
+            chunk: The chunk of the response.
+            start: The position of the first character of the string in the chunk.
+
+        Returns:
+            The position of the first character following the parsed ones.
+        """
+        token = self._token if self._token is not None else []
+        if self._escaped:
+            token.append(chunk[start])
+            self._escaped = False
+            return start + 1
+
+        match = _STRING_SPECIAL_CHARACTERS.search(chunk, start)
+        if match is None:
+            token.append(chunk[start:])
+            return len(chunk)
+
+        token.append(chunk[start : match.start()])
+        if match.group() == "\\":
+            token.append("\\")
+            self._escaped = True
+        else:
+            self._in_string = False
+            self._token = None
+            try:
+                value = json.loads('"' + "".join(token) + '"')
+            except ValueError:
+                return match.end()
+            if self._stack and isinstance(self._stack[-1], dict) and self._keys[-1] is None:
+                self._keys[-1] = value
+            else:
+                self._add(value)
+        return match.end()
+
+    def _end_literal(self) -> None:
+        """
+        Adds the number or the literal (true, false, null) that has just ended.
+        """
+        literal, self._token = "".join(self._token or ()), None
+        # An invalid literal is skipped, the complete response is validated when the stream ends
+        with contextlib.suppress(ValueError):
+            self._add(json.loads(literal))
+
+    def _add(self, value: Any) -> None:  # noqa: ANN401
+        """
+        Adds the complete value, or the container that has just started, to the open container.
+
+        Args:
+            value: The value to add.
+        """
+        if not self._stack:
+            if isinstance(value, dict):
+                self.value = value
+            return
+
+        parent = self._stack[-1]
+        if isinstance(parent, list):
+            parent.append(value)
+        elif (key := self._keys[-1]) is not None:
+            parent[key] = value
+            self._keys[-1] = None
+            if len(self._stack) == 1:
+                self._field = key
+        if self._field is not None:
+            self.changed_fields.add(self._field)
+
+
+class PydanticStreamParser(Generic[PydanticModelT]):
+    """
+    Parser consuming a JSON response of a Pydantic model chunk by chunk, as it's streamed from the LLM.
+
+    After each chunk, it returns the partial model, containing the fields that are already valid. The strings,
+    numbers and literals are used once they're complete, while the lists and the nested models are filled
+    as their items are generated. The partial models are not validated as a whole, so the fields that are
+    not yet generated are missing.
+    """
+
+    def __init__(self, model: type[PydanticModelT]) -> None:
+        """
+        Constructs a new PydanticStreamParser instance.
+
+        Args:
+            model: Pydantic model to parse the response to.
+        """
+        self.model = model
+        self._buffer: list[str] = []
+        self._json = _JSONStreamParser()
+        self._fields: dict[str, Any] = {}
+
+    def feed(self, chunk: str) -> PydanticModelT | None:
+        """
+        Consumes the next chunk of the response.
+
+        Args:
+            chunk: The chunk of the response.
+
+        Returns:
+            The partial model or None if the chunk didn't change any of the valid fields.
+        """
+        self._buffer.append(chunk)
+        self._json.feed(chunk)
+        if self._json.value is None or not self._json.changed_fields:
+            return None
+
+        # Only the fields that got new values are validated again
+        changed = False
+        for name in self._json.changed_fields:
+            value = _partial_value(self.model, name, self._json.value[name])
+            if value is not _MISSING and self._fields.get(name, _MISSING) != value:
+                self._fields[name] = value
+                changed = True
+        self._json.changed_fields.clear()
+
+        if not changed:
+            return None
+        return self.model.model_construct(_fields_set=set(self._fields), **self._fields)
+
+    def close(self) -> PydanticModelT:
+        """
+        Validates the complete response.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ResponseParsingError: If the response cannot be parsed as the Pydantic model.
+        """
+        return build_pydantic_parser(self.model)("".join(self._buffer))
+
+
+def _partial_value(model: type[BaseModel], name: str, value: Any) -> Any:  # noqa: ANN401
+    """
+    Validates the partial value of the field of the model.
+
+    Args:
+        model: The model the field belongs to.
+        name: The name of the field.
+        value: The partial value of the field.
+
+    Returns:
+        The validated value, a partial model of a nested model, the list without its unfinished last item,
+        or `_MISSING` if the value is not valid yet.
+    """
+    field = model.model_fields.get(name)
+    if field is None:
+        return _MISSING
+
+    try:
+        return getattr(model.__pydantic_validator__.validate_assignment(model.model_construct(), name, value), name)
+    except ValidationError:
+        pass
+
+    annotation = field.annotation
+    if isinstance(value, dict) and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        fields = {key: _partial_value(annotation, key, item) for key, item in value.items()}
+        fields = {key: item for key, item in fields.items() if item is not _MISSING}
+        return annotation.model_construct(_fields_set=set(fields), **fields)
+
+    if isinstance(value, list) and value:
+        # The last item may be a nested object or array that is not complete yet
+        try:
+            return getattr(
+                model.__pydantic_validator__.validate_assignment(model.model_construct(), name, value[:-1]), name
+            )
+        except ValidationError:
+            pass
+    return _MISSING
+
+
+async def parse_pydantic_stream(
+    model: type[PydanticModelT], chunks: AsyncIterable[str]
+) -> AsyncGenerator[PydanticModelT, None]:
+    """
+    Parses a streamed JSON response of a Pydantic model.
+
+    Args:
+        model: Pydantic model to parse the response to.
+        chunks: The chunks of the response, e.g. from `LLM.generate_streaming`.
+
+    Yields:
+        The partial models every time a chunk completes a new value, followed by the validated complete model.
+
+    Raises:
+        ResponseParsingError: If the complete response cannot be parsed as the Pydantic model.
+    """
+    parser = PydanticStreamParser(model)
+    async for chunk in chunks:
+        if (partial := parser.feed(chunk)) is not None:
+            yield partial
+    yield parser.close()
+
+
 DEFAULT_PARSERS: dict[type, Callable[[str], Any]] = {
     int: int_parser,
     str: str_parser,
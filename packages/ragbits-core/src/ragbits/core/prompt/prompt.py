@@ -1,9 +1,12 @@
+import copy
+import os
 import textwrap
 from abc import ABCMeta
 from collections.abc import Callable
 from typing import Any, Generic, cast, get_args, get_origin, overload
 
-from jinja2 import Environment, Template, meta
+from jinja2 import BytecodeCache, FileSystemBytecodeCache, FunctionLoader, Template, meta
+from jinja2.sandbox import SandboxedEnvironment
 from pydantic import BaseModel
 from typing_extensions import TypeVar, get_original_bases
 
@@ -14,6 +17,26 @@ InputT = TypeVar("InputT", bound=BaseModel | None)
 FewShotExample = tuple[str | InputT, str | OutputT]
 
 
+BYTECODE_CACHE_DIR_ENV = "RAGBITS_PROMPT_BYTECODE_CACHE_DIR"
+
+
+def _get_bytecode_cache() -> BytecodeCache | None:
+    # The bytecode of the templates is stored on disk only if the directory is configured
+    if (cache_dir := os.getenv(BYTECODE_CACHE_DIR_ENV)) is None:
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+
+# The templates are loaded by their source, so each distinct template is compiled once per process,
+# as long as it stays among the recently used ones. Prompts are not HTML, so they are not autoescaped.
+_environment = SandboxedEnvironment(
+    loader=FunctionLoader(lambda source: (source, None, lambda: True)),
+    bytecode_cache=_get_bytecode_cache(),
+    autoescape=False,  # noqa: S701
+    cache_size=1000,
+)
+
+
 class Prompt(Generic[InputT, OutputT], BasePromptWithParser[OutputT], metaclass=ABCMeta):
     """
     Generic class for prompts. It contains the system and user prompts, and additional messages.
@@ -58,14 +81,13 @@ class Prompt(Generic[InputT, OutputT], BasePromptWithParser[OutputT], metaclass=
 
     @classmethod
     def _parse_template(cls, template: str) -> Template:
-        env = Environment(autoescape=True)
-        ast = env.parse(template)
+        ast = _environment.parse(template)
         template_variables = meta.find_undeclared_variables(ast)
         input_fields = cls.input_type.model_fields.keys() if cls.input_type else set()
         additional_variables = template_variables - input_fields
         if additional_variables:
             raise ValueError(f"Template uses variables that are not present in the input type: {additional_variables}")
-        return Template(template)
+        return _environment.get_template(template)
 
     @classmethod
     def _render_template(cls, template: Template, input_data: InputT | None) -> str:
@@ -135,6 +157,7 @@ class Prompt(Generic[InputT, OutputT], BasePromptWithParser[OutputT], metaclass=
         # Additional few shot examples that can be added dynamically using methods
         # (in opposite to the static `few_shots` attribute which is defined in the class)
         self._instace_few_shots: list[FewShotExample[InputT, OutputT]] = []
+        self._chat: ChatFormat | None = None
         super().__init__()
 
     @property
@@ -145,16 +168,18 @@ class Prompt(Generic[InputT, OutputT], BasePromptWithParser[OutputT], metaclass=
         Returns:
             ChatFormat: A list of dictionaries, each containing the role and content of a message.
         """
-        chat = [
-            *(
-                [{"role": "system", "content": self.rendered_system_prompt}]
-                if self.rendered_system_prompt is not None
-                else []
-            ),
-            *self.list_few_shots(),
-            {"role": "user", "content": self.rendered_user_prompt},
-        ]
-        return chat
+        if self._chat is None:
+            self._chat = [
+                *(
+                    [{"role": "system", "content": self.rendered_system_prompt}]
+                    if self.rendered_system_prompt is not None
+                    else []
+                ),
+                *self.list_few_shots(),
+                {"role": "user", "content": self.rendered_user_prompt},
+            ]
+        # The callers get a copy, so that they can't modify the memoized conversation
+        return copy.deepcopy(self._chat)
 
     def add_few_shot(self, user_message: str | InputT, assistant_message: str | OutputT) -> "Prompt[InputT, OutputT]":
         """
@@ -170,6 +195,7 @@ class Prompt(Generic[InputT, OutputT], BasePromptWithParser[OutputT], metaclass=
             Prompt[InputT, OutputT]: The current prompt instance in order to allow chaining.
         """
         self._instace_few_shots.append((user_message, assistant_message))
+        self._chat = None
         return self
 
     def list_few_shots(self) -> ChatFormat:
@@ -179,10 +205,14 @@ class Prompt(Generic[InputT, OutputT], BasePromptWithParser[OutputT], metaclass=
         Returns:
             ChatFormat: A list of dictionaries, each containing the role and content of a message.
         """
+        return self._render_few_shots(self.few_shots) + self._render_few_shots(self._instace_few_shots)
+
+    @classmethod
+    def _render_few_shots(cls, few_shots: list[FewShotExample[InputT, OutputT]]) -> ChatFormat:
         result: ChatFormat = []
-        for user_message, assistant_message in self.few_shots + self._instace_few_shots:
+        for user_message, assistant_message in few_shots:
             if not isinstance(user_message, str):
-                user_content = self._render_template(self.user_prompt_template, user_message)
+                user_content = cls._render_template(cls.user_prompt_template, user_message)
             else:
                 user_content = user_message
 
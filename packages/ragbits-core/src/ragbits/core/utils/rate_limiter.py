@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    An asynchronous limiter of requests and tokens sent per minute, implemented as a pair of token buckets
+    refilled continuously. Callers wait in the order they arrived until their request fits in the budget.
+    """
+
+    def __init__(self, requests_per_minute: int | None = None, tokens_per_minute: int | None = None) -> None:
+        """
+        Constructs a new RateLimiter instance.
+
+        Args:
+            requests_per_minute: The maximum number of requests per minute, if None the requests are not limited.
+            tokens_per_minute: The maximum number of tokens per minute, if None the tokens are not limited.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Waits until a request using the given number of tokens can be sent without exceeding the limits.
+
+        Args:
+            tokens: The (estimated) number of tokens used by the request. Requests bigger than the whole
+                per-minute budget are treated as using the whole budget.
+        """
+        async with self._lock:
+            while (delay := self._reserve(tokens)) > 0:
+                await asyncio.sleep(delay)
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Takes the request from the budget if possible.
+
+        Args:
+            tokens: The number of tokens used by the request.
+
+        Returns:
+            0 if the request was taken from the budget, otherwise the number of seconds to wait before retrying.
+        """
+        now = time.monotonic()
+        elapsed, self._last_refill = now - self._last_refill, now
+
+        delay = 0.0
+        if self.requests_per_minute:
+            self._available_requests = min(
+                self.requests_per_minute, self._available_requests + elapsed * self.requests_per_minute / 60
+            )
+            delay = max(delay, (1 - self._available_requests) * 60 / self.requests_per_minute)
+
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+            self._available_tokens = min(
+                self.tokens_per_minute, self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+            delay = max(delay, (tokens - self._available_tokens) * 60 / self.tokens_per_minute)
+
+        if delay > 0:
+            return delay
+
+        if self.requests_per_minute:
+            self._available_requests -= 1
+        if self.tokens_per_minute:
+            self._available_tokens -= tokens
+        return 0.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    An asynchronous limiter of concurrent requests adapting the limit AIMD-style: the limit grows additively
+    while the requests succeed and is halved when they are throttled.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1, cooldown: float = 1.0) -> None:
+        """
+        Constructs a new AdaptiveConcurrencyLimiter instance.
+
+        Args:
+            max_concurrency: The maximum (and initial) number of concurrent requests.
+            min_concurrency: The minimum number of concurrent requests.
+            cooldown: The minimum time in seconds between two decreases of the limit, so that a burst of
+                throttled requests sent at the same time decreases the limit only once.
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.cooldown = cooldown
+        self.limit = float(max_concurrency)
+        self._running = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._running < int(self.limit))
+            self._running += 1
+
+    async def __aexit__(self, *_: object) -> None:
+        async with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    def increase(self) -> None:
+        """
+        Records a successful request, increasing the limit by one per `limit` successful requests.
+        """
+        self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    def decrease(self) -> None:
+        """
+        Records a throttled request, halving the limit.
+        """
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self._last_decrease = now
+            self.limit = max(self.min_concurrency, self.limit / 2)
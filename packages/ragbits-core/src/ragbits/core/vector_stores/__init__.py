@@ -3,9 +3,16 @@ import sys
 from ..metadata_stores import get_metadata_store
 from ..utils.config_handling import get_cls_from_config
 from .base import VectorStore, VectorStoreEntry, VectorStoreOptions, WhereQuery
-from .in_memory import InMemoryVectorStore
+from .in_memory import InMemoryVectorStore, InMemoryVectorStoreOptions
 
-__all__ = ["InMemoryVectorStore", "VectorStore", "VectorStoreEntry", "WhereQuery"]
+__all__ = [
+    "InMemoryVectorStore",
+    "InMemoryVectorStoreOptions",
+    "VectorStore",
+    "VectorStoreEntry",
+    "VectorStoreOptions",
+    "WhereQuery",
+]
 
 module = sys.modules[__name__]
 
@@ -29,6 +36,7 @@ def get_vector_store(vector_store_config: dict) -> VectorStore:
 
     metadata_store_config = vector_store_config.get("metadata_store_config")
     return vector_store_cls(
-        default_options=VectorStoreOptions(**config.get("default_options", {})),
+        default_options=vector_store_cls._options_cls(**config.get("default_options", {})),
         metadata_store=get_metadata_store(metadata_store_config),
+        **{key: value for key, value in config.items() if key != "default_options"},
     )
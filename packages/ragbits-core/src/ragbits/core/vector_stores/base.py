@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from hashlib import sha256
 
 from pydantic import BaseModel
 
@@ -10,11 +12,24 @@ WhereQuery = dict[str, str | int | float | bool]
 class VectorStoreEntry(BaseModel):
     """
     An object representing a vector database entry.
+
+    The optional `id` identifies the entry in the stores, storing an entry with the same `id` again replaces it.
+    If not specified, the stores derive it from the key, see `get_id`.
     """
 
     key: str
     vector: list[float]
     metadata: dict
+    id: str | None = None
+
+    def get_id(self) -> str:
+        """
+        Returns the identifier of the entry in the stores, the `id` if specified, otherwise the SHA-256 hash of the key.
+
+        Returns:
+            The identifier of the entry.
+        """
+        return self.id or sha256(self.key.encode("utf-8")).hexdigest()
 
 
 class VectorStoreOptions(BaseModel, ABC):
@@ -24,6 +39,7 @@ class VectorStoreOptions(BaseModel, ABC):
 
     k: int = 5
     max_distance: float | None = None
+    include_vectors: bool = True
 
 
 class VectorStore(ABC):
@@ -31,6 +47,8 @@ class VectorStore(ABC):
     A class with an implementation of Vector Store, allowing to store and retrieve vectors by similarity function.
     """
 
+    _options_cls: type[VectorStoreOptions] = VectorStoreOptions
+
     def __init__(
         self,
         default_options: VectorStoreOptions | None = None,
@@ -44,7 +62,7 @@ class VectorStore(ABC):
             metadata_store: The metadata store to use.
         """
         super().__init__()
-        self._default_options = default_options or VectorStoreOptions()
+        self._default_options = default_options or self._options_cls()
         self._metadata_store = metadata_store
 
     @abstractmethod
@@ -69,9 +87,30 @@ class VectorStore(ABC):
             The entries.
         """
 
+    async def retrieve_many(
+        self, vectors: list[list[float]], options: VectorStoreOptions | None = None
+    ) -> list[list[VectorStoreEntry]]:
+        """
+        Retrieve entries for multiple query vectors at once. By default the queries are run concurrently,
+        stores able to answer them in a single round trip should override this method.
+
+        Args:
+            vectors: The vectors to search for.
+            options: The options for querying the vector store.
+
+        Returns:
+            The entries for each of the vectors, in the order of the vectors.
+        """
+        return list(await asyncio.gather(*(self.retrieve(vector, options) for vector in vectors)))
+
     @abstractmethod
     async def list(
-        self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
+        self,
+        where: WhereQuery | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        *,
+        include_vectors: bool = True,
     ) -> list[VectorStoreEntry]:
         """
         List entries from the vector store. The entries can be filtered, limited and offset.
@@ -81,6 +120,7 @@ class VectorStore(ABC):
                 Not specifying the key means no filtering.
             limit: The maximum number of entries to return.
             offset: The number of entries to skip.
+            include_vectors: Whether to return the vectors of the entries, if False the entries have empty vectors.
 
         Returns:
             The entries.
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from hashlib import sha256
-from typing import Literal
+from collections.abc import Sequence
+from functools import partial
+from typing import Any, Literal
 
 import chromadb
+import numpy as np
 from chromadb import Collection
 from chromadb.api import ClientAPI
+from chromadb.api.types import Include
 
 from ragbits.core.metadata_stores import get_metadata_store
 from ragbits.core.metadata_stores.base import MetadataStore
@@ -17,6 +21,8 @@ from ragbits.core.vector_stores.base import VectorStore, VectorStoreEntry, Vecto
 class ChromaVectorStore(VectorStore):
     """
     Class that stores text embeddings using [Chroma](https://docs.trychroma.com/).
+
+    The entries are upserted in batches, so storing an entry with an already stored ID replaces it.
     """
 
     def __init__(
@@ -26,6 +32,9 @@ class ChromaVectorStore(VectorStore):
         distance_method: Literal["l2", "ip", "cosine"] = "l2",
         default_options: VectorStoreOptions | None = None,
         metadata_store: MetadataStore | None = None,
+        *,
+        batch_size: int = 1000,
+        max_workers: int | None = None,
     ) -> None:
         """
         Constructs a new ChromaVectorStore instance.
@@ -36,11 +45,17 @@ class ChromaVectorStore(VectorStore):
             distance_method: The distance method to use.
             default_options: The default options for querying the vector store.
             metadata_store: The metadata store to use. If None, the metadata will be stored in ChromaDB.
+            batch_size: The maximum number of entries upserted in a single request, it can't exceed
+                the maximum batch size of the ChromaDB client.
+            max_workers: The maximum number of batches of a `store` call upserted concurrently, each in a thread.
+                If not specified, the batches are upserted one by one.
         """
         super().__init__(default_options=default_options, metadata_store=metadata_store)
         self._client = client
         self._index_name = index_name
         self._distance_method = distance_method
+        self._batch_size = batch_size
+        self._max_workers = max_workers
         self._collection = self._get_chroma_collection()
 
     def _get_chroma_collection(self) -> Collection:
@@ -71,19 +86,20 @@ class ChromaVectorStore(VectorStore):
             client=client_cls(**config["client"].get("config", {})),
             index_name=config["index_name"],
             distance_method=config.get("distance_method", "l2"),
-            default_options=VectorStoreOptions(**config.get("default_options", {})),
+            default_options=cls._options_cls(**config.get("default_options", {})),
             metadata_store=get_metadata_store(config.get("metadata_store")),
+            batch_size=config.get("batch_size", 1000),
+            max_workers=config.get("max_workers"),
         )
 
     async def store(self, entries: list[VectorStoreEntry]) -> None:
         """
-        Stores entries in the ChromaDB collection.
+        Stores entries in the ChromaDB collection, replacing the entries with the same IDs.
 
         Args:
             entries: The entries to store.
         """
-        # TODO: Think about better id components for hashing and move hash computing to VectorStoreEntry
-        ids = [sha256(entry.key.encode("utf-8")).hexdigest() for entry in entries]
+        ids = [entry.get_id() for entry in entries]
         documents = [entry.key for entry in entries]
         embeddings = [entry.vector for entry in entries]
         metadatas = [entry.metadata for entry in entries]
@@ -92,7 +108,30 @@ class ChromaVectorStore(VectorStore):
             if self._metadata_store is None
             else await self._metadata_store.store(ids, metadatas)  # type: ignore
         )
-        self._collection.add(ids=ids, embeddings=embeddings, metadatas=metadatas, documents=documents)  # type: ignore
+
+        batches = [
+            {
+                "ids": ids[start : start + self._batch_size],
+                "embeddings": embeddings[start : start + self._batch_size],
+                "metadatas": metadatas[start : start + self._batch_size] if metadatas is not None else None,
+                "documents": documents[start : start + self._batch_size],
+            }
+            for start in range(0, len(ids), self._batch_size)
+        ]
+        if self._max_workers is None or len(batches) <= 1:
+            for batch in batches:
+                self._collection.upsert(**batch)  # type: ignore
+            return
+
+        # The batches are upserted in the default executor of the event loop, which is shut down with the loop,
+        # so cancelling the call doesn't wait for the running upserts
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def _upsert(batch: dict[str, Any]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(partial(self._collection.upsert, **batch))
+
+        await asyncio.gather(*(_upsert(batch) for batch in batches))
 
     async def retrieve(self, vector: list[float], options: VectorStoreOptions | None = None) -> list[VectorStoreEntry]:
         """
@@ -108,38 +147,74 @@ class ChromaVectorStore(VectorStore):
         Raises:
             MetadataNotFoundError: If the metadata is not found.
         """
+        return (await self.retrieve_many([vector], options))[0]
+
+    async def retrieve_many(
+        self, vectors: list[list[float]], options: VectorStoreOptions | None = None
+    ) -> list[list[VectorStoreEntry]]:
+        """
+        Retrieves entries for multiple query vectors from the ChromaDB collection in a single query.
+
+        Args:
+            vectors: The vectors to query.
+            options: The options for querying the vector store.
+
+        Returns:
+            The retrieved entries for each of the vectors, in the order of the vectors.
+
+        Raises:
+            MetadataNotFoundError: If the metadata is not found.
+        """
+        if not vectors:
+            return []
+
         options = self._default_options if options is None else options
 
+        include: Include = ["metadatas", "distances", "documents"]
+        if options.include_vectors:
+            include.append("embeddings")
+
         results = self._collection.query(
-            query_embeddings=vector,
+            query_embeddings=vectors,  # type: ignore
             n_results=options.k,
-            include=["metadatas", "embeddings", "distances", "documents"],
+            include=include,
         )
         ids = results.get("ids") or []
         metadatas = results.get("metadatas") or []
-        embeddings = results.get("embeddings") or []
+        embeddings: Sequence[Sequence[Any]] = results.get("embeddings") or [[None] * len(batch) for batch in ids]
         distances = results.get("distances") or []
         documents = results.get("documents") or []
 
-        metadatas = [
-            [json.loads(metadata["__metadata"]) for batch in metadatas for metadata in batch]  # type: ignore
-            if self._metadata_store is None
-            else await self._metadata_store.get(*ids)
-        ]
+        if self._metadata_store is None:
+            metadatas = [
+                [json.loads(metadata["__metadata"]) for metadata in batch]  # type: ignore
+                for batch in metadatas
+            ]
+        else:
+            flat_metadatas = iter(await self._metadata_store.get([_id for batch in ids for _id in batch]))
+            metadatas = [[next(flat_metadatas) for _ in batch] for batch in ids]
 
         return [
-            VectorStoreEntry(
-                key=document,
-                vector=list(embeddings),
-                metadata=metadata,  # type: ignore
-            )
-            for batch in zip(metadatas, embeddings, distances, documents, strict=False)
-            for metadata, embeddings, distance, document in zip(*batch, strict=False)
-            if options.max_distance is None or distance <= options.max_distance
+            [
+                VectorStoreEntry.model_construct(
+                    key=document,
+                    vector=_to_list(embedding),
+                    metadata=metadata,  # type: ignore
+                    id=_id,
+                )
+                for _id, metadata, embedding, distance, document in zip(*batch, strict=False)
+                if options.max_distance is None or distance <= options.max_distance
+            ]
+            for batch in zip(ids, metadatas, embeddings, distances, documents, strict=False)
         ]
 
     async def list(
-        self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
+        self,
+        where: WhereQuery | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        *,
+        include_vectors: bool = True,
     ) -> list[VectorStoreEntry]:
         """
         List entries from the vector store. The entries can be filtered, limited and offset.
@@ -149,6 +224,7 @@ class ChromaVectorStore(VectorStore):
                 Not specifying the key means no filtering.
             limit: The maximum number of entries to return.
             offset: The number of entries to skip.
+            include_vectors: Whether to return the vectors of the entries, if False the entries have empty vectors.
 
         Returns:
             The entries.
@@ -159,15 +235,19 @@ class ChromaVectorStore(VectorStore):
         # Cast `where` to chromadb's Where type
         where_chroma: chromadb.Where | None = dict(where) if where else None
 
+        include: Include = ["metadatas", "documents"]
+        if include_vectors:
+            include.append("embeddings")
+
         get_results = self._collection.get(
             where=where_chroma,
             limit=limit,
             offset=offset,
-            include=["metadatas", "embeddings", "documents"],
+            include=include,
         )
         ids = get_results.get("ids") or []
         metadatas = get_results.get("metadatas") or []
-        embeddings = get_results.get("embeddings") or []
+        embeddings: Sequence[Any] = get_results.get("embeddings") or [None] * len(ids)
         documents = get_results.get("documents") or []
 
         metadatas = (
@@ -177,10 +257,30 @@ class ChromaVectorStore(VectorStore):
         )
 
         return [
-            VectorStoreEntry(
+            VectorStoreEntry.model_construct(
                 key=document,
-                vector=list(embedding),
+                vector=_to_list(embedding),
                 metadata=metadata,  # type: ignore
+                id=_id,
             )
-            for metadata, embedding, document in zip(metadatas, embeddings, documents, strict=False)
+            for _id, metadata, embedding, document in zip(ids, metadatas, embeddings, documents, strict=False)
         ]
+
+
+def _to_list(embedding: np.ndarray | Sequence[float] | Sequence[int] | None) -> list[float]:
+    """
+    Converts the embedding returned by Chroma to a list of floats. Chroma returns NumPy arrays, which are converted
+    in a single pass instead of being turned into NumPy scalars and validated one by one.
+
+    Args:
+        embedding: The embedding returned by Chroma or None if the embeddings were not requested.
+
+    Returns:
+        The embedding as a list of floats, empty if the embeddings were not requested.
+    """
+    if embedding is None:
+        return []
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+    vector: list[float] = list(embedding)
+    return vector
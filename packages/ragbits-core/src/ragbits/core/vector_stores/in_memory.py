@@ -1,20 +1,57 @@
+import json
+import os
+from collections.abc import Iterator
+from hashlib import sha256
 from itertools import islice
+from pathlib import Path
+from typing import Any, Literal
 
 import numpy as np
 
 from ragbits.core.metadata_stores.base import MetadataStore
 from ragbits.core.vector_stores.base import VectorStore, VectorStoreEntry, VectorStoreOptions, WhereQuery
 
+_metadata_encoder = json.JSONEncoder(default=str)
+
+
+class InMemoryVectorStoreOptions(VectorStoreOptions):
+    """
+    An object representing the options for querying the in-memory vector store.
+    """
+
+    n_probe: int | None = None
+
 
 class InMemoryVectorStore(VectorStore):
     """
     A simple in-memory implementation of Vector Store, storing vectors in memory.
+
+    The entries are identified by their IDs, as in the other stores, so storing an entry with an already stored ID
+    replaces it.
+
+    Vectors are kept in a contiguous float32 matrix, so that a query is answered with a single
+    matrix-vector product followed by a partial sort of the distances.
+
+    With the "ivf" index, the vectors are clustered with k-means into inverted lists and a query scans only
+    the vectors of the `n_probe` lists with the closest centroids, trading recall for latency on large collections.
     """
 
+    _options_cls = InMemoryVectorStoreOptions
+
+    _INITIAL_CAPACITY = 1024
+    # Smaller collections are scanned exhaustively even with the "ivf" index
+    _MIN_IVF_SIZE = 1024
+    _KMEANS_ITERATIONS = 10
+    _KMEANS_SAMPLES_PER_LIST = 64
+
     def __init__(
         self,
         default_options: VectorStoreOptions | None = None,
         metadata_store: MetadataStore | None = None,
+        *,
+        index: Literal["exact", "ivf"] = "exact",
+        n_lists: int | None = None,
+        n_probe: int = 8,
     ) -> None:
         """
         Constructs a new InMemoryVectorStore instance.
@@ -22,9 +59,41 @@ class InMemoryVectorStore(VectorStore):
         Args:
             default_options: The default options for querying the vector store.
             metadata_store: The metadata store to use.
+            index: The index used to search the vectors, "exact" scans all the vectors, "ivf" scans
+                only the vectors in the inverted lists closest to the query.
+            n_lists: The number of inverted lists of the "ivf" index. If not specified, the square root
+                of the number of vectors is used.
+            n_probe: The number of inverted lists scanned per query by the "ivf" index, can be overridden
+                per query with `InMemoryVectorStoreOptions`.
+
+        Raises:
+            ValueError: If the index type is not supported.
         """
+        if index not in {"exact", "ivf"}:
+            raise ValueError(f"Unsupported index type: {index}")
+
         super().__init__(default_options=default_options, metadata_store=metadata_store)
-        self._storage: dict[str, VectorStoreEntry] = {}
+        self.index = index
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        # The entries loaded from a snapshot are created lazily, from the snapshot metadata
+        self._entries: list[VectorStoreEntry | None] = []
+        # The rows are identified by the IDs of the entries, the same as in the other stores
+        self._id_to_row: dict[str, int] = {}
+        self._row_to_key: list[str] = []
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._squared_norms = np.empty(0, dtype=np.float32)
+
+        # The "ivf" index, trained lazily on the first query
+        self._centroids: np.ndarray | None = None
+        self._assignments = np.empty(0, dtype=np.int64)
+        self._trained_size = 0
+        self._list_rows: np.ndarray | None = None
+        self._list_bounds: np.ndarray | None = None
+
+        self._snapshot_ids: list[str | None] = []
+        self._snapshot_metadata = np.empty(0, dtype=np.uint8)
+        self._snapshot_offsets = np.zeros(1, dtype=np.int64)
 
     async def store(self, entries: list[VectorStoreEntry]) -> None:
         """
@@ -32,9 +101,40 @@ class InMemoryVectorStore(VectorStore):
 
         Args:
             entries: The entries to store.
+
+        Raises:
+            ValueError: If the dimension of the vectors doesn't match the dimension of the already stored ones.
         """
-        for entry in entries:
-            self._storage[entry.key] = entry
+        if not entries:
+            return
+
+        vectors = np.asarray([entry.vector for entry in entries], dtype=np.float32)
+        if vectors.ndim != 2:  # noqa: PLR2004
+            raise ValueError("All vectors stored in the vector store must have the same dimension")
+
+        self._ensure_capacity(len(self._row_to_key) + len(entries), vectors.shape[1])
+        if len(self._id_to_row) != len(self._row_to_key):
+            # Indexing the IDs of a loaded snapshot is deferred until they're needed, as it's slow for large ones
+            self._id_to_row = {self._row_id(row): row for row in range(len(self._row_to_key))}
+
+        rows: list[int] = []
+        for entry, vector in zip(entries, vectors, strict=True):
+            entry_id = entry.get_id()
+            row = self._id_to_row.get(entry_id)
+            if row is None:
+                row = len(self._row_to_key)
+                self._id_to_row[entry_id] = row
+                self._row_to_key.append(entry.key)
+                self._entries.append(entry)
+            self._vectors[row] = vector
+            self._squared_norms[row] = vector @ vector
+            self._entries[row] = entry
+            rows.append(row)
+
+        if self._centroids is not None:
+            # The new vectors are added to the inverted lists of the already trained index
+            self._assignments[rows] = self._nearest_centroids(vectors, self._centroids)
+            self._list_rows = None
 
     async def retrieve(self, vector: list[float], options: VectorStoreOptions | None = None) -> list[VectorStoreEntry]:
         """
@@ -47,22 +147,186 @@ class InMemoryVectorStore(VectorStore):
         Returns:
             The entries.
         """
+        return (await self.retrieve_many([vector], options))[0]
+
+    async def retrieve_many(
+        self, vectors: list[list[float]], options: VectorStoreOptions | None = None
+    ) -> list[list[VectorStoreEntry]]:
+        """
+        Retrieve entries for multiple query vectors at once, using a single matrix-matrix product.
+
+        Args:
+            vectors: The vectors to search for.
+            options: The options for querying the vector store.
+
+        Returns:
+            The entries for each of the vectors, in the order of the vectors.
+        """
         options = self._default_options if options is None else options
-        entries = sorted(
-            (
-                (entry, float(np.linalg.norm(np.array(entry.vector) - np.array(vector))))
-                for entry in self._storage.values()
-            ),
-            key=lambda x: x[1],
-        )
+        size = len(self._row_to_key)
+        if size == 0 or options.k <= 0 or not vectors:
+            return [[] for _ in vectors]
+
+        queries = np.asarray(vectors, dtype=np.float32)
+
+        if self.index == "ivf" and self._prepare_ivf(size):
+            n_probe = getattr(options, "n_probe", None) or self.n_probe
+            return [
+                self._rank(query, self._top_k(query, rows, options.k), options)
+                for query, rows in zip(queries, self._ivf_candidates(queries, n_probe), strict=True)
+            ]
+
+        # ||x - q||^2 = ||x||^2 - 2 * x.q + ||q||^2, the ||q||^2 term doesn't change the ranking
+        scores = self._squared_norms[:size] - 2 * (queries @ self._vectors[:size].T)
+        k = min(options.k, size)
+        if k < size:
+            candidates = np.argpartition(scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(size), (len(queries), size))
+
+        return [
+            self._rank(query, query_candidates, options)
+            for query, query_candidates in zip(queries, candidates, strict=True)
+        ]
+
+    def _top_k(self, query: np.ndarray, rows: np.ndarray, k: int) -> np.ndarray:
+        """
+        Selects the rows of the vectors closest to the query.
+
+        Args:
+            query: The query vector.
+            rows: The rows of the candidate vectors.
+            k: The number of rows to select.
+
+        Returns:
+            The selected rows, in no particular order.
+        """
+        if k >= len(rows):
+            return rows
+        scores = self._squared_norms[rows] - 2 * (self._vectors[rows] @ query)
+        return rows[np.argpartition(scores, k - 1)[:k]]
+
+    def _rank(self, query: np.ndarray, rows: np.ndarray, options: VectorStoreOptions) -> list[VectorStoreEntry]:
+        """
+        Sorts the candidate vectors by their distance to the query.
+
+        Args:
+            query: The query vector.
+            rows: The rows of the candidate vectors.
+            options: The options for querying the vector store.
+
+        Returns:
+            The entries of the candidates within the maximum distance, the closest first.
+        """
+        # The expanded form loses precision for close vectors, so the few candidates are re-scored exactly
+        distances = np.linalg.norm(self._vectors[rows] - query, axis=1)
+        order = np.lexsort((rows, distances))
+        return [
+            self._entry(rows[i], include_vector=options.include_vectors)
+            for i in order
+            if options.max_distance is None or distances[i] <= options.max_distance
+        ]
+
+    def _prepare_ivf(self, size: int) -> bool:
+        """
+        Makes sure the "ivf" index is trained and its inverted lists are up to date. The index is retrained
+        every time the number of vectors doubles, so that the centroids follow the data.
+
+        Args:
+            size: The number of stored vectors.
+
+        Returns:
+            Whether the index can be used, small collections are scanned exhaustively.
+        """
+        if size < self._MIN_IVF_SIZE:
+            return False
+
+        if self._centroids is None or size >= 2 * self._trained_size:
+            self._train_ivf(size)
+
+        if self._list_rows is None and self._centroids is not None:
+            assignments = self._assignments[:size]
+            self._list_rows = np.argsort(assignments, kind="stable")
+            self._list_bounds = np.searchsorted(assignments[self._list_rows], np.arange(len(self._centroids) + 1))
+        return True
+
+    def _train_ivf(self, size: int) -> None:
+        """
+        Clusters the vectors with k-means and assigns them to the inverted lists of the clusters.
+
+        Args:
+            size: The number of stored vectors.
+        """
+        n_lists = min(self.n_lists or max(1, int(np.sqrt(size))), size)
+        rng = np.random.default_rng(0)
+        sample_size = min(size, n_lists * self._KMEANS_SAMPLES_PER_LIST)
+        sample = self._vectors[np.sort(rng.choice(size, sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(self._KMEANS_ITERATIONS):
+            assignments = self._nearest_centroids(sample, centroids)
+            order = np.argsort(assignments, kind="stable")
+            lists, starts, counts = np.unique(assignments[order], return_index=True, return_counts=True)
+            # The empty clusters keep their previous centroids
+            centroids[lists] = np.add.reduceat(sample[order], starts) / counts[:, None]
+
+        self._centroids = centroids
+        self._assignments[:size] = self._nearest_centroids(self._vectors[:size], centroids)
+        self._trained_size = size
+        self._list_rows = None
+
+    def _ivf_candidates(self, queries: np.ndarray, n_probe: int) -> list[np.ndarray]:
+        """
+        Collects the rows of the vectors in the inverted lists closest to each of the queries.
+
+        Args:
+            queries: The query vectors.
+            n_probe: The number of inverted lists scanned per query.
+
+        Returns:
+            The rows of the candidate vectors for each of the queries.
+        """
+        if self._centroids is None or self._list_rows is None or self._list_bounds is None:
+            raise RuntimeError("The ivf index is not trained")
+
+        n_probe = min(n_probe, len(self._centroids))
+        scores = (self._centroids**2).sum(axis=1) - 2 * (queries @ self._centroids.T)
+        probes = np.argpartition(scores, n_probe - 1, axis=1)[:, :n_probe]
+        bounds = self._list_bounds
         return [
-            entry
-            for entry, distance in entries[: options.k]
-            if options.max_distance is None or distance <= options.max_distance
+            np.concatenate([self._list_rows[bounds[list_id] : bounds[list_id + 1]] for list_id in query_probes])
+            for query_probes in probes
         ]
 
+    @staticmethod
+    def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+        """
+        Finds the nearest centroid of each of the vectors.
+
+        Args:
+            vectors: The vectors.
+            centroids: The centroids.
+            chunk_size: The number of vectors processed at once, bounding the memory used by the distances.
+
+        Returns:
+            The indices of the nearest centroids.
+        """
+        squared_norms = (centroids**2).sum(axis=1)
+        return np.concatenate(
+            [
+                np.argmin(squared_norms - 2 * (vectors[start : start + chunk_size] @ centroids.T), axis=1)
+                for start in range(0, len(vectors), chunk_size)
+            ]
+            or [np.empty(0, dtype=np.int64)]
+        )
+
     async def list(
-        self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
+        self,
+        where: WhereQuery | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        *,
+        include_vectors: bool = True,
     ) -> list[VectorStoreEntry]:
         """
         List entries from the vector store. The entries can be filtered, limited and offset.
@@ -72,11 +336,14 @@ class InMemoryVectorStore(VectorStore):
                 Not specifying the key means no filtering.
             limit: The maximum number of entries to return.
             offset: The number of entries to skip.
+            include_vectors: Whether to return the vectors of the entries, if False the entries have empty vectors.
 
         Returns:
             The entries.
         """
-        entries = iter(self._storage.values())
+        entries: Iterator[VectorStoreEntry] = (
+            self._entry(row, include_vector=include_vectors) for row in range(len(self._row_to_key))
+        )
 
         if where:
             entries = (
@@ -90,3 +357,162 @@ class InMemoryVectorStore(VectorStore):
             entries = islice(entries, limit)
 
         return list(entries)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Saves a snapshot of the vector store to a directory. The vectors are saved as a float32 `.npy` matrix,
+        the keys, the IDs and the metadata of the entries in separate files, so that the snapshot can be loaded
+        without parsing the entries.
+
+        Args:
+            path: The path to the directory of the snapshot, created if it doesn't exist.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        size = len(self._row_to_key)
+
+        snapshot_metadata = self._snapshot_metadata.tobytes()
+        snapshot_offsets = self._snapshot_offsets.tolist()
+        metadata = [
+            snapshot_metadata[snapshot_offsets[row] : snapshot_offsets[row + 1]]
+            if entry is None
+            else _metadata_encoder.encode(entry.metadata).encode("utf-8")
+            for row, entry in enumerate(self._entries)
+        ]
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, metadata), dtype=np.int64, count=size), out=offsets[1:])
+
+        _save_array(path / "vectors.npy", self._vectors[:size])
+        _save_array(path / "squared_norms.npy", self._squared_norms[:size])
+        _save_array(path / "metadata.npy", np.frombuffer(b"".join(metadata), dtype=np.uint8))
+        _save_array(path / "metadata_offsets.npy", offsets)
+        ids = [self._snapshot_ids[row] if entry is None else entry.id for row, entry in enumerate(self._entries)]
+        (path / "ids.json.tmp").write_text(json.dumps(ids), encoding="utf-8")
+        os.replace(path / "ids.json.tmp", path / "ids.json")
+        (path / "keys.json.tmp").write_text(json.dumps(self._row_to_key), encoding="utf-8")
+        os.replace(path / "keys.json.tmp", path / "keys.json")
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        default_options: VectorStoreOptions | None = None,
+        metadata_store: MetadataStore | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> "InMemoryVectorStore":
+        """
+        Loads the vector store from a snapshot saved with `save`. The vectors and the metadata are memory-mapped,
+        so they are read from the disk only when they're queried, and copied into memory on the first write.
+
+        Args:
+            path: The path to the directory of the snapshot.
+            default_options: The default options for querying the vector store.
+            metadata_store: The metadata store to use.
+            **kwargs: The other arguments of the vector store, e.g. the index type.
+
+        Returns:
+            The loaded vector store.
+        """
+        path = Path(path)
+        store = cls(default_options=default_options, metadata_store=metadata_store, **kwargs)
+        store._row_to_key = json.loads((path / "keys.json").read_text(encoding="utf-8"))
+        store._entries = [None] * len(store._row_to_key)
+        store._snapshot_ids = json.loads((path / "ids.json").read_text(encoding="utf-8"))
+        store._vectors = np.load(path / "vectors.npy", mmap_mode="r")
+        store._squared_norms = np.load(path / "squared_norms.npy", mmap_mode="r")
+        store._assignments = np.zeros(len(store._row_to_key), dtype=np.int64)
+        store._snapshot_metadata = np.load(path / "metadata.npy", mmap_mode="r")
+        store._snapshot_offsets = np.load(path / "metadata_offsets.npy", mmap_mode="r")
+        return store
+
+    def _entry(self, row: int, *, include_vector: bool = True) -> VectorStoreEntry:
+        """
+        Returns the entry stored in the row, creating it from the snapshot if it's not created yet.
+
+        Args:
+            row: The row of the entry.
+            include_vector: Whether to return the vector of the entry, if False the entry has an empty vector.
+
+        Returns:
+            The entry.
+        """
+        entry = self._entries[row]
+        if entry is None:
+            metadata = self._snapshot_metadata[self._snapshot_offsets[row] : self._snapshot_offsets[row + 1]]
+            entry = VectorStoreEntry.model_construct(
+                key=self._row_to_key[row],
+                vector=self._vectors[row].tolist() if include_vector else [],
+                metadata=json.loads(metadata.tobytes()),
+                id=self._snapshot_ids[row],
+            )
+            if include_vector:
+                self._entries[row] = entry
+        elif not include_vector:
+            entry = VectorStoreEntry.model_construct(key=entry.key, vector=[], metadata=entry.metadata, id=entry.id)
+        return entry
+
+    def _row_id(self, row: int) -> str:
+        """
+        Returns the ID of the entry in the row, without creating the entry of a loaded snapshot.
+
+        Args:
+            row: The row of the entry.
+
+        Returns:
+            The ID of the entry.
+        """
+        entry = self._entries[row]
+        if entry is not None:
+            return entry.get_id()
+        return self._snapshot_ids[row] or sha256(self._row_to_key[row].encode("utf-8")).hexdigest()
+
+    def _ensure_capacity(self, size: int, dim: int) -> None:
+        """
+        Makes sure the vectors matrix can hold `size` rows, growing it geometrically if needed.
+
+        Args:
+            size: The number of rows the matrix has to fit.
+            dim: The dimension of the vectors.
+
+        Raises:
+            ValueError: If the dimension doesn't match the dimension of the already stored vectors.
+        """
+        if not self._row_to_key:
+            if self._vectors.shape[1] != dim:
+                self._vectors = np.empty((0, dim), dtype=np.float32)
+        elif self._vectors.shape[1] != dim:
+            raise ValueError(
+                f"Vector dimension {dim} doesn't match the dimension of the stored vectors {self._vectors.shape[1]}"
+            )
+
+        capacity = self._vectors.shape[0]
+        # The memory-mapped vectors of a loaded snapshot are read-only, so they're copied on the first write
+        if size <= capacity and self._vectors.flags.writeable:
+            return
+
+        new_capacity = max(size, 2 * capacity, self._INITIAL_CAPACITY)
+        vectors = np.empty((new_capacity, dim), dtype=np.float32)
+        squared_norms = np.empty(new_capacity, dtype=np.float32)
+        assignments = np.zeros(new_capacity, dtype=np.int64)
+        used = len(self._row_to_key)
+        vectors[:used] = self._vectors[:used]
+        squared_norms[:used] = self._squared_norms[:used]
+        assignments[:used] = self._assignments[:used]
+        self._vectors = vectors
+        self._squared_norms = squared_norms
+        self._assignments = assignments
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    """
+    Saves the array to a `.npy` file, replacing the file atomically, so that the arrays memory-mapped
+    from the previous version of the file stay valid.
+
+    Args:
+        path: The path to the file.
+        array: The array to save.
+    """
+    temporary_path = path.with_suffix(".tmp")
+    with open(temporary_path, "wb") as file:
+        np.save(file, array)
+    os.replace(temporary_path, path)
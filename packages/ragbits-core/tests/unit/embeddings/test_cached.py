@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from pathlib import Path
+
+from ragbits.core.embeddings import CachedEmbeddings, Embeddings, get_embeddings
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "test-model") -> None:
+        self.model = model
+        self.calls: list[list[str]] = []
+
+    async def embed_text(self, data: list[str]) -> list[list[float]]:
+        self.calls.append(data)
+        await asyncio.sleep(0)
+        return [[float(len(text)), 0.5] for text in data]
+
+
+async def test_embed_text_sends_only_cache_misses() -> None:
+    embeddings = CountingEmbeddings()
+    cached = CachedEmbeddings(embeddings)
+
+    first = await cached.embed_text(["a", "bb"])
+    second = await cached.embed_text(["ccc", "a", "ccc", "bb"])
+
+    assert first == [[1.0, 0.5], [2.0, 0.5]]
+    assert second == [[3.0, 0.5], [1.0, 0.5], [3.0, 0.5], [2.0, 0.5]]
+    assert embeddings.calls == [["a", "bb"], ["ccc"]]
+
+
+async def test_embed_text_evicts_least_recently_used() -> None:
+    embeddings = CountingEmbeddings()
+    cached = CachedEmbeddings(embeddings, max_size=2)
+
+    await cached.embed_text(["a", "bb"])
+    await cached.embed_text(["a"])
+    await cached.embed_text(["ccc"])
+    await cached.embed_text(["a", "bb"])
+
+    assert embeddings.calls == [["a", "bb"], ["ccc"], ["bb"]]
+
+
+async def test_embed_text_uses_disk_cache(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.db"
+    await CachedEmbeddings(CountingEmbeddings(), path=path).embed_text(["a", "bb"])
+
+    embeddings = CountingEmbeddings()
+    vectors = await CachedEmbeddings(embeddings, path=path).embed_text(["bb", "a"])
+
+    assert vectors == [[2.0, 0.5], [1.0, 0.5]]
+    assert embeddings.calls == []
+
+
+async def test_embed_text_separates_models(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.db"
+    await CachedEmbeddings(CountingEmbeddings(model="model-a"), path=path).embed_text(["a"])
+
+    embeddings = CountingEmbeddings(model="model-b")
+    await CachedEmbeddings(embeddings, path=path).embed_text(["a"])
+
+    assert embeddings.calls == [["a"]]
+
+
+def test_get_embeddings_with_cache() -> None:
+    embeddings = get_embeddings({"type": "NoopEmbeddings", "cache": {"max_size": 10}})
+
+    assert isinstance(embeddings, CachedEmbeddings)
+    assert embeddings.max_size == 10
+
+
+class LoadedModel:
+    def __repr__(self) -> str:
+        return "BertModel()"
+
+
+class LoadedModelEmbeddings(CountingEmbeddings):
+    def __init__(self, model_name: str) -> None:
+        super().__init__()
+        self.model_name = model_name
+        self.model = LoadedModel()  # type: ignore[assignment]
+
+
+async def test_namespace_separates_model_names(tmp_path: Path) -> None:
+    first = LoadedModelEmbeddings("first-checkpoint")
+    second = LoadedModelEmbeddings("second-checkpoint")
+
+    await CachedEmbeddings(first, path=tmp_path / "cache.db").embed_text(["a"])
+    await CachedEmbeddings(second, path=tmp_path / "cache.db").embed_text(["a"])
+
+    assert first.calls == [["a"]]
+    assert second.calls == [["a"]]
+
+
+async def test_concurrent_calls_embed_each_text_once(tmp_path: Path) -> None:
+    embeddings = CountingEmbeddings()
+    cached = CachedEmbeddings(embeddings, path=tmp_path / "embeddings.db")
+
+    results = await asyncio.gather(
+        cached.embed_text(["a", "bb"]),
+        cached.embed_text(["bb", "ccc"]),
+        cached.embed_text(["a", "ccc"]),
+    )
+
+    assert results == [[[1.0, 0.5], [2.0, 0.5]], [[2.0, 0.5], [3.0, 0.5]], [[1.0, 0.5], [3.0, 0.5]]]
+    assert embeddings.calls == [["a", "bb"], ["ccc"]]
+    assert cached._in_flight == {}
+
+
+async def test_disk_cache_runs_queries_off_the_event_loop(tmp_path: Path) -> None:
+    threads: set[str] = set()
+    cached = CachedEmbeddings(CountingEmbeddings(), path=tmp_path / "embeddings.db")
+    assert cached._connection is not None
+    cached._connection.set_trace_callback(lambda _: threads.add(threading.current_thread().name))
+
+    await cached.embed_text(["a", "bb"])
+
+    assert threads
+    assert all(name.startswith("ragbits-embeddings-cache") for name in threads)
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import litellm
+import pytest
+
+from ragbits.core.embeddings.exceptions import EmbeddingStatusError
+from ragbits.core.embeddings.litellm import LiteLLMEmbeddings
+
+
+def _embedding_response(*args, input: list[str], **kwargs) -> MagicMock:  # noqa: A002
+    return MagicMock(data=[{"embedding": [float(text), 0.0]} for text in input])
+
+
+async def test_embed_text_splits_data_into_batches() -> None:
+    embeddings = LiteLLMEmbeddings(batch_size=3)
+
+    with patch("litellm.aembedding", AsyncMock(side_effect=_embedding_response)) as aembedding:
+        vectors = await embeddings.embed_text([str(i) for i in range(8)])
+
+    assert vectors == [[float(i), 0.0] for i in range(8)]
+    assert [call.kwargs["input"] for call in aembedding.call_args_list] == [
+        ["0", "1", "2"],
+        ["3", "4", "5"],
+        ["6", "7"],
+    ]
+
+
+async def test_embed_text_limits_tokens_per_batch() -> None:
+    embeddings = LiteLLMEmbeddings(max_batch_tokens=2)
+
+    token_counter_threads = []
+
+    def token_counter(**_: object) -> int:
+        token_counter_threads.append(threading.current_thread().name)
+        return 1
+
+    with (
+        patch("litellm.token_counter", side_effect=token_counter),
+        patch("litellm.aembedding", AsyncMock(side_effect=_embedding_response)) as aembedding,
+    ):
+        await embeddings.embed_text([str(i) for i in range(5)])
+
+    assert [call.kwargs["input"] for call in aembedding.call_args_list] == [["0", "1"], ["2", "3"], ["4"]]
+    assert all(thread != threading.main_thread().name for thread in token_counter_threads)
+
+
+async def test_embed_text_retries_rate_limited_requests() -> None:
+    embeddings = LiteLLMEmbeddings(max_retries=2)
+    error = litellm.RateLimitError(message="Rate limited", llm_provider="openai", model="text-embedding-3-small")
+
+    with (
+        patch("asyncio.sleep", AsyncMock()) as sleep,
+        patch("litellm.aembedding", AsyncMock(side_effect=[error, error, _embedding_response(input=["1"])])),
+    ):
+        vectors = await embeddings.embed_text(["1"])
+
+    assert vectors == [[1.0, 0.0]]
+    assert sleep.call_count == 2
+
+
+async def test_embed_text_raises_after_max_retries() -> None:
+    embeddings = LiteLLMEmbeddings(max_retries=1)
+    error = litellm.RateLimitError(message="Rate limited", llm_provider="openai", model="text-embedding-3-small")
+
+    with (
+        patch("asyncio.sleep", AsyncMock()),
+        patch("litellm.aembedding", AsyncMock(side_effect=error)),
+        pytest.raises(EmbeddingStatusError) as exc,
+    ):
+        await embeddings.embed_text(["1"])
+
+    assert exc.value.status_code == 429
+
+
+async def test_embed_text_limits_concurrency_across_calls() -> None:
+    embeddings = LiteLLMEmbeddings(batch_size=1, max_concurrency=2)
+    running, max_running = 0, 0
+
+    async def aembedding(*args, input: list[str], **kwargs) -> MagicMock:  # noqa: A002
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return _embedding_response(input=input)
+
+    with patch("litellm.aembedding", AsyncMock(side_effect=aembedding)):
+        results = await asyncio.gather(*(embeddings.embed_text([str(i), str(i)]) for i in range(4)))
+
+    assert results == [[[float(i), 0.0], [float(i), 0.0]] for i in range(4)]
+    assert max_running == 2
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import torch
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from transformers import PreTrainedTokenizerFast
+
+from ragbits.core.embeddings.local import LocalEmbeddings
+
+
+def _mock_embeddings(
+    num_threads: int | None = None, padding_side: str = "right"
+) -> tuple[LocalEmbeddings, list[torch.Tensor], set[str]]:
+    batches = []
+    threads = set()
+
+    def tokenize(texts: list[str], **_: object) -> dict[str, list[list[int]]]:
+        return {
+            "input_ids": [[5] * len(text) for text in texts],
+            "attention_mask": [[1] * len(text) for text in texts],
+        }
+
+    def forward(input_ids: torch.Tensor, attention_mask: torch.Tensor) -> MagicMock:
+        batches.append(attention_mask)
+        threads.add(threading.current_thread().name)
+        # The pooled embedding of a text is [length, 1], so it identifies the text
+        lengths = attention_mask.sum(dim=1, keepdim=True).float()
+        hidden = torch.stack([lengths.expand_as(attention_mask), torch.ones_like(attention_mask)], dim=-1)
+        return MagicMock(last_hidden_state=hidden.float())
+
+    # The batches are padded by a real tokenizer, so that its padding side is respected
+    padding_tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=Tokenizer(WordLevel({"[PAD]": 0}, unk_token="[PAD]")),  # noqa: S106
+        pad_token="[PAD]",  # noqa: S106
+        padding_side=padding_side,
+        clean_up_tokenization_spaces=False,
+    )
+    tokenizer = MagicMock(side_effect=tokenize, model_max_length=512, pad=padding_tokenizer.pad)
+    model = MagicMock(side_effect=forward)
+    model.to.return_value = model
+
+    with (
+        patch("ragbits.core.embeddings.local.AutoModel.from_pretrained", return_value=model),
+        patch("ragbits.core.embeddings.local.AutoTokenizer.from_pretrained", return_value=tokenizer),
+    ):
+        embeddings = LocalEmbeddings("mock-model", batch_size=2, num_threads=num_threads)
+    embeddings.device = torch.device("cpu")
+    return embeddings, batches, threads
+
+
+def _expected_embedding(text: str) -> list[float]:
+    return torch.nn.functional.normalize(torch.tensor([[float(len(text)), 1.0]]), p=2, dim=1)[0].tolist()
+
+
+async def test_local_embeddings_batches_texts_by_length():
+    """Tests that the texts of similar length are embedded together and returned in the original order."""
+    embeddings, batches, _ = _mock_embeddings()
+    texts = ["aaaaa", "a", "aaaa", "aa", "aaa"]
+
+    result = await embeddings.embed_text(texts)
+
+    assert [tuple(batch.shape) for batch in batches] == [(2, 2), (2, 4), (1, 5)]
+    assert result == [_expected_embedding(text) for text in texts]
+
+
+@pytest.mark.parametrize("padding_side", ["right", "left"])
+async def test_local_embeddings_pad_on_padding_side_of_tokenizer(padding_side: str):
+    """Tests that the batches are padded on the padding side of the tokenizer."""
+    embeddings, batches, _ = _mock_embeddings(padding_side=padding_side)
+
+    result = await embeddings.embed_text(["a", "aa"])
+
+    mask = [0, 1] if padding_side == "left" else [1, 0]
+    assert batches[0].tolist() == [mask, [1, 1]]
+    assert result == [_expected_embedding("a"), _expected_embedding("aa")]
+
+
+async def test_local_embeddings_run_in_worker_thread():
+    """Tests that the inference runs in the worker thread, where the number of torch threads is set."""
+    with patch("ragbits.core.embeddings.local.torch.set_num_threads") as set_num_threads:
+        embeddings, _, threads = _mock_embeddings(num_threads=2)
+        set_num_threads.assert_not_called()
+
+        await asyncio.gather(embeddings.embed_text(["a", "bb"]), embeddings.embed_text(["ccc"]))
+
+    assert len(threads) == 1
+    assert threads.pop().startswith("ragbits-local-embeddings")
+    set_num_threads.assert_called_once_with(2)
+
+
+async def test_local_embeddings_empty_input():
+    """Tests that the model isn't called for an empty input."""
+    embeddings, batches, _ = _mock_embeddings()
+
+    assert await embeddings.embed_text([]) == []
+    assert batches == []
+
+
+async def test_local_embeddings_aclose_shuts_down_worker_thread():
+    """Tests that closing the embeddings shuts down the worker thread."""
+    embeddings, _, _ = _mock_embeddings()
+    await embeddings.embed_text(["a"])
+
+    await embeddings.aclose()
+
+    with pytest.raises(RuntimeError):
+        await embeddings.embed_text(["a"])
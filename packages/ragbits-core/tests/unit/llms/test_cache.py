@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from ragbits.core.llms import get_llm
+from ragbits.core.llms.cache import InMemoryLLMCache, SQLiteLLMCache
+from ragbits.core.llms.clients.litellm import LiteLLMOptions
+from ragbits.core.llms.litellm import LiteLLM
+from ragbits.core.prompt import Prompt
+
+
+class MockPrompt(Prompt):
+    """A static prompt."""
+
+    user_prompt = "Hello, how are you?"
+
+
+async def test_llm_cache_returns_cached_responses():
+    """Tests that the identical requests are sent to the LLM only once."""
+    cache = InMemoryLLMCache()
+    llm = LiteLLM(api_key="test_key", cache=cache)
+    options = LiteLLMOptions(mock_response="I'm fine, thank you.")
+
+    with patch.object(llm.client, "call", wraps=llm.client.call) as call:
+        first = await llm.generate_raw(MockPrompt(), options=options)
+        second = await llm.generate_raw(MockPrompt(), options=options)
+        third = await llm.generate_raw(MockPrompt(), options=LiteLLMOptions(mock_response="Great!"))
+
+    assert (first, second, third) == ("I'm fine, thank you.", "I'm fine, thank you.", "Great!")
+    assert call.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_llm_cache_deduplicates_in_flight_requests():
+    """Tests that the identical concurrent requests wait for a single LLM call."""
+    cache = InMemoryLLMCache()
+    calls = 0
+
+    async def generate() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "response"
+
+    responses = await asyncio.gather(*(cache.get_or_generate("key", generate) for _ in range(5)))
+
+    assert responses == ["response"] * 5
+    assert calls == 1
+    assert (cache.hits, cache.misses) == (4, 1)
+
+
+async def test_in_memory_llm_cache_expires_and_evicts_responses():
+    """Tests that the in-memory cache drops the expired and least recently used responses."""
+    cache = InMemoryLLMCache(max_size=2)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    await cache.get("a")
+    await cache.set("c", "3")
+
+    assert [await cache.get(key) for key in "abc"] == ["1", None, "3"]
+
+    cache.ttl = 0
+    assert await cache.get("a") is None
+
+
+async def test_sqlite_llm_cache_persists_responses(tmp_path: Path):
+    """Tests that the SQLite cache shares the responses between instances."""
+    await SQLiteLLMCache(tmp_path / "cache.db").set("key", "response")
+
+    assert await SQLiteLLMCache(tmp_path / "cache.db").get("key") == "response"
+    assert await SQLiteLLMCache(tmp_path / "cache.db", ttl=-1).get("key") is None
+
+
+async def test_sqlite_cache_runs_queries_off_the_event_loop(tmp_path: Path):
+    """Tests that the SQLite queries run in the worker thread of the cache."""
+    threads: set[str] = set()
+    cache = SQLiteLLMCache(tmp_path / "cache.db")
+    cache._connection.set_trace_callback(lambda _: threads.add(threading.current_thread().name))
+
+    await cache.set("key", "response")
+    assert await cache.get("key") == "response"
+
+    assert threads
+    assert all(name.startswith("ragbits-llm-cache") for name in threads)
+
+
+def test_get_llm_with_cache():
+    """Tests that the cache is created from the LLM configuration."""
+    llm = get_llm(
+        {
+            "type": "ragbits.core.llms.litellm:LiteLLM",
+            "config": {"api_key": "test_key"},
+            "cache": {"type": "InMemoryLLMCache", "config": {"max_size": 10}},
+        }
+    )
+
+    assert isinstance(llm.cache, InMemoryLLMCache)
+    assert llm.cache.max_size == 10
@@ -1,6 +1,13 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import litellm
+import pytest
 from pydantic import BaseModel
 
-from ragbits.core.llms.clients.litellm import LiteLLMOptions
+from ragbits.core.llms.clients.exceptions import LLMStatusError
+from ragbits.core.llms.clients.litellm import LiteLLMClient, LiteLLMOptions, get_model_capabilities
 from ragbits.core.llms.litellm import LiteLLM
 from ragbits.core.prompt import Prompt
 from ragbits.core.prompt.base import BasePrompt, BasePromptWithParser, ChatFormat
@@ -141,3 +148,138 @@ async def test_generation_with_pydantic_output():
     output = await llm.generate(prompt, options=options)
     assert output.response == "I'm fine, thank you."
     assert output.happiness == 100
+
+
+async def test_generation_streaming():
+    """Test streaming generation of a response."""
+    llm = LiteLLM(api_key="test_key")
+    prompt = MockPrompt("Hello, how are you?")
+    options = LiteLLMOptions(mock_response="I'm fine, thank you.")
+    chunks = [chunk async for chunk in llm.generate_streaming(prompt, options=options)]
+    assert len(chunks) > 1
+    assert "".join(chunks) == "I'm fine, thank you."
+
+
+def _rate_limit_error(retry_after: str | None = None) -> litellm.RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = httpx.Response(429, headers=headers, request=httpx.Request("POST", "https://api.openai.com"))
+    return litellm.RateLimitError(message="Rate limited", llm_provider="openai", model="gpt-4o", response=response)
+
+
+async def test_call_retries_rate_limited_requests_honoring_retry_after():
+    """Test that the throttled requests are retried after the delay requested by the API."""
+    client = LiteLLMClient("gpt-4o", max_retries=2)
+    completion = MagicMock()
+    completion.choices[0].message.content = "I'm fine, thank you."
+
+    with (
+        patch("asyncio.sleep", AsyncMock()) as sleep,
+        patch("litellm.acompletion", AsyncMock(side_effect=[_rate_limit_error("7"), completion])),
+    ):
+        response = await client.call([{"role": "user", "content": "Hello"}], LiteLLMOptions())
+
+    assert response == "I'm fine, thank you."
+    assert 7 <= sleep.call_args.args[0] <= 8
+
+
+async def test_call_raises_after_max_retries():
+    """Test that the throttling error is raised when the retries are exhausted."""
+    client = LiteLLMClient("gpt-4o", max_retries=1, max_concurrency=4, base_url="https://test-max-retries")
+
+    with (
+        patch("asyncio.sleep", AsyncMock()) as sleep,
+        patch("litellm.acompletion", AsyncMock(side_effect=_rate_limit_error())),
+        pytest.raises(LLMStatusError) as exc_info,
+    ):
+        await client.call([{"role": "user", "content": "Hello"}], LiteLLMOptions())
+
+    assert exc_info.value.status_code == 429
+    assert sleep.call_count == 1
+    concurrency_limiter = client._get_concurrency_limiter()
+    assert concurrency_limiter is not None
+    assert concurrency_limiter.limit == 2
+
+
+async def test_clients_of_the_same_model_share_limiters():
+    """Test that the limiters are shared per model and base URL."""
+    first = LiteLLMClient("gpt-4o", requests_per_minute=10, max_concurrency=4, base_url="https://test-shared")
+    second = LiteLLMClient("gpt-4o", requests_per_minute=10, max_concurrency=4, base_url="https://test-shared")
+    other = LiteLLMClient("gpt-4o", requests_per_minute=10, max_concurrency=4, base_url="https://test-other")
+
+    assert first._get_rate_limiter() is second._get_rate_limiter() is not other._get_rate_limiter()
+    assert first._get_concurrency_limiter() is second._get_concurrency_limiter() is not other._get_concurrency_limiter()
+
+
+def test_limiters_are_not_shared_between_event_loops():
+    """Test that each event loop gets its own limiters, as their asyncio primitives are bound to the loop."""
+    client = LiteLLMClient("gpt-4o", requests_per_minute=10, max_concurrency=1, base_url="https://test-loops")
+    completion = MagicMock()
+    completion.choices[0].message.content = "I'm fine, thank you."
+
+    async def call() -> tuple[object, object]:
+        await asyncio.gather(*(client.call([{"role": "user", "content": "Hello"}], LiteLLMOptions()) for _ in range(2)))
+        return client._get_rate_limiter(), client._get_concurrency_limiter()
+
+    with patch("litellm.acompletion", AsyncMock(return_value=completion)):
+        first_limiters = asyncio.run(call())
+        second_limiters = asyncio.run(call())
+
+    assert first_limiters[0] is not second_limiters[0]
+    assert first_limiters[1] is not second_limiters[1]
+
+
+def test_conflicting_limits_warn():
+    """Test that a client passing limits different from the shared ones gets a warning and the shared limits."""
+    LiteLLMClient("gpt-4o", requests_per_minute=10, base_url="https://test-conflict")
+
+    with pytest.warns(UserWarning, match="already set"):
+        client = LiteLLMClient("gpt-4o", requests_per_minute=20, base_url="https://test-conflict")
+
+    assert client._limits == (10, None, None)
+
+
+async def test_model_capabilities_are_resolved_once():
+    """Test that the capabilities of the model are looked up once, not on every call."""
+    get_model_capabilities.cache_clear()
+    llm = LiteLLM("gpt-4o-mini", api_key="test_key")
+    options = LiteLLMOptions(mock_response="I'm fine, thank you.")
+
+    for _ in range(3):
+        await llm.generate(MockPrompt("Hello, how are you?"), options=options)
+    another_llm = LiteLLM("gpt-4o-mini", api_key="test_key")
+    await another_llm.generate(MockPrompt("Hello, how are you?"), options=options)
+
+    assert get_model_capabilities.cache_info().misses == 1
+    assert get_model_capabilities.cache_info().hits == 1
+    assert llm.client.capabilities.supports_response_format
+    assert llm.client.capabilities.supports_vision
+
+
+async def test_generation_batch_returns_results_in_order_with_errors():
+    """Test batch generation of responses with per-prompt errors."""
+    llm = LiteLLM(api_key="test_key")
+    running = max_running = 0
+
+    async def call(conversation: ChatFormat, **_: object) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if conversation[0]["content"] == "fail":
+            raise LLMStatusError("Bad request", 400)
+        return conversation[0]["content"].upper()
+
+    progress = []
+    with patch.object(llm.client, "call", side_effect=call):
+        results = await llm.generate_batch(
+            [MockPrompt(message) for message in ["a", "fail", "b", "c"]],
+            max_concurrency=2,
+            progress_callback=lambda processed, total: progress.append((processed, total)),
+        )
+
+    assert results[0] == "A"
+    assert isinstance(results[1], LLMStatusError)
+    assert results[2:] == ["B", "C"]
+    assert max_running == 2
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
@@ -0,0 +1,73 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import torch
+
+from ragbits.core.llms.clients.local import LocalLLMClient, LocalLLMOptions
+
+
+def _mock_client(max_batch_size: int) -> tuple[LocalLLMClient, list[int]]:
+    batch_sizes = []
+
+    def generate(input_ids: torch.Tensor, **_: object) -> torch.Tensor:
+        batch_sizes.append(len(input_ids))
+        # The "response" is the number of the non-padding tokens of the conversation
+        lengths = (input_ids != 0).sum(dim=1, keepdim=True)
+        return torch.cat([input_ids, lengths], dim=1)
+
+    tokenizer = MagicMock(pad_token_id=0, eos_token_id=1)
+    tokenizer.apply_chat_template.side_effect = lambda conversation, **_: [5] * len(conversation[0]["content"])
+    tokenizer.decode.side_effect = lambda tokens, **_: str(tokens.tolist())
+    model = MagicMock(device="cpu")
+    model.generate.side_effect = generate
+
+    with (
+        patch("ragbits.core.llms.clients.local.AutoModelForCausalLM.from_pretrained", return_value=model),
+        patch("ragbits.core.llms.clients.local.AutoTokenizer.from_pretrained", return_value=tokenizer),
+    ):
+        client = LocalLLMClient("mock-model", max_batch_size=max_batch_size)
+    return client, batch_sizes
+
+
+async def test_local_llm_client_batches_concurrent_calls():
+    """Tests that the concurrent calls are generated together in left-padded batches."""
+    client, batch_sizes = _mock_client(max_batch_size=3)
+    conversations = [[{"role": "user", "content": "a" * length}] for length in range(1, 6)]
+
+    responses = await asyncio.gather(*(client.call(conversation, LocalLLMOptions()) for conversation in conversations))
+
+    assert responses == [str([length]) for length in range(1, 6)]
+    assert batch_sizes == [3, 2]
+    await client.aclose()
+
+
+async def test_local_llm_client_does_not_batch_calls_with_different_options():
+    """Tests that the calls with different options are generated in separate batches."""
+    client, batch_sizes = _mock_client(max_batch_size=4)
+    conversation = [{"role": "user", "content": "abc"}]
+
+    responses = await asyncio.gather(
+        client.call(conversation, LocalLLMOptions(temperature=0.1)),
+        client.call(conversation, LocalLLMOptions(temperature=0.5)),
+        client.call(conversation, LocalLLMOptions(temperature=0.1)),
+    )
+
+    assert responses == [str([3])] * 3
+    assert sorted(batch_sizes) == [1, 2]
+    await client.aclose()
+
+
+async def test_local_llm_client_worker_exits_when_idle():
+    """Tests that the batching worker exits once the calls are done and is started again for the next ones."""
+    client, batch_sizes = _mock_client(max_batch_size=2)
+    conversation = [{"role": "user", "content": "ab"}]
+
+    assert await client.call(conversation, LocalLLMOptions()) == str([2])
+    await asyncio.sleep(0)
+    assert client._worker is not None
+    assert client._worker.done()
+
+    assert await client.call(conversation, LocalLLMOptions()) == str([2])
+    assert batch_sizes == [1, 1]
+    await client.aclose()
+    assert client._executor._shutdown
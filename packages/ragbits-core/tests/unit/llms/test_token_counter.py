@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import litellm
+from pydantic import BaseModel
+
+from ragbits.core.llms.clients.litellm import get_model_capabilities
+from ragbits.core.llms.litellm import LiteLLM
+from ragbits.core.llms.token_counter import TokenCounter
+from ragbits.core.prompt import Prompt
+
+
+def test_token_counter_counts_repeated_texts_once():
+    """Tests that the repeated texts are tokenized only once."""
+    tokenized = []
+
+    def count_many(texts: list[str]) -> list[int]:
+        tokenized.append(texts)
+        return [len(text.split()) for text in texts]
+
+    counter = TokenCounter(count_many, max_size=2)
+
+    assert counter.count_many(["a b", "c", "a b"]) == [2, 1, 2]
+    assert counter.count_conversation([{"role": "system", "content": "a b"}, {"role": "user", "content": "d e f"}]) == 5
+    assert counter.count("c") == 1
+    assert tokenized == [["a b", "c"], ["d e f"], ["c"]]
+
+
+def test_litellm_count_tokens_many():
+    """Tests that the prompts sharing messages are counted correctly, tokenizing the distinct messages in one batch."""
+
+    class QuestionInput(BaseModel):
+        """Input of the prompt."""
+
+        number: int
+
+    class SystemPrompt(Prompt[QuestionInput]):
+        """A prompt with a long system message."""
+
+        system_prompt = "You are a helpful assistant answering the questions of the user."
+        user_prompt = "Question {{ number }}"
+
+    llm = LiteLLM("gpt-4o", api_key="test_key")
+    prompts = [SystemPrompt(QuestionInput(number=number)) for number in range(3)]
+    expected = [
+        sum(litellm.token_counter(model="gpt-4o", text=message["content"]) for message in prompt.chat)
+        for prompt in prompts
+    ]
+
+    tokenizer = get_model_capabilities("gpt-4o").tokenizer
+
+    with patch.object(tokenizer, "count_many", wraps=tokenizer.count_many) as count_many:
+        assert llm.count_tokens_many(prompts) == expected
+        assert llm.count_tokens(prompts[0]) == expected[0]
+
+    assert count_many.call_count == 1
+    assert len(count_many.call_args.args[0]) == 4
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from ragbits.core.metadata_stores import get_metadata_store
+from ragbits.core.metadata_stores.exceptions import MetadataNotFoundError
+from ragbits.core.metadata_stores.sqlite import SQLiteMetadataStore
+from ragbits.core.vector_stores.base import VectorStoreEntry
+from ragbits.document_search.documents.document import DocumentMeta, DocumentType
+from ragbits.document_search.documents.element import Element, TextElement
+from ragbits.document_search.documents.sources import LocalFileSource
+
+
+@pytest.fixture
+def metadata_store(tmp_path: Path) -> SQLiteMetadataStore:
+    return SQLiteMetadataStore(tmp_path / "metadata.db")
+
+
+async def test_get(metadata_store: SQLiteMetadataStore) -> None:
+    ids = ["id1", "id2"]
+    metadatas = [{"key1": "value1"}, {"key2": ["value2"]}]
+    await metadata_store.store(ids, metadatas)
+    result = await metadata_store.get(["id2", "id1", "id2"])
+    assert result == [{"key2": ["value2"]}, {"key1": "value1"}, {"key2": ["value2"]}]
+
+
+async def test_store_overwrites_existing_id(metadata_store: SQLiteMetadataStore) -> None:
+    await metadata_store.store(["id1"], [{"key1": "value1"}])
+    await metadata_store.store(["id1"], [{"key1": "value2"}])
+    assert await metadata_store.get(["id1"]) == [{"key1": "value2"}]
+
+
+async def test_get_many(metadata_store: SQLiteMetadataStore) -> None:
+    ids = [f"id{i}" for i in range(2500)]
+    await metadata_store.store(ids, [{"i": i} for i in range(2500)])
+    assert await metadata_store.get(ids) == [{"i": i} for i in range(2500)]
+
+
+async def test_get_metadata_not_found(metadata_store: SQLiteMetadataStore) -> None:
+    await metadata_store.store(["id1"], [{"key1": "value1"}])
+    with pytest.raises(MetadataNotFoundError) as exc_info:
+        await metadata_store.get(["id1", "id2"])
+    assert exc_info.value.id == "id2"
+
+
+async def test_metadata_persists(tmp_path: Path) -> None:
+    await SQLiteMetadataStore(tmp_path / "metadata.db").store(["id1"], [{"key1": "value1"}])
+    metadata_store = get_metadata_store(
+        {"type": "SQLiteMetadataStore", "config": {"path": str(tmp_path / "metadata.db")}}
+    )
+    assert isinstance(metadata_store, SQLiteMetadataStore)
+    assert await metadata_store.get(["id1"]) == [{"key1": "value1"}]
+
+
+async def test_store_element_metadata(metadata_store: SQLiteMetadataStore) -> None:
+    element = TextElement(
+        content="test content",
+        document_meta=DocumentMeta(document_type=DocumentType.TXT, source=LocalFileSource(path=Path("test.txt"))),
+    )
+    metadata = element.to_vector_db_entry([0.1, 0.2]).metadata
+
+    await metadata_store.store(["id1"], [metadata])
+
+    result = await metadata_store.get(["id1"])
+    assert Element.from_vector_db_entry(VectorStoreEntry(key="test content", vector=[], metadata=result[0])) == element
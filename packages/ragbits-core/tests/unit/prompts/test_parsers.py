@@ -1,9 +1,11 @@
 import re
+from collections.abc import AsyncGenerator
 
+import pydantic
 import pytest
 
 from ragbits.core.prompt import Prompt
-from ragbits.core.prompt.parsers import ResponseParsingError
+from ragbits.core.prompt.parsers import PydanticStreamParser, ResponseParsingError, parse_pydantic_stream
 
 from .test_prompt import _PromptOutput
 
@@ -154,3 +156,96 @@ def test_prompt_with_unknown_output_and_custom_parser():
     prompt = TestPrompt()
     assert prompt.parse_response("Hello World") == ["Hello", "World"]
     assert prompt.parse_response("Hello") == ["Hello"]
+
+
+async def test_pydantic_stream_parser_yields_partial_models():
+    """Test parsing a streamed response to partial models."""
+
+    class Queries(pydantic.BaseModel):
+        """Output with a list of queries."""
+
+        queries: list[str]
+        count: int
+
+    async def chunks() -> AsyncGenerator[str, None]:
+        for chunk in ['{"quer', 'ies": ["first', ' query", "second', ' query"], ', '"count": 2}']:
+            yield chunk
+
+    results = [result async for result in parse_pydantic_stream(Queries, chunks())]
+
+    assert [result.queries for result in results[:-1]] == [
+        [],
+        ["first query"],
+        ["first query", "second query"],
+        ["first query", "second query"],
+    ]
+    assert "count" not in results[2].model_fields_set
+    assert results[3].count == 2
+    assert results[-1] == Queries(queries=["first query", "second query"], count=2)
+
+
+def test_pydantic_stream_parser_skips_unfinished_values():
+    """Test that the values split across chunks are returned only once they're complete."""
+
+    class Output(pydantic.BaseModel):
+        """Output with scalar values."""
+
+        count: int
+        valid: bool
+        name: str
+
+    parser = PydanticStreamParser(Output)
+
+    assert parser.feed('{"count": 2') is None
+    result = parser.feed('3, "valid": tr')
+    assert result is not None
+    assert result.count == 23
+    assert parser.feed("ue") is None
+    result = parser.feed(', "name": "a, \\"b')
+    assert result is not None
+    assert result.valid is True
+    assert "name" not in result.model_fields_set
+    result = parser.feed('\\""}')
+    assert result is not None
+    assert result.name == 'a, "b"'
+
+
+def test_pydantic_stream_parser_yields_partial_nested_values():
+    """Test that the complete items of the lists and the fields of the nested models are returned early."""
+
+    class Query(pydantic.BaseModel):
+        """A query with its weight."""
+
+        text: str
+        weight: float
+
+    class Output(pydantic.BaseModel):
+        """Output with nested models."""
+
+        best: Query
+        queries: list[Query]
+
+    parser = PydanticStreamParser(Output)
+
+    result = parser.feed('```json\n{"best": {"text": "a", "weight"')
+    assert result is not None
+    assert result.best.text == "a"
+    assert "weight" not in result.best.model_fields_set
+    result = parser.feed(': 1.0}, "queries": [{"text": "b", "weight": 0.5}, {"text": "c"')
+    assert result is not None
+    assert result.best == Query(text="a", weight=1.0)
+    assert result.queries == [Query(text="b", weight=0.5)]
+    result = parser.feed(', "weight": 0.2}]}\n```')
+    assert result is not None
+    assert result.queries == [Query(text="b", weight=0.5), Query(text="c", weight=0.2)]
+
+
+def test_pydantic_stream_parser_raises_on_invalid_response():
+    """Test that the complete streamed response is validated."""
+    parser = PydanticStreamParser(_PromptOutput)
+
+    assert parser.feed('{"song_title": "Hello", ') is not None
+    parser.feed('"song_lyrics": 1}')
+
+    with pytest.raises(ResponseParsingError):
+        parser.close()
@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pydantic
 import pytest
@@ -435,3 +436,66 @@ def test_two_instances_do_not_share_few_shots():
         {"role": "assistant", "content": "Why do I know all the words?"},
         {"role": "user", "content": "Theme for the song is rock."},
     ]
+
+
+def test_chat_is_memoized_and_copied():
+    """
+    Test that the chat is rendered once per prompt and the callers can't modify it.
+    """
+
+    class TestPrompt(Prompt[_PromptInput, str]):  # pylint: disable=unused-variable
+        """A test prompt"""
+
+        user_prompt = "Theme for the song is {{ theme }}."
+        few_shots = [(_PromptInput(name="John", age=15, theme="pop"), "Why do I know all the words?")]
+
+    prompt = TestPrompt(_PromptInput(name="Alice", age=30, theme="rock"))
+    prompt.chat.append({"role": "user", "content": "Not a part of the prompt."})
+    prompt.chat[0]["content"] = "Not a part of the prompt."
+
+    with patch.object(TestPrompt, "_render_few_shots", wraps=TestPrompt._render_few_shots) as render_few_shots:
+        assert prompt.chat == [
+            {"role": "user", "content": "Theme for the song is pop."},
+            {"role": "assistant", "content": "Why do I know all the words?"},
+            {"role": "user", "content": "Theme for the song is rock."},
+        ]
+    assert render_few_shots.call_count == 0
+
+    prompt.add_few_shot("Theme for the song is 90s pop.", "I can't stop dancing.")
+    assert len(prompt.chat) == 5
+
+
+def test_class_few_shots_changed_after_definition_are_used():
+    """
+    Test that the few shots assigned to the prompt class after it's defined are used by the new prompts.
+    """
+
+    class TestPrompt(Prompt[_PromptInput, str]):  # pylint: disable=unused-variable
+        """A test prompt"""
+
+        user_prompt = "Theme for the song is {{ theme }}."
+        few_shots = [(_PromptInput(name="John", age=15, theme="pop"), "Why do I know all the words?")]
+
+    TestPrompt.few_shots = [(_PromptInput(name="John", age=15, theme="jazz"), "Take five.")]
+    prompt = TestPrompt(_PromptInput(name="Alice", age=30, theme="rock"))
+
+    assert prompt.chat == [
+        {"role": "user", "content": "Theme for the song is jazz."},
+        {"role": "assistant", "content": "Take five."},
+        {"role": "user", "content": "Theme for the song is rock."},
+    ]
+
+
+def test_prompt_is_not_html_escaped():
+    """
+    Test that the rendered prompts are not escaped as HTML.
+    """
+
+    class TestPrompt(Prompt[_PromptInput, str]):  # pylint: disable=unused-variable
+        """A test prompt"""
+
+        user_prompt = "Theme for the song is {{ theme }}."
+
+    prompt = TestPrompt(_PromptInput(name="Alice", age=30, theme="<rock & 'roll'>"))
+
+    assert prompt.chat == [{"role": "user", "content": "Theme for the song is <rock & 'roll'>."}]
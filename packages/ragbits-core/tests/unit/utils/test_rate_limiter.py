@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+from ragbits.core.utils.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter
+
+
+async def test_rate_limiter_without_limits_does_not_wait() -> None:
+    limiter = RateLimiter()
+
+    start = time.monotonic()
+    for _ in range(100):
+        await limiter.acquire(tokens=1000)
+
+    assert time.monotonic() - start < 0.05
+
+
+async def test_rate_limiter_waits_for_requests_budget() -> None:
+    limiter = RateLimiter(requests_per_minute=600)
+
+    for _ in range(600):
+        await limiter.acquire()
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_rate_limiter_waits_for_tokens_budget() -> None:
+    limiter = RateLimiter(tokens_per_minute=600)
+
+    await limiter.acquire(tokens=600)
+    start = time.monotonic()
+    await limiter.acquire(tokens=2)
+
+    assert time.monotonic() - start >= 0.19
+
+
+async def test_adaptive_concurrency_limiter_halves_and_regrows_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, cooldown=0)
+
+    limiter.decrease()
+    limiter.decrease()
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        limiter.increase()
+    assert 4 < limiter.limit < 6
+
+    for _ in range(100):
+        limiter.increase()
+    assert limiter.limit == 8
+
+
+async def test_adaptive_concurrency_limiter_limits_running_requests() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    limiter.decrease()
+    running = max_running = 0
+
+    async def _request() -> None:
+        nonlocal running, max_running
+        async with limiter:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(_request() for _ in range(10)))
+
+    assert max_running == 2
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import chromadb
+import numpy as np
 import pytest
 
 from ragbits.core.vector_stores.base import VectorStoreEntry, VectorStoreOptions
@@ -37,8 +39,8 @@ async def test_store(mock_chromadb_store: ChromaVectorStore) -> None:
 
     await mock_chromadb_store.store(data)
 
-    mock_chromadb_store._client.get_or_create_collection().add.assert_called_once()  # type: ignore
-    mock_chromadb_store._client.get_or_create_collection().add.assert_called_with(  # type: ignore
+    mock_chromadb_store._client.get_or_create_collection().upsert.assert_called_once()  # type: ignore
+    mock_chromadb_store._client.get_or_create_collection().upsert.assert_called_with(  # type: ignore
         ids=["92488e1e3eeecdf99f3ed2ce59233efb4b4fb612d5655c0ce9ea52b5a502e655"],
         embeddings=[[0.1, 0.2, 0.3]],
         metadatas=[
@@ -125,3 +127,101 @@ async def test_list(mock_chromadb_store: ChromaVectorStore) -> None:
     assert entries[1].metadata["content"] == "test content 2"
     assert entries[1].metadata["document"]["title"] == "test title 2"
     assert entries[1].vector == [0.13, 0.26, 0.30]
+
+
+async def test_retrieve_many(mock_chromadb_store: ChromaVectorStore) -> None:
+    vectors = [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]]
+    mock_collection = mock_chromadb_store._get_chroma_collection()
+    mock_collection.query.return_value = {  # type: ignore
+        "metadatas": [
+            [{"__metadata": '{"content": "test content 1"}'}],
+            [{"__metadata": '{"content": "test content 2"}'}, {"__metadata": '{"content": "test content 3"}'}],
+        ],
+        "embeddings": [[[0.12, 0.25, 0.29]], [[0.29, 0.25, 0.12], [0.30, 0.26, 0.13]]],
+        "distances": [[0.1], [0.1, 0.2]],
+        "documents": [["test_key_1"], ["test_key_2", "test_key_3"]],
+        "ids": [["test_id_1"], ["test_id_2", "test_id_3"]],
+    }
+
+    results = await mock_chromadb_store.retrieve_many(vectors)
+
+    mock_collection.query.assert_called_once()  # type: ignore
+    assert mock_collection.query.call_args.kwargs["query_embeddings"] == vectors  # type: ignore
+    assert [[entry.key for entry in entries] for entries in results] == [
+        ["test_key_1"],
+        ["test_key_2", "test_key_3"],
+    ]
+
+
+async def test_list_numpy_embeddings(mock_chromadb_store: ChromaVectorStore) -> None:
+    mock_collection = mock_chromadb_store._get_chroma_collection()
+    mock_collection.get.return_value = {  # type: ignore
+        "metadatas": [{"__metadata": '{"content": "test content"}'}],
+        "embeddings": [np.array([0.5, 0.25, 0.125], dtype=np.float32)],
+        "documents": ["test_key"],
+        "ids": ["test_id_1"],
+    }
+
+    entries = await mock_chromadb_store.list()
+
+    assert entries[0].vector == [0.5, 0.25, 0.125]
+    assert all(type(value) is float for value in entries[0].vector)
+
+
+async def test_list_without_vectors(mock_chromadb_store: ChromaVectorStore) -> None:
+    mock_collection = mock_chromadb_store._get_chroma_collection()
+    mock_collection.get.return_value = {  # type: ignore
+        "metadatas": [{"__metadata": '{"content": "test content"}'}],
+        "embeddings": None,
+        "documents": ["test_key"],
+        "ids": ["test_id_1"],
+    }
+
+    entries = await mock_chromadb_store.list(include_vectors=False)
+
+    assert "embeddings" not in mock_collection.get.call_args.kwargs["include"]  # type: ignore
+    assert entries[0].key == "test_key"
+    assert entries[0].vector == []
+
+
+async def test_retrieve_without_vectors(mock_chromadb_store: ChromaVectorStore) -> None:
+    mock_collection = mock_chromadb_store._get_chroma_collection()
+    mock_collection.query.return_value = {  # type: ignore
+        "metadatas": [[{"__metadata": '{"content": "test content"}'}]],
+        "embeddings": None,
+        "distances": [[0.1]],
+        "documents": [["test_key"]],
+        "ids": [["test_id_1"]],
+    }
+
+    entries = await mock_chromadb_store.retrieve([0.1, 0.2, 0.3], VectorStoreOptions(include_vectors=False))
+
+    assert "embeddings" not in mock_collection.query.call_args.kwargs["include"]  # type: ignore
+    assert entries[0].metadata == {"content": "test content"}
+    assert entries[0].vector == []
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+async def test_store_in_batches(max_workers: int | None) -> None:
+    store = ChromaVectorStore(client=MagicMock(), index_name="test_index", batch_size=2, max_workers=max_workers)
+    entries = [VectorStoreEntry(key=f"key{i}", vector=[float(i)], metadata={}, id=f"id{i}") for i in range(5)]
+
+    await store.store(entries)
+
+    upsert = store._collection.upsert  # type: ignore
+    assert upsert.call_count == 3
+    assert sorted(call.kwargs["ids"] for call in upsert.call_args_list) == [["id0", "id1"], ["id2", "id3"], ["id4"]]
+
+
+async def test_store_with_chroma_client_is_idempotent() -> None:
+    store = ChromaVectorStore(client=chromadb.EphemeralClient(), index_name="test_idempotent_store", batch_size=2)
+    entries = [
+        VectorStoreEntry(key=f"key{i}", vector=[float(i), 1.0], metadata={"i": i}, id=f"id{i}") for i in range(3)
+    ]
+
+    await store.store(entries)
+    await store.store([VectorStoreEntry(key="key0", vector=[0.0, 1.0], metadata={"i": "updated"}, id="id0")])
+
+    listed = await store.list()
+    assert sorted(entry.id for entry in listed) == ["id0", "id1", "id2"]  # type: ignore
+    assert next(entry.metadata for entry in listed if entry.id == "id0") == {"i": "updated"}
@@ -1,9 +1,11 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from ragbits.core.vector_stores.base import VectorStoreOptions
-from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
+from ragbits.core.vector_stores import get_vector_store
+from ragbits.core.vector_stores.base import VectorStoreEntry, VectorStoreOptions
+from ragbits.core.vector_stores.in_memory import InMemoryVectorStore, InMemoryVectorStoreOptions
 from ragbits.document_search.documents.document import DocumentMeta, DocumentType
 from ragbits.document_search.documents.element import Element
 from ragbits.document_search.documents.sources import LocalFileSource
@@ -45,7 +47,10 @@ async def store_fixture() -> InMemoryVectorStore:
         ),
     ]
 
-    entries = [element[0].to_vector_db_entry(vector=element[1]) for element in elements]
+    entries = [
+        element.to_vector_db_entry(vector=vector, position=position)
+        for position, (element, vector) in enumerate(elements)
+    ]
 
     store = InMemoryVectorStore()
     await store.store(entries)
@@ -142,3 +147,192 @@ async def test_where_limit(store: InMemoryVectorStore) -> None:
 
     assert len(results) == 1
     assert results[0].metadata["name"] == "hairy"
+
+
+async def test_store_overwrites_existing_entry(store: InMemoryVectorStore) -> None:
+    document_meta = DocumentMeta(document_type=DocumentType.TXT, source=LocalFileSource(path=Path("test.txt")))
+    element = AnimalElement(name="spikey", species="dog", type="mammal", age=6, document_meta=document_meta)
+    await store.store([element.to_vector_db_entry(vector=[0.0, 0.0], position=0)])
+
+    entries = await store.retrieve([0.0, 0.0], options=VectorStoreOptions(k=1))
+
+    assert len(await store.list()) == 6
+    assert entries[0].metadata["name"] == "spikey"
+    assert entries[0].metadata["age"] == 6
+
+
+async def test_store_identifies_entries_by_id() -> None:
+    store = InMemoryVectorStore()
+    await store.store(
+        [
+            VectorStoreEntry(key="chunk", vector=[0.0, 0.0], metadata={"position": 0}, id="id0"),
+            VectorStoreEntry(key="chunk", vector=[1.0, 1.0], metadata={"position": 1}, id="id1"),
+        ]
+    )
+    await store.store([VectorStoreEntry(key="updated chunk", vector=[2.0, 2.0], metadata={"position": 0}, id="id0")])
+
+    entries = await store.list()
+
+    assert [(entry.id, entry.key) for entry in entries] == [("id0", "updated chunk"), ("id1", "chunk")]
+    assert [entry.get_id() for entry in entries] == ["id0", "id1"]
+
+
+async def test_retrieve_matches_brute_force() -> None:
+    rng = np.random.default_rng(42)
+    vectors = rng.random((3000, 16)).tolist()
+    query = rng.random(16).tolist()
+    store = InMemoryVectorStore()
+    await store.store([VectorStoreEntry(key=str(i), vector=vector, metadata={}) for i, vector in enumerate(vectors)])
+
+    entries = await store.retrieve(query, options=VectorStoreOptions(k=10))
+
+    expected = np.argsort(np.linalg.norm(np.array(vectors) - np.array(query), axis=1))[:10]
+    assert [entry.key for entry in entries] == [str(i) for i in expected]
+
+
+async def test_retrieve_from_empty_store() -> None:
+    store = InMemoryVectorStore()
+
+    assert await store.retrieve([0.1, 0.1]) == []
+
+
+async def test_retrieve_many(store: InMemoryVectorStore) -> None:
+    results = await store.retrieve_many([[0.4, 0.4], [0.95, 0.95]], options=VectorStoreOptions(k=2))
+
+    assert [[entry.metadata["name"] for entry in entries] for entries in results] == [
+        ["spikey", "fluffy"],
+        ["hairy", "scaly"],
+    ]
+
+
+def _clustered_entries(rng: np.random.Generator, size: int, offset: int = 0) -> list[VectorStoreEntry]:
+    centers = rng.random((50, 16)) * 10
+    vectors = centers[rng.integers(0, 50, size)] + rng.normal(scale=0.5, size=(size, 16))
+    return [
+        VectorStoreEntry(key=str(offset + i), vector=vector.tolist(), metadata={}) for i, vector in enumerate(vectors)
+    ]
+
+
+async def test_ivf_recall_matches_exact() -> None:
+    rng = np.random.default_rng(42)
+    entries = _clustered_entries(rng, 5000)
+    queries = [entry.vector for entry in entries[:20]]
+    exact = InMemoryVectorStore()
+    ivf = InMemoryVectorStore(index="ivf", n_lists=50, n_probe=8)
+    await exact.store(entries)
+    await ivf.store(entries)
+
+    expected = await exact.retrieve_many(queries, options=VectorStoreOptions(k=10))
+    results = await ivf.retrieve_many(queries, options=VectorStoreOptions(k=10))
+
+    found = sum(
+        len({entry.key for entry in result} & {entry.key for entry in exact_result})
+        for result, exact_result in zip(results, expected, strict=True)
+    )
+    assert found / (10 * len(queries)) >= 0.9
+
+
+async def test_ivf_n_probe_option_scans_all_lists() -> None:
+    rng = np.random.default_rng(42)
+    entries = _clustered_entries(rng, 2000)
+    exact = InMemoryVectorStore()
+    ivf = InMemoryVectorStore(index="ivf", n_lists=20, n_probe=1)
+    await exact.store(entries)
+    await ivf.store(entries)
+
+    query = entries[0].vector
+    results = await ivf.retrieve(query, options=InMemoryVectorStoreOptions(k=10, n_probe=20))
+
+    assert results == await exact.retrieve(query, options=VectorStoreOptions(k=10))
+
+
+async def test_ivf_incremental_insert() -> None:
+    rng = np.random.default_rng(42)
+    store = InMemoryVectorStore(index="ivf", n_lists=20)
+    await store.store(_clustered_entries(rng, 2000))
+    await store.retrieve([0.0] * 16)
+
+    new_entry = VectorStoreEntry(key="new", vector=[100.0] * 16, metadata={})
+    await store.store([new_entry])
+
+    assert (await store.retrieve([100.0] * 16, options=VectorStoreOptions(k=1))) == [new_entry]
+
+
+def test_get_vector_store_ivf_config() -> None:
+    store = get_vector_store(
+        {
+            "type": "ragbits.core.vector_stores.in_memory:InMemoryVectorStore",
+            "config": {"index": "ivf", "n_lists": 16, "n_probe": 4, "default_options": {"k": 3, "n_probe": 8}},
+        }
+    )
+
+    assert isinstance(store, InMemoryVectorStore)
+    assert store.index == "ivf"
+    assert store.n_lists == 16
+    assert store.n_probe == 4
+    assert isinstance(store._default_options, InMemoryVectorStoreOptions)
+    assert store._default_options.k == 3
+    assert store._default_options.n_probe == 8
+
+
+def test_unsupported_index() -> None:
+    with pytest.raises(ValueError):
+        InMemoryVectorStore(index="hnsw")  # type: ignore[arg-type]
+
+
+async def test_save_and_load(store: InMemoryVectorStore, tmp_path: Path) -> None:
+    store.save(tmp_path / "snapshot")
+
+    loaded = InMemoryVectorStore.load(tmp_path / "snapshot")
+
+    assert [entry.key for entry in await loaded.list()] == [entry.key for entry in await store.list()]
+    assert [entry.id for entry in await loaded.list()] == [entry.id for entry in await store.list()]
+    assert all(entry.id for entry in await loaded.list())
+    assert [entry.metadata["name"] for entry in await loaded.list()] == [
+        entry.metadata["name"] for entry in await store.list()
+    ]
+    assert [entry.key for entry in await loaded.retrieve([0.4, 0.4], VectorStoreOptions(k=3))] == [
+        entry.key for entry in await store.retrieve([0.4, 0.4], VectorStoreOptions(k=3))
+    ]
+
+
+async def test_store_into_loaded_snapshot(store: InMemoryVectorStore, tmp_path: Path) -> None:
+    store.save(tmp_path / "snapshot")
+    loaded = InMemoryVectorStore.load(tmp_path / "snapshot")
+    stored = (await loaded.list())[0]
+    new_entries = [
+        VectorStoreEntry(key=stored.key, vector=[5.0, 5.0], metadata={"name": "overwritten"}, id=stored.id),
+        VectorStoreEntry(key="new", vector=[-5.0, -5.0], metadata={"name": "new"}),
+    ]
+
+    await loaded.store(new_entries)
+    loaded.save(tmp_path / "snapshot")
+    reloaded = InMemoryVectorStore.load(tmp_path / "snapshot")
+
+    assert [entry.metadata["name"] for entry in await reloaded.retrieve([5.0, 5.0], VectorStoreOptions(k=1))] == [
+        "overwritten"
+    ]
+    assert [entry.metadata["name"] for entry in await reloaded.retrieve([-5.0, -5.0], VectorStoreOptions(k=1))] == [
+        "new"
+    ]
+    assert len(await reloaded.list()) == len(await store.list()) + 1
+
+
+async def test_retrieve_without_vectors(store: InMemoryVectorStore) -> None:
+    entries = await store.retrieve([0.4, 0.4], options=VectorStoreOptions(k=2, include_vectors=False))
+
+    assert [entry.metadata["name"] for entry in entries] == ["spikey", "fluffy"]
+    assert all(entry.vector == [] for entry in entries)
+    assert all(entry.id for entry in entries)
+    assert all(entry.vector for entry in await store.list())
+
+
+async def test_list_loaded_snapshot_without_vectors(store: InMemoryVectorStore, tmp_path: Path) -> None:
+    store.save(tmp_path / "snapshot")
+    loaded = InMemoryVectorStore.load(tmp_path / "snapshot")
+
+    entries = await loaded.list(include_vectors=False)
+
+    assert [entry.key for entry in entries] == [entry.key for entry in await store.list()]
+    assert [entry.id for entry in entries] == [entry.id for entry in await store.list()]
+    assert all(entry.vector == [] for entry in entries)
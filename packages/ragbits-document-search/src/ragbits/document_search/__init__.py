@@ -1,3 +1,3 @@
-from ._main import DocumentSearch, SearchConfig
+from ._main import DocumentSearch, IngestionResult, SearchConfig
 
-__all__ = ["DocumentSearch", "SearchConfig"]
+__all__ = ["DocumentSearch", "IngestionResult", "SearchConfig"]
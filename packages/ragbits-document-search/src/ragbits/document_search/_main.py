@@ -1,16 +1,20 @@
+import asyncio
+import logging
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from ragbits.core.embeddings import Embeddings, get_embeddings
 from ragbits.core.vector_stores import VectorStore, get_vector_store
-from ragbits.core.vector_stores.base import VectorStoreOptions
 from ragbits.document_search.documents.document import Document, DocumentMeta
 from ragbits.document_search.documents.element import Element
 from ragbits.document_search.documents.sources import Source
 from ragbits.document_search.ingestion.document_processor import DocumentProcessorRouter
 from ragbits.document_search.ingestion.providers.base import BaseProvider
+from ragbits.document_search.retrieval.bm25 import BM25Index
+from ragbits.document_search.retrieval.fusion import reciprocal_rank_fusion
 from ragbits.document_search.retrieval.rephrasers import get_rephraser
 from ragbits.document_search.retrieval.rephrasers.base import QueryRephraser
 from ragbits.document_search.retrieval.rephrasers.noop import NoopQueryRephraser
@@ -18,6 +22,8 @@ from ragbits.document_search.retrieval.rerankers import get_reranker
 from ragbits.document_search.retrieval.rerankers.base import Reranker
 from ragbits.document_search.retrieval.rerankers.noop import NoopReranker
 
+logger = logging.getLogger(__name__)
+
 
 class SearchConfig(BaseModel):
     """
@@ -28,6 +34,22 @@ class SearchConfig(BaseModel):
     vector_store_kwargs: dict[str, Any] = Field(default_factory=dict)
     embedder_kwargs: dict[str, Any] = Field(default_factory=dict)
 
+    # Hybrid search, used only if the DocumentSearch has a lexical index
+    lexical_k: int = 5
+    vector_weight: float = 1.0
+    lexical_weight: float = 1.0
+    rrf_k: int = 60
+
+
+@dataclass
+class IngestionResult:
+    """
+    Outcome of the ingestion of multiple documents.
+    """
+
+    successful: list[DocumentMeta | Document | Source] = field(default_factory=list)
+    failed: list[tuple[DocumentMeta | Document | Source, Exception]] = field(default_factory=list)
+
 
 class DocumentSearch:
     """
@@ -38,7 +60,9 @@ class DocumentSearch:
     Retrieval:
 
         1. Uses QueryRephraser to rephrase the query.
-        2. Uses VectorStore to retrieve the most relevant chunks.
+        2. Uses VectorStore to retrieve the most relevant chunks. If the lexical index is provided,
+           it is searched at the same time and the results are fused with the reciprocal rank fusion.
+           The lexical index is kept only in memory, so it's rebuilt from the vector store before the first search.
         3. Uses Reranker to rerank the chunks.
     """
 
@@ -46,6 +70,7 @@ class DocumentSearch:
     vector_store: VectorStore
     query_rephraser: QueryRephraser
     reranker: Reranker
+    lexical_index: BM25Index | None
 
     def __init__(
         self,
@@ -54,12 +79,16 @@ class DocumentSearch:
         query_rephraser: QueryRephraser | None = None,
         reranker: Reranker | None = None,
         document_processor_router: DocumentProcessorRouter | None = None,
+        *,
+        lexical_index: BM25Index | None = None,
     ) -> None:
         self.embedder = embedder
         self.vector_store = vector_store
         self.query_rephraser = query_rephraser or NoopQueryRephraser()
         self.reranker = reranker or NoopReranker()
         self.document_processor_router = document_processor_router or DocumentProcessorRouter.from_config()
+        self.lexical_index = lexical_index
+        self._lexical_index_built = False
 
     @classmethod
     def from_config(cls, config: dict) -> "DocumentSearch":
@@ -81,7 +110,12 @@ class DocumentSearch:
         providers_config = DocumentProcessorRouter.from_dict_to_providers_config(providers_config_dict)
         document_processor_router = DocumentProcessorRouter.from_config(providers_config)
 
-        return cls(embedder, vector_store, query_rephraser, reranker, document_processor_router)
+        lexical_index_config = config.get("lexical_index")
+        lexical_index = BM25Index(**lexical_index_config) if lexical_index_config is not None else None
+
+        return cls(
+            embedder, vector_store, query_rephraser, reranker, document_processor_router, lexical_index=lexical_index
+        )
 
     async def search(self, query: str, config: SearchConfig | None = None) -> list[Element]:
         """
@@ -96,17 +130,64 @@ class DocumentSearch:
         """
         config = config or SearchConfig()
         queries = await self.query_rephraser.rephrase(query)
-        elements = []
-        for rephrased_query in queries:
-            search_vector = await self.embedder.embed_text([rephrased_query])
-            entries = await self.vector_store.retrieve(
-                vector=search_vector[0],
-                options=VectorStoreOptions(**config.vector_store_kwargs),
+
+        if self.lexical_index is not None and not self._lexical_index_built:
+            await self.build_lexical_index()
+
+        if self.lexical_index is None:
+            vector_results = await self._search_vectors(queries, config)
+            elements = [element for elements in vector_results for element in elements]
+        else:
+            vector_results, lexical_results = await asyncio.gather(
+                self._search_vectors(queries, config),
+                asyncio.to_thread(self.lexical_index.search_many, queries, config.lexical_k),
+            )
+            elements = reciprocal_rank_fusion(
+                [*vector_results, *lexical_results],
+                weights=[config.vector_weight] * len(vector_results) + [config.lexical_weight] * len(lexical_results),
+                k=config.rrf_k,
             )
-            elements.extend([Element.from_vector_db_entry(entry) for entry in entries])
 
         return self.reranker.rerank(elements)
 
+    async def build_lexical_index(self) -> None:
+        """
+        Adds the elements stored in the vector store to the lexical index. The lexical index is kept only
+        in memory, so a DocumentSearch created over an already populated vector store has to build it again.
+        It's done automatically before the first search.
+        """
+        if self.lexical_index is None:
+            return
+        entries = await self.vector_store.list(include_vectors=False)
+        elements = [Element.from_vector_db_entry(entry) for entry in entries]
+        await asyncio.to_thread(self.lexical_index.add, elements)
+        self._lexical_index_built = True
+
+    async def _search_vectors(self, queries: list[str], config: SearchConfig) -> list[list[Element]]:
+        """
+        Search for the chunks most similar to each of the queries in the vector store.
+
+        Args:
+            queries: The queries to search for.
+            config: The search configuration.
+
+        Returns:
+            The chunks for each of the queries.
+        """
+        search_vectors = await self.embedder.embed_text(queries)
+        # The options of the store may have store-specific fields, so they're built with the store's own options
+        # class, from its default options. The elements are restored from the metadata, so the vectors
+        # don't have to be fetched.
+        options = self.vector_store._options_cls(  # pylint: disable=protected-access
+            **{
+                **self.vector_store._default_options.model_dump(),  # pylint: disable=protected-access
+                "include_vectors": False,
+                **config.vector_store_kwargs,
+            }
+        )
+        results = await self.vector_store.retrieve_many(vectors=search_vectors, options=options)
+        return [[Element.from_vector_db_entry(entry) for entry in entries] for entries in results]
+
     async def _process_document(
         self,
         document: DocumentMeta | Document | Source,
@@ -133,35 +214,75 @@ class DocumentSearch:
         if document_processor is None:
             document_processor = self.document_processor_router.get_provider(document_meta)
 
-        document_processor = self.document_processor_router.get_provider(document_meta)
         return await document_processor.process(document_meta)
 
     async def ingest(
         self,
         documents: Sequence[DocumentMeta | Document | Source],
         document_processor: BaseProvider | None = None,
-    ) -> None:
+        *,
+        max_concurrency: int = 10,
+    ) -> IngestionResult:
         """
         Ingest multiple documents.
 
+        Documents are processed concurrently, each of them being fetched, partitioned, embedded and stored
+        independently, so a failure of one document doesn't stop the ingestion of the others.
+        The failures are logged and reported in the result instead of being raised.
+
         Args:
             documents: The documents or metadata of the documents to ingest.
             document_processor: The document processor to use. If not provided, the document processor will be
                 determined based on the document metadata.
+            max_concurrency: The maximum number of documents processed at the same time.
+
+        Returns:
+            The result of the ingestion, listing the successfully ingested documents and the failed ones
+            along with the raised exceptions.
         """
-        elements = []
-        # TODO: Parallelize
-        for document in documents:
-            elements.extend(await self._process_document(document, document_processor))
-        await self.insert_elements(elements)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _ingest_document(document: DocumentMeta | Document | Source) -> Exception | None:
+            async with semaphore:
+                try:
+                    elements = await self._process_document(document, document_processor)
+                    await self.insert_elements(elements, positions=list(range(len(elements))))
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    logger.exception("Failed to ingest document %r", document)
+                    return exc
+            return None
 
-    async def insert_elements(self, elements: list[Element]) -> None:
+        errors = await asyncio.gather(*(_ingest_document(document) for document in documents))
+
+        result = IngestionResult()
+        for document, error in zip(documents, errors, strict=True):
+            if error is None:
+                result.successful.append(document)
+            else:
+                result.failed.append((document, error))
+        return result
+
+    async def insert_elements(self, elements: list[Element], *, positions: list[int] | None = None) -> None:
         """
-        Insert Elements into the vector store.
+        Insert Elements into the vector store and the lexical index, if provided.
 
         Args:
             elements: The list of Elements to insert.
+            positions: The positions of the elements in their documents. If specified, the vector store entries
+                are identified by the document IDs and the positions, so that inserting the elements of a document
+                again replaces their entries instead of duplicating them.
         """
+        if not elements:
+            return
+
         vectors = await self.embedder.embed_text([element.get_key() for element in elements])
-        entries = [element.to_vector_db_entry(vector) for element, vector in zip(elements, vectors, strict=False)]
+        entries = [
+            element.to_vector_db_entry(vector, position)
+            for element, vector, position in zip(
+                elements, vectors, positions if positions is not None else [None] * len(elements), strict=False
+            )
+        ]
         await self.vector_store.store(entries)
+        if self.lexical_index is not None:
+            # The index is updated in a thread, as it may wait for a search running in another one
+            await asyncio.to_thread(self.lexical_index.add, elements)
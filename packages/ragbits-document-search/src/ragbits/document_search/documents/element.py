@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from hashlib import sha256
 from typing import Any, ClassVar
 
 from pydantic import BaseModel
@@ -62,12 +63,14 @@ class Element(BaseModel, ABC):
 
         return element_cls(**meta)
 
-    def to_vector_db_entry(self, vector: list[float]) -> VectorStoreEntry:
+    def to_vector_db_entry(self, vector: list[float], position: int | None = None) -> VectorStoreEntry:
         """
         Create a vector database entry from the element.
 
         Args:
             vector: The vector.
+            position: The position of the element in the document. If specified, the ID of the entry is derived
+                from the document ID and the position, so that the entry of the same chunk ingested again replaces it.
 
         Returns:
             The vector database entry
@@ -76,6 +79,7 @@ class Element(BaseModel, ABC):
             key=self.get_key(),
             vector=vector,
             metadata=self.model_dump(),
+            id=None if position is None else sha256(f"{self.document_meta.id}:{position}".encode()).hexdigest(),
         )
 
 
@@ -1,8 +1,12 @@
+import asyncio
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
 from unstructured.chunking.basic import chunk_elements
 from unstructured.documents.elements import Element as UnstructuredElement
+from unstructured.documents.elements import ElementType
 from unstructured.partition.auto import partition
 from unstructured.staging.base import elements_from_dicts
 from unstructured_client import UnstructuredClient
@@ -26,9 +30,74 @@ UNSTRUCTURED_API_KEY_ENV = "UNSTRUCTURED_API_KEY"
 UNSTRUCTURED_SERVER_URL_ENV = "UNSTRUCTURED_SERVER_URL"
 
 
+def _split_and_chunk(
+    elements: list[UnstructuredElement], chunking_kwargs: dict, separate_images: bool
+) -> tuple[list[UnstructuredElement], list[UnstructuredElement]]:
+    """
+    Chunks the elements, optionally keeping the image elements aside so they are not merged into text chunks.
+
+    Args:
+        elements: The elements to chunk.
+        chunking_kwargs: The arguments for the chunking.
+        separate_images: Whether to keep the image elements out of the chunking.
+
+    Returns:
+        The chunked elements and the image elements (empty if the images are not separated).
+    """
+    if not separate_images:
+        return chunk_elements(elements, **chunking_kwargs), []
+    image_elements = [e for e in elements if e.category == ElementType.IMAGE]
+    other_elements = [e for e in elements if e.category != ElementType.IMAGE]
+    return chunk_elements(other_elements, **chunking_kwargs), image_elements
+
+
+def _partition_and_chunk(
+    content: bytes, file_name: str, partition_kwargs: dict, chunking_kwargs: dict, separate_images: bool
+) -> tuple[list[UnstructuredElement], list[UnstructuredElement]]:
+    """
+    Partitions the document with the local version of Unstructured library and chunks the elements.
+
+    Args:
+        content: The content of the document.
+        file_name: The name of the document file.
+        partition_kwargs: The arguments for the partitioning.
+        chunking_kwargs: The arguments for the chunking.
+        separate_images: Whether to keep the image elements out of the chunking.
+
+    Returns:
+        The chunked elements and the image elements (empty if the images are not separated).
+    """
+    elements = partition(file=BytesIO(content), metadata_filename=file_name, **partition_kwargs)
+    return _split_and_chunk(elements, chunking_kwargs, separate_images)
+
+
+def _partition_and_chunk_to_dicts(
+    content: bytes, file_name: str, partition_kwargs: dict, chunking_kwargs: dict, separate_images: bool
+) -> tuple[list[dict], list[dict]]:
+    """
+    Runs `_partition_and_chunk` and serializes the elements to dicts, so they can be sent back from a worker process.
+
+    Args:
+        content: The content of the document.
+        file_name: The name of the document file.
+        partition_kwargs: The arguments for the partitioning.
+        chunking_kwargs: The arguments for the chunking.
+        separate_images: Whether to keep the image elements out of the chunking.
+
+    Returns:
+        The chunked elements and the image elements as dicts.
+    """
+    chunks, images = _partition_and_chunk(content, file_name, partition_kwargs, chunking_kwargs, separate_images)
+    return [element.to_dict() for element in chunks], [element.to_dict() for element in images]
+
+
 class UnstructuredDefaultProvider(BaseProvider):
     """
     A provider that uses the Unstructured API or local SDK to process the documents.
+
+    The local partitioning runs in a thread, or in a pool of worker processes if `partition_workers` is set,
+    so it doesn't block the event loop. The worker processes are stopped with `aclose`, or when the provider
+    is garbage collected.
     """
 
     SUPPORTED_DOCUMENT_TYPES = {
@@ -51,6 +120,9 @@ class UnstructuredDefaultProvider(BaseProvider):
         DocumentType.XML,
     }
 
+    # Whether the image elements are kept out of the chunking to be processed separately
+    _separate_images: bool = False
+
     def __init__(
         self,
         partition_kwargs: dict | None = None,
@@ -59,6 +131,7 @@ class UnstructuredDefaultProvider(BaseProvider):
         api_server: str | None = None,
         use_api: bool = False,
         ignore_images: bool = False,
+        partition_workers: int | None = None,
     ) -> None:
         """Initialize the UnstructuredDefaultProvider.
 
@@ -72,6 +145,9 @@ class UnstructuredDefaultProvider(BaseProvider):
                 UNSTRUCTURED_SERVER_URL environment variable will be used.
             use_api: whether to use Unstructured API, otherwise use local version of Unstructured library
             ignore_images: if True images will be skipped
+            partition_workers: number of worker processes used to run the local partitioning and chunking,
+                if None, they are run in a thread of the current process. Has no effect when the Unstructured API
+                is used.
         """
         self.partition_kwargs = partition_kwargs or DEFAULT_PARTITION_KWARGS
         self.chunking_kwargs = chunking_kwargs or DEFAULT_CHUNKING_KWARGS
@@ -80,6 +156,8 @@ class UnstructuredDefaultProvider(BaseProvider):
         self.use_api = use_api
         self._client: UnstructuredClient | None = None
         self.ignore_images = ignore_images
+        self.partition_workers = partition_workers
+        self._executor: ProcessPoolExecutor | None = None
 
     @property
     def client(self) -> UnstructuredClient:
@@ -133,21 +211,72 @@ class UnstructuredDefaultProvider(BaseProvider):
                 }
             )
             elements = elements_from_dicts(res.elements)  # type: ignore
+            chunks, images = _split_and_chunk(elements, self.chunking_kwargs, self._separate_images)
         else:
-            elements = partition(
-                file=BytesIO(document.local_path.read_bytes()),
-                metadata_filename=document.local_path.name,
-                **self.partition_kwargs,
-            )
+            chunks, images = await self._partition_locally(document.local_path)
+
+        return await self._convert(chunks, images, document_meta, document.local_path)
+
+    async def aclose(self) -> None:
+        """
+        Stops the worker processes of the local partitioning, waiting for the running partitions to finish.
+        The processes are started again if the provider is used after it's closed.
+        """
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def _partition_locally(
+        self, document_path: Path
+    ) -> tuple[list[UnstructuredElement], list[UnstructuredElement]]:
+        """
+        Partitions and chunks the document with the local version of Unstructured library, in a pool of worker
+        processes if `partition_workers` is set, otherwise in a thread.
+
+        Args:
+            document_path: The local path to the document.
+
+        Returns:
+            The chunked elements and the image elements.
+        """
+        args = (
+            document_path.read_bytes(),
+            document_path.name,
+            self.partition_kwargs,
+            self.chunking_kwargs,
+            self._separate_images,
+        )
+        if self.partition_workers is None:
+            return await asyncio.to_thread(_partition_and_chunk, *args)
 
-        return await self._chunk_and_convert(elements, document_meta, document.local_path)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.partition_workers)
+            # The worker processes are stopped when the provider is garbage collected without being closed
+            weakref.finalize(self, self._executor.shutdown, wait=False, cancel_futures=True)
+        chunks, images = await asyncio.get_running_loop().run_in_executor(
+            self._executor, _partition_and_chunk_to_dicts, *args
+        )
+        return elements_from_dicts(chunks), elements_from_dicts(images)
 
-    async def _chunk_and_convert(
+    async def _convert(  # noqa: PLR6301
         # pylint: disable=unused-argument
         self,
-        elements: list[UnstructuredElement],
+        chunks: list[UnstructuredElement],
+        images: list[UnstructuredElement],
         document_meta: DocumentMeta,
         document_path: Path,
     ) -> list[Element]:
-        chunked_elements = chunk_elements(elements, **self.chunking_kwargs)
-        return [to_text_element(element, document_meta) for element in chunked_elements]
+        """
+        Converts the chunked Unstructured elements to ragbits elements. The image elements are skipped,
+        the providers handling images describe them.
+
+        Args:
+            chunks: The chunked elements.
+            images: The image elements kept out of the chunking.
+            document_meta: The metadata of the document.
+            document_path: The local path to the document.
+
+        Returns:
+            The elements of the document.
+        """
+        return [to_text_element(element, document_meta) for element in chunks]
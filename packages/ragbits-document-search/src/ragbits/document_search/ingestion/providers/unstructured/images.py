@@ -1,16 +1,19 @@
+import asyncio
 import warnings
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 from PIL import Image
 from pydantic import BaseModel
-from unstructured.chunking.basic import chunk_elements
 from unstructured.documents.elements import Element as UnstructuredElement
-from unstructured.documents.elements import ElementType
 
 from ragbits.core.llms.base import LLM, LLMType
 from ragbits.core.llms.factory import get_default_llm, has_default_llm
 from ragbits.core.llms.litellm import LiteLLM
 from ragbits.core.prompt import Prompt
+from ragbits.core.utils.rate_limiter import RateLimiter
 from ragbits.document_search.documents.document import DocumentMeta, DocumentType
 from ragbits.document_search.documents.element import Element, ImageElement
 from ragbits.document_search.ingestion.providers.unstructured.default import UnstructuredDefaultProvider
@@ -37,6 +40,38 @@ class _ImagePromptInput(BaseModel):
 DEFAULT_LLM_IMAGE_DESCRIPTION_MODEL = "gpt-4o-mini"
 
 
+class _PageCache:
+    """
+    Keeps the most recently used rendered pages of a document, so that each page is rasterized only once
+    while the image elements located on it are processed.
+    """
+
+    def __init__(self, load_page: Callable[[int | None], Image.Image], max_size: int) -> None:
+        self._load_page = load_page
+        self._max_size = max_size
+        self._pages: OrderedDict[int | None, Image.Image] = OrderedDict()
+
+    def get(self, page: int | None) -> Image.Image:
+        """
+        Returns the rendered page, rendering it if it's not cached.
+
+        Args:
+            page: The number of the page, None if the document has no pages.
+
+        Returns:
+            The rendered page.
+        """
+        if page in self._pages:
+            self._pages.move_to_end(page)
+            return self._pages[page]
+
+        image = self._load_page(page)
+        self._pages[page] = image
+        if len(self._pages) > self._max_size:
+            self._pages.popitem(last=False)
+        return image
+
+
 class UnstructuredImageProvider(UnstructuredDefaultProvider):
     """
     A specialized provider that handles pngs and jpgs using the Unstructured
@@ -47,6 +82,11 @@ class UnstructuredImageProvider(UnstructuredDefaultProvider):
         DocumentType.PNG,
     }
 
+    _separate_images = True
+
+    # Maximum number of rendered pages of a document kept in memory at once
+    _MAX_CACHED_PAGES = 4
+
     def __init__(
         self,
         partition_kwargs: dict | None = None,
@@ -55,6 +95,10 @@ class UnstructuredImageProvider(UnstructuredDefaultProvider):
         api_server: str | None = None,
         use_api: bool = False,
         llm: LLM | None = None,
+        partition_workers: int | None = None,
+        max_concurrent_descriptions: int | None = 10,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
     ) -> None:
         """Initialize the UnstructuredPdfProvider.
 
@@ -68,36 +112,71 @@ class UnstructuredImageProvider(UnstructuredDefaultProvider):
                 UNSTRUCTURED_SERVER_URL environment variable will be used.
             use_api: Whether to use the Unstructured API. If False, the provider will only use the local processing.
             llm: llm to use
+            partition_workers: number of worker processes used to run the local partitioning and chunking,
+                if None, they are run in the current process. Has no effect when the Unstructured API is used.
+            max_concurrent_descriptions: maximum number of image descriptions generated by the LLM at the same time,
+                unlimited if None
+            requests_per_minute: maximum number of image description requests sent to the LLM per minute,
+                unlimited if None
+            tokens_per_minute: maximum number of (estimated) prompt tokens sent to the LLM per minute,
+                unlimited if None
         """
-        super().__init__(partition_kwargs, chunking_kwargs, api_key, api_server, use_api)
+        super().__init__(
+            partition_kwargs, chunking_kwargs, api_key, api_server, use_api, partition_workers=partition_workers
+        )
         self.image_describer: ImageDescriber | None = None
         self._llm = llm
+        self.max_concurrent_descriptions = max_concurrent_descriptions
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
 
-    async def _chunk_and_convert(
-        self, elements: list[UnstructuredElement], document_meta: DocumentMeta, document_path: Path
+    async def _convert(
+        self,
+        chunks: list[UnstructuredElement],
+        images: list[UnstructuredElement],
+        document_meta: DocumentMeta,
+        document_path: Path,
     ) -> list[Element]:
-        image_elements = [e for e in elements if e.category == ElementType.IMAGE]
-        other_elements = [e for e in elements if e.category != ElementType.IMAGE]
-        chunked_other_elements = chunk_elements(other_elements, **self.chunking_kwargs)
-
-        text_elements: list[Element] = [to_text_element(element, document_meta) for element in chunked_other_elements]
+        text_elements: list[Element] = [to_text_element(element, document_meta) for element in chunks]
         if self.ignore_images:
             return text_elements
-        return text_elements + [
-            await self._to_image_element(element, document_meta, document_path) for element in image_elements
-        ]
 
-    async def _to_image_element(
-        self, element: UnstructuredElement, document_meta: DocumentMeta, document_path: Path
-    ) -> ImageElement:
+        # Images are cropped page by page, so that every page containing images is rendered only once,
+        # while the image elements are kept in the order of the document
+        pages = _PageCache(partial(self._load_document_as_image, document_path), self._MAX_CACHED_PAGES)
+        images_bytes = [b""] * len(images)
+        for i in sorted(range(len(images)), key=lambda i: images[i].metadata.page_number or 0):
+            images_bytes[i] = self._crop_image(images[i], pages)
+
+        image_elements = await asyncio.gather(
+            *(
+                self._to_image_element(element, img_bytes, document_meta)
+                for element, img_bytes in zip(images, images_bytes, strict=True)
+            )
+        )
+        return text_elements + list(image_elements)
+
+    def _crop_image(self, element: UnstructuredElement, pages: _PageCache) -> bytes:
         top_x, top_y, bottom_x, bottom_y = extract_image_coordinates(element)
-        image = self._load_document_as_image(document_path)
+        image = pages.get(element.metadata.page_number)
         top_x, top_y, bottom_x, bottom_y = self._convert_coordinates(
             top_x, top_y, bottom_x, bottom_y, image.width, image.height, element
         )
+        return crop_and_convert_to_bytes(image, top_x, top_y, bottom_x, bottom_y)
 
-        img_bytes = crop_and_convert_to_bytes(image, top_x, top_y, bottom_x, bottom_y)
+    async def _to_image_element(
+        self, element: UnstructuredElement, img_bytes: bytes, document_meta: DocumentMeta
+    ) -> ImageElement:
         prompt = _ImagePrompt(_ImagePromptInput(images=[img_bytes]))
+        image_description = await self._get_image_describer().get_image_description(prompt=prompt)
+        return ImageElement(
+            description=image_description,
+            ocr_extracted_text=element.text,
+            image_bytes=img_bytes,
+            document_meta=document_meta,
+        )
+
+    def _get_image_describer(self) -> ImageDescriber:
         if self.image_describer is None:
             if self._llm is not None:
                 llm_to_use = self._llm
@@ -108,14 +187,13 @@ class UnstructuredImageProvider(UnstructuredDefaultProvider):
                     f"Vision LLM was not provided, setting default option to {DEFAULT_LLM_IMAGE_DESCRIPTION_MODEL}"
                 )
                 llm_to_use = LiteLLM(DEFAULT_LLM_IMAGE_DESCRIPTION_MODEL)
-            self.image_describer = ImageDescriber(llm_to_use)
-        image_description = await self.image_describer.get_image_description(prompt=prompt)
-        return ImageElement(
-            description=image_description,
-            ocr_extracted_text=element.text,
-            image_bytes=img_bytes,
-            document_meta=document_meta,
-        )
+            rate_limiter = (
+                RateLimiter(self.requests_per_minute, self.tokens_per_minute)
+                if self.requests_per_minute or self.tokens_per_minute
+                else None
+            )
+            self.image_describer = ImageDescriber(llm_to_use, self.max_concurrent_descriptions, rate_limiter)
+        return self.image_describer
 
     @staticmethod
     def _load_document_as_image(
@@ -1,12 +1,16 @@
+import asyncio
 import io
 import os
 import warnings as wrngs
+import weakref
+from contextlib import nullcontext
 
 from PIL import Image
 from unstructured.documents.elements import Element as UnstructuredElement
 
 from ragbits.core.llms.base import LLM
 from ragbits.core.prompt.base import BasePrompt
+from ragbits.core.utils.rate_limiter import RateLimiter
 from ragbits.document_search.documents.document import DocumentMeta
 from ragbits.document_search.documents.element import ElementLocation, TextElement
 
@@ -106,8 +110,22 @@ class ImageDescriber:
     Describes images content using an LLM
     """
 
-    def __init__(self, llm: LLM):
+    def __init__(self, llm: LLM, max_concurrency: int | None = None, rate_limiter: RateLimiter | None = None):
+        """
+        Constructs a new ImageDescriber instance.
+
+        Args:
+            llm: LLM used to describe the images
+            max_concurrency: maximum number of descriptions generated at the same time, unlimited if None
+            rate_limiter: limiter of the requests and tokens sent to the LLM per minute
+        """
         self.llm = llm
+        self.max_concurrency = max_concurrency
+        self._rate_limiter = rate_limiter
+        # The semaphore is bound to the event loop it's used in, so each running loop has its own
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
 
     async def get_image_description(self, prompt: BasePrompt) -> str:
         """
@@ -120,4 +138,21 @@ class ImageDescriber:
         """
         if not prompt.list_images():
             wrngs.warn(message="Image data not provided", category=UserWarning)
-        return await self.llm.generate(prompt=prompt)
+        async with self._get_semaphore() or nullcontext():
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(tokens=self.llm.count_tokens(prompt))
+            return await self.llm.generate(prompt=prompt)
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        """
+        Returns the semaphore limiting the concurrent descriptions for the running event loop.
+
+        Returns:
+            The semaphore, or None if the concurrency is not limited.
+        """
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
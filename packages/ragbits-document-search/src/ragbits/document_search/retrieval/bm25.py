@@ -0,0 +1,119 @@
+import math
+import re
+import threading
+from collections import Counter
+from heapq import nlargest
+
+from ragbits.document_search.documents.element import Element
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """
+    An in-memory inverted index of elements, scoring them against the queries with Okapi BM25.
+
+    The elements are indexed by the words of their keys, so that the exact identifiers (part numbers,
+    error codes) missed by the dense retrieval can be found. The index is not persisted, `DocumentSearch`
+    rebuilds it from the vector store.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """
+        Constructs a new BM25Index instance.
+
+        Args:
+            k1: The term frequency saturation parameter.
+            b: The document length normalization parameter.
+        """
+        self.k1 = k1
+        self.b = b
+        self._elements: dict[str, Element] = {}
+        self._term_counts: dict[str, Counter[str]] = {}
+        self._lengths: dict[str, int] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        # The index is searched and updated in worker threads, so that it doesn't block the event loop
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def add(self, elements: list[Element]) -> None:
+        """
+        Adds the elements to the index, replacing the already indexed elements with the same keys.
+
+        Args:
+            elements: The elements to add.
+        """
+        with self._lock:
+            for element in elements:
+                key = element.get_key()
+                self._remove(key)
+
+                term_counts = Counter(_tokenize(key))
+                for term, count in term_counts.items():
+                    self._postings.setdefault(term, {})[key] = count
+                self._elements[key] = element
+                self._term_counts[key] = term_counts
+                self._lengths[key] = term_counts.total()
+                self._total_length += self._lengths[key]
+
+    def search(self, query: str, k: int = 5) -> list[Element]:
+        """
+        Searches for the elements most relevant to the query.
+
+        Args:
+            query: The query to search for.
+            k: The maximum number of elements to return.
+
+        Returns:
+            The elements sorted by their BM25 score, only the elements containing any of the query terms
+            are returned.
+        """
+        with self._lock:
+            if not self._elements or k <= 0:
+                return []
+
+            size = len(self._elements)
+            average_length = self._total_length / size
+            scores: dict[str, float] = {}
+            for term in dict.fromkeys(_tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (size - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, count in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[key] / average_length)
+                    scores[key] = scores.get(key, 0.0) + idf * count * (self.k1 + 1) / (count + norm)
+
+            return [self._elements[key] for key in nlargest(k, scores, key=scores.__getitem__)]
+
+    def search_many(self, queries: list[str], k: int = 5) -> list[list[Element]]:
+        """
+        Searches for the elements most relevant to each of the queries.
+
+        Args:
+            queries: The queries to search for.
+            k: The maximum number of elements to return per query.
+
+        Returns:
+            The elements for each of the queries, in the order of the queries.
+        """
+        return [self.search(query, k) for query in queries]
+
+    def _remove(self, key: str) -> None:
+        term_counts = self._term_counts.pop(key, None)
+        if term_counts is None:
+            return
+        for term in term_counts:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+        del self._elements[key]
+        self._total_length -= self._lengths.pop(key)
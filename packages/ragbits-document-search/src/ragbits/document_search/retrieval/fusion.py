@@ -0,0 +1,32 @@
+from ragbits.document_search.documents.element import Element
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[Element]],
+    weights: list[float] | None = None,
+    k: int = 60,
+) -> list[Element]:
+    """
+    Fuses multiple rankings of elements into one with the weighted reciprocal rank fusion (RRF).
+
+    Each element gets the sum of `weight / (k + rank)` over the rankings it appears in. The elements are
+    identified by their keys.
+
+    Args:
+        rankings: The rankings of elements, the most relevant elements first.
+        weights: The weights of the rankings. If not specified, all the rankings have the weight of 1.
+        k: The constant reducing the impact of the top ranks.
+
+    Returns:
+        The fused ranking of the elements.
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: dict[str, float] = {}
+    elements: dict[str, Element] = {}
+    for ranking, weight in zip(rankings, weights, strict=True):
+        for rank, element in enumerate(ranking, start=1):
+            key = element.get_key()
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+            elements.setdefault(key, element)
+
+    return [elements[key] for key in sorted(scores, key=scores.__getitem__, reverse=True)]
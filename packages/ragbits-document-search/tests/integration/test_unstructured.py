@@ -116,3 +116,12 @@ async def test_unstructured_provider_document_with_custom_partition_kwargs(use_a
     assert unstructured_provider.partition_kwargs == partition_kwargs
     assert len(elements) == 1
     assert elements[0].content == "Name of Peppa's brother is George."  # type: ignore
+
+
+async def test_unstructured_provider_document_with_partition_workers():
+    document_meta = DocumentMeta.create_text_document_from_literal("Name of Peppa's brother is George.")
+    unstructured_provider = UnstructuredDefaultProvider(partition_workers=2)
+    elements = await unstructured_provider.process(document_meta)
+
+    assert len(elements) == 1
+    assert elements[0].content == "Name of Peppa's brother is George."  # type: ignore
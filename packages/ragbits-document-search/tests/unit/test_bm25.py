@@ -0,0 +1,45 @@
+from ragbits.document_search.documents.document import DocumentMeta
+from ragbits.document_search.documents.element import TextElement
+from ragbits.document_search.retrieval.bm25 import BM25Index
+from ragbits.document_search.retrieval.fusion import reciprocal_rank_fusion
+
+
+def _element(content: str) -> TextElement:
+    return TextElement(document_meta=DocumentMeta.create_text_document_from_literal(content), content=content)
+
+
+def test_bm25_index_ranks_elements_by_relevance():
+    index = BM25Index()
+    index.add(
+        [
+            _element("The pump failed with error code E-4521 after the update"),
+            _element("The pump is working fine"),
+            _element("Error codes are listed in the appendix"),
+        ]
+    )
+
+    results = index.search("error E-4521", k=5)
+
+    assert [result.content for result in results] == [
+        "The pump failed with error code E-4521 after the update",
+        "Error codes are listed in the appendix",
+    ]
+    assert index.search("unrelated words") == []
+
+
+def test_bm25_index_replaces_elements_with_the_same_key():
+    index = BM25Index()
+    index.add([_element("part number XK-100"), _element("part number XK-100")])
+
+    assert len(index) == 1
+    assert len(index.search("XK")) == 1
+
+
+def test_reciprocal_rank_fusion():
+    first, second, third = _element("first"), _element("second"), _element("third")
+
+    fused = reciprocal_rank_fusion([[first, second], [third, second]], k=1)
+    weighted = reciprocal_rank_fusion([[first, second], [third, second]], weights=[1.0, 3.0], k=1)
+
+    assert fused == [second, first, third]
+    assert weighted == [third, second, first]
@@ -1,18 +1,20 @@
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
+from ragbits.core.vector_stores.in_memory import InMemoryVectorStore, InMemoryVectorStoreOptions
 from ragbits.document_search import DocumentSearch
 from ragbits.document_search._main import SearchConfig
 from ragbits.document_search.documents.document import Document, DocumentMeta, DocumentType
 from ragbits.document_search.documents.element import TextElement
+from ragbits.document_search.documents.exceptions import SourceNotFoundError
 from ragbits.document_search.documents.sources import LocalFileSource
 from ragbits.document_search.ingestion.document_processor import DocumentProcessorRouter
 from ragbits.document_search.ingestion.providers import BaseProvider
 from ragbits.document_search.ingestion.providers.dummy import DummyProvider
+from ragbits.document_search.retrieval.bm25 import BM25Index
 
 CONFIG = {
     "embedder": {"type": "NoopEmbeddings"},
@@ -150,16 +152,117 @@ async def test_document_search_with_search_config():
     assert results[0].content == "Name of Peppa's brother is George"  # type: ignore
 
 
+class MarkdownDummyProvider(DummyProvider):
+    """
+    Dummy provider accepting the markdown example files.
+    """
+
+    SUPPORTED_DOCUMENT_TYPES = {DocumentType.MD}
+
+
 async def test_document_search_ingest_multiple_from_sources():
     document_search = DocumentSearch.from_config(CONFIG)
     examples_files = Path(__file__).parent / "example_files"
 
-    await document_search.ingest(
+    result = await document_search.ingest(
         LocalFileSource.list_sources(examples_files, file_pattern="*.md"),
-        document_processor=DummyProvider(),
+        document_processor=MarkdownDummyProvider(),
     )
 
+    assert not result.failed
+
     results = await document_search.search("foo")
 
     assert len(results) == 2
     assert {result.content for result in results} == {"foo", "bar"}  # type: ignore
+
+
+async def test_document_search_ingest_isolates_failed_documents(caplog: pytest.LogCaptureFixture):
+    document_search = DocumentSearch.from_config(CONFIG)
+    valid_document = DocumentMeta.create_text_document_from_literal("Name of Peppa's brother is George")
+    invalid_document = DocumentMeta(document_type=DocumentType.TXT, source=LocalFileSource(path=Path("missing.txt")))
+
+    result = await document_search.ingest([invalid_document, valid_document], max_concurrency=1)
+
+    assert result.successful == [valid_document]
+    assert len(result.failed) == 1
+    assert result.failed[0][0] == invalid_document
+    assert isinstance(result.failed[0][1], SourceNotFoundError)
+    assert "Failed to ingest document" in caplog.text
+
+    results = await document_search.search("Peppa's brother")
+
+    assert len(results) == 1
+    assert results[0].content == "Name of Peppa's brother is George"  # type: ignore
+
+
+async def test_document_search_hybrid_search_finds_exact_identifiers():
+    document_search = DocumentSearch.from_config({**CONFIG, "lexical_index": {}})
+    contents = ["Replace the filter every month", "Part XK-9931 is out of stock", "Order parts online"]
+    await document_search.insert_elements(
+        [
+            TextElement(document_meta=DocumentMeta.create_text_document_from_literal(content), content=content)
+            for content in contents
+        ]
+    )
+
+    # The noop embeddings can't tell the elements apart, the lexical index finds the exact identifier
+    config = SearchConfig(vector_store_kwargs={"k": 1}, lexical_k=1, lexical_weight=2.0)
+    results = await document_search.search("XK-9931", config)
+
+    assert results[0].content == "Part XK-9931 is out of stock"  # type: ignore
+    assert len(results) == 2
+
+
+async def test_document_search_rebuilds_lexical_index_from_vector_store():
+    ingested = DocumentSearch.from_config(CONFIG)
+    contents = ["Replace the filter every month", "Part XK-9931 is out of stock", "Order parts online"]
+    await ingested.insert_elements(
+        [
+            TextElement(document_meta=DocumentMeta.create_text_document_from_literal(content), content=content)
+            for content in contents
+        ]
+    )
+
+    # A new DocumentSearch over the populated store, e.g. created from the config in another process
+    document_search = DocumentSearch(
+        embedder=ingested.embedder, vector_store=ingested.vector_store, lexical_index=BM25Index()
+    )
+    config = SearchConfig(vector_store_kwargs={"k": 1}, lexical_k=1, lexical_weight=2.0)
+    results = await document_search.search("XK-9931", config)
+
+    assert document_search.lexical_index is not None
+    assert len(document_search.lexical_index) == 3
+    assert results[0].content == "Part XK-9931 is out of stock"  # type: ignore
+
+
+async def test_document_search_ingest_twice_replaces_entries():
+    embeddings_mock = AsyncMock()
+    embeddings_mock.embed_text.return_value = [[0.1, 0.1]]
+    vector_store = AsyncMock()
+    document_search = DocumentSearch(embedder=embeddings_mock, vector_store=vector_store)
+    document = DocumentMeta.create_text_document_from_literal("Name of Peppa's brother is George")
+
+    await document_search.ingest([document], document_processor=DummyProvider())
+    await document_search.ingest([document], document_processor=DummyProvider())
+
+    first_ids = [entry.id for entry in vector_store.store.call_args_list[0].args[0]]
+    second_ids = [entry.id for entry in vector_store.store.call_args_list[1].args[0]]
+    assert first_ids == second_ids
+    assert all(first_ids)
+
+
+async def test_document_search_passes_store_specific_options():
+    vector_store = InMemoryVectorStore(default_options=InMemoryVectorStoreOptions(k=3, n_probe=2))
+    document_search = DocumentSearch.from_config(CONFIG)
+    document_search.vector_store = vector_store
+    await document_search.ingest([DocumentMeta.create_text_document_from_literal("Name of Peppa's brother is George")])
+
+    with patch.object(vector_store, "retrieve_many", wraps=vector_store.retrieve_many) as retrieve_many:
+        await document_search.search("Peppa's brother", config=SearchConfig(vector_store_kwargs={"n_probe": 4}))
+
+    options = retrieve_many.call_args.kwargs["options"]
+    assert isinstance(options, InMemoryVectorStoreOptions)
+    assert options.n_probe == 4
+    assert options.k == 3
+    assert not options.include_vectors
@@ -1,13 +1,23 @@
+import asyncio
 import os
-from unittest.mock import patch
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from PIL import Image
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import ElementMetadata
+from unstructured.documents.elements import Image as UnstructuredImage
 
+from ragbits.core.prompt.base import BasePrompt
 from ragbits.document_search.documents.document import DocumentMeta, DocumentType
+from ragbits.document_search.documents.element import ImageElement
 from ragbits.document_search.ingestion.providers.base import DocumentTypeNotSupportedError
 from ragbits.document_search.ingestion.providers.unstructured.default import UnstructuredDefaultProvider
 from ragbits.document_search.ingestion.providers.unstructured.images import UnstructuredImageProvider
 from ragbits.document_search.ingestion.providers.unstructured.pdf import UnstructuredPdfProvider
+from ragbits.document_search.ingestion.providers.unstructured.utils import ImageDescriber
 
 
 @pytest.mark.parametrize("document_type", UnstructuredDefaultProvider.SUPPORTED_DOCUMENT_TYPES)
@@ -50,3 +60,110 @@ async def test_unstructured_provider_raises_value_error_when_server_url_not_set(
         )
 
     assert str(err.value) == "Either pass api_server argument or set the UNSTRUCTURED_SERVER_URL environment variable"
+
+
+def _image_elements(pages: list[int]) -> list[UnstructuredImage]:
+    return [
+        UnstructuredImage(
+            text=f"image {i}",
+            coordinates=((0, 0), (0, 10), (10, 10), (10, 0)),
+            coordinate_system=PixelSpace(100, 100),
+            metadata=ElementMetadata(page_number=page),
+        )
+        for i, page in enumerate(pages)
+    ]
+
+
+async def test_pdf_provider_renders_each_page_with_images_once():
+    provider = UnstructuredPdfProvider()
+    provider.image_describer = MagicMock(get_image_description=AsyncMock(return_value="description"))
+    images = _image_elements([3, 1, 3, 1])
+    document_meta = DocumentMeta.create_text_document_from_literal("")
+
+    with patch.object(
+        UnstructuredPdfProvider, "_load_document_as_image", return_value=Image.new("RGB", (100, 100))
+    ) as load_mock:
+        elements = await provider._convert([], images, document_meta, Path("document.pdf"))
+
+    assert [element.ocr_extracted_text for element in elements] == ["image 0", "image 1", "image 2", "image 3"]  # type: ignore
+    assert all(isinstance(element, ImageElement) for element in elements)
+    assert [call.args for call in load_mock.call_args_list] == [(Path("document.pdf"), 1), (Path("document.pdf"), 3)]
+
+
+async def test_image_provider_describes_images_concurrently():
+    running, max_running = 0, 0
+
+    async def generate(prompt: BasePrompt) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "description"
+
+    llm = MagicMock(generate=AsyncMock(side_effect=generate), count_tokens=MagicMock(return_value=10))
+    provider = UnstructuredPdfProvider(llm=llm, max_concurrent_descriptions=2)
+    document_meta = DocumentMeta.create_text_document_from_literal("")
+
+    with patch.object(UnstructuredPdfProvider, "_load_document_as_image", return_value=Image.new("RGB", (100, 100))):
+        elements = await provider._convert([], _image_elements([1, 1, 2, 2, 3]), document_meta, Path("document.pdf"))
+
+    assert [element.ocr_extracted_text for element in elements] == [f"image {i}" for i in range(5)]  # type: ignore
+    assert isinstance(provider.image_describer, ImageDescriber)
+    assert llm.generate.call_count == 5
+    assert max_running == 2
+
+
+def test_image_describer_limits_concurrency_in_each_event_loop():
+    async def generate(prompt: BasePrompt) -> str:
+        await asyncio.sleep(0.01)
+        return "description"
+
+    llm = MagicMock(generate=AsyncMock(side_effect=generate))
+    describer = ImageDescriber(llm, max_concurrency=1)
+    prompt = MagicMock(list_images=MagicMock(return_value=["image"]))
+
+    async def describe() -> list[str]:
+        return await asyncio.gather(*(describer.get_image_description(prompt) for _ in range(2)))
+
+    assert asyncio.run(describe()) == ["description"] * 2
+    assert asyncio.run(describe()) == ["description"] * 2
+
+
+async def test_unstructured_provider_partitions_without_blocking_the_event_loop():
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    def partition(*_: object) -> tuple[list, list]:
+        time.sleep(0.2)
+        return [], []
+
+    provider = UnstructuredDefaultProvider()
+    document_meta = DocumentMeta.create_text_document_from_literal("Name of Peppa's brother is George")
+
+    with patch(
+        "ragbits.document_search.ingestion.providers.unstructured.default._partition_and_chunk", side_effect=partition
+    ):
+        ticker = asyncio.create_task(tick())
+        elements = await provider.process(document_meta)
+        ticks_during_partition = ticks
+        await ticker
+
+    assert elements == []
+    assert ticks_during_partition == 5
+
+
+async def test_unstructured_provider_aclose_stops_worker_processes():
+    provider = UnstructuredDefaultProvider(partition_workers=2)
+    executor = MagicMock()
+    provider._executor = executor
+
+    await provider.aclose()
+
+    executor.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+    assert provider._executor is None